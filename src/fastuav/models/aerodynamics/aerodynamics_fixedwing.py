@@ -27,6 +27,39 @@ class AirframeAerodynamicsModel:
         )  # flat-plate skin friction [-]
         return cf_turb
 
+    @staticmethod
+    def friction_flatplate_partials(V_air, L, nu_air, a_air):
+        """
+        Computes the partial derivatives of the flat-plate skin friction coefficient
+        (see friction_flatplate) with respect to V_air, L and nu_air.
+        """
+        re = V_air * L / nu_air  # Reynolds number [-]
+        cf_turb = AirframeAerodynamicsModel.friction_flatplate(V_air, L, nu_air, a_air)
+        dcf_dlnre = -2.58 * cf_turb / np.log(re)  # [-] derivative w.r.t. log of Reynolds number
+        return {"V_air": dcf_dlnre / V_air, "L": dcf_dlnre / L, "nu_air": -dcf_dlnre / nu_air}
+
+    @staticmethod
+    def air_properties_partials(atm):
+        """
+        Computes the partial derivatives of the kinematic viscosity (nu_air) and speed of sound
+        (a_air) of an AtmosphereWithPartials instance, with respect to the altitude and to the
+        temperature deviation dISA.
+        """
+        T = atm.temperature  # [K]
+        nu_air = atm.kinematic_viscosity  # [m2/s]
+        a_air = atm.speed_of_sound  # [m/s]
+        return {
+            "altitude": {
+                "nu_air": atm.partial_kinematic_viscosity_altitude,
+                "a_air": atm.partial_speed_of_sound_altitude,
+            },
+            "dISA": {
+                # Sutherland's law for the dynamic viscosity, pressure does not depend on dISA
+                "nu_air": nu_air * (2.5 / T - 1 / (T + 110.4)),
+                "a_air": a_air / (2 * T),
+            },
+        }
+
 
 @oad.RegisterOpenMDAOSystem("fastuav.aerodynamics.fixedwing")
 class Aerodynamics(om.Group):
@@ -71,8 +104,8 @@ class ParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # Parasitic drag is a plain sum of the contributing drags
+        self.declare_partials("*", "*", val=1.0)
 
     def compute(self, inputs, outputs):
         outputs["data:aerodynamics:CD0"] = (
@@ -106,8 +139,20 @@ class WingParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0:wing", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+
+        # Wetted area is proportional to the reference surface, hence no dependency on the latter
+        self.declare_partials(
+            "data:aerodynamics:CD0:wing",
+            [
+                "mission:sizing:main_route:cruise:altitude",
+                "mission:sizing:main_route:cruise:speed:%s" % propulsion_id,
+                "mission:sizing:dISA",
+                "data:geometry:wing:tc",
+                "data:geometry:wing:MAC:length",
+            ],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         # Geometry
@@ -140,6 +185,50 @@ class WingParasiticDrag(om.ExplicitComponent):
 
         outputs["data:aerodynamics:CD0:wing"] = CD_0_wing
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # Geometry
+        propulsion_id = self.options["propulsion_id"]
+        tc_ratio = inputs["data:geometry:wing:tc"]
+        c_MAC_w = inputs["data:geometry:wing:MAC:length"]
+
+        # Flight parameters
+        V_cruise = inputs["mission:sizing:main_route:cruise:speed:%s" % propulsion_id]
+        altitude_cruise = inputs["mission:sizing:main_route:cruise:altitude"]
+        dISA = inputs["mission:sizing:dISA"]
+        atm = AtmosphereWithPartials(altitude_cruise, dISA, altitude_in_feet=False)
+        atm.true_airspeed = V_cruise
+        a_air = atm.speed_of_sound
+        nu_air = atm.kinematic_viscosity
+        air_partials = AirframeAerodynamicsModel.air_properties_partials(atm)
+
+        # Friction coefficients assuming cruise conditions
+        cf_wing = AirframeAerodynamicsModel.friction_flatplate(V_cruise, c_MAC_w, nu_air, a_air)
+        cf_partials = AirframeAerodynamicsModel.friction_flatplate_partials(
+            V_cruise, c_MAC_w, nu_air, a_air
+        )
+
+        # Form drag factor
+        ff_w = 1 + 0.6 / 0.3 * tc_ratio + 100 * tc_ratio**4
+        dCD_dcf = 2 * ff_w  # wetted area is twice the reference surface
+
+        partials["data:aerodynamics:CD0:wing", "data:geometry:wing:tc"] = (
+            2 * cf_wing * (0.6 / 0.3 + 400 * tc_ratio**3)
+        )
+        partials["data:aerodynamics:CD0:wing", "data:geometry:wing:MAC:length"] = (
+            dCD_dcf * cf_partials["L"]
+        )
+        partials[
+            "data:aerodynamics:CD0:wing",
+            "mission:sizing:main_route:cruise:speed:%s" % propulsion_id,
+        ] = dCD_dcf * cf_partials["V_air"]
+        for input_name, key in (
+            ("mission:sizing:main_route:cruise:altitude", "altitude"),
+            ("mission:sizing:dISA", "dISA"),
+        ):
+            partials["data:aerodynamics:CD0:wing", input_name] = (
+                dCD_dcf * cf_partials["nu_air"] * air_partials[key]["nu_air"]
+            )
+
 
 class TailParasiticDrag(om.ExplicitComponent):
     """
@@ -167,8 +256,7 @@ class TailParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0:tail:%s" % tail, units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         # Geometry
@@ -204,6 +292,61 @@ class TailParasiticDrag(om.ExplicitComponent):
 
         outputs["data:aerodynamics:CD0:tail:%s" % tail] = CD_0_tail
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # Geometry
+        propulsion_id = self.options["propulsion_id"]
+        tail = self.options["tail"]
+        tc_ratio = inputs["data:geometry:wing:tc"]
+        c_MAc_t = inputs["data:geometry:tail:%s:MAC:length" % tail]
+        S_t = inputs["data:geometry:tail:%s:surface" % tail]
+        S_ref = inputs["data:geometry:wing:surface"]
+
+        # Flight parameters
+        V_cruise = inputs["mission:sizing:main_route:cruise:speed:%s" % propulsion_id]
+        altitude_cruise = inputs["mission:sizing:main_route:cruise:altitude"]
+        dISA = inputs["mission:sizing:dISA"]
+        atm = AtmosphereWithPartials(altitude_cruise, dISA, altitude_in_feet=False)
+        atm.true_airspeed = V_cruise
+        a_air = atm.speed_of_sound
+        nu_air = atm.kinematic_viscosity
+        air_partials = AirframeAerodynamicsModel.air_properties_partials(atm)
+
+        # Friction coefficients assuming cruise conditions
+        cf_tail = AirframeAerodynamicsModel.friction_flatplate(V_cruise, c_MAc_t, nu_air, a_air)
+        cf_partials = AirframeAerodynamicsModel.friction_flatplate_partials(
+            V_cruise, c_MAc_t, nu_air, a_air
+        )
+
+        # Form drag factors
+        ff_tc = 1 + 0.6 / 0.3 * tc_ratio + 100 * tc_ratio**4
+        ff_mach = 1.34 * (V_cruise / a_air) ** 0.18
+        ff_tail = ff_tc * ff_mach
+
+        # Parasitic drag coefficient
+        S_wet_ratio = 2 * S_t / S_ref
+        CD_0_tail = cf_tail * ff_tail * S_wet_ratio
+        dCD_dcf = ff_tail * S_wet_ratio
+        dCD_da = -0.18 * CD_0_tail / a_air  # through the compressibility correction
+
+        CD_0_name = "data:aerodynamics:CD0:tail:%s" % tail
+        partials[CD_0_name, "data:geometry:wing:tc"] = (
+            cf_tail * (0.6 / 0.3 + 400 * tc_ratio**3) * ff_mach * S_wet_ratio
+        )
+        partials[CD_0_name, "data:geometry:tail:%s:MAC:length" % tail] = dCD_dcf * cf_partials["L"]
+        partials[CD_0_name, "data:geometry:tail:%s:surface" % tail] = CD_0_tail / S_t
+        partials[CD_0_name, "data:geometry:wing:surface"] = -CD_0_tail / S_ref
+        partials[CD_0_name, "mission:sizing:main_route:cruise:speed:%s" % propulsion_id] = (
+            dCD_dcf * cf_partials["V_air"] + 0.18 * CD_0_tail / V_cruise
+        )
+        for input_name, key in (
+            ("mission:sizing:main_route:cruise:altitude", "altitude"),
+            ("mission:sizing:dISA", "dISA"),
+        ):
+            partials[CD_0_name, input_name] = (
+                dCD_dcf * cf_partials["nu_air"] * air_partials[key]["nu_air"]
+                + dCD_da * air_partials[key]["a_air"]
+            )
+
 
 class FuselageParasiticDrag(om.ExplicitComponent):
     """
@@ -229,8 +372,7 @@ class FuselageParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0:fuselage", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         # Geometry
@@ -265,6 +407,68 @@ class FuselageParasiticDrag(om.ExplicitComponent):
 
         outputs["data:aerodynamics:CD0:fuselage"] = CD_0_fus
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # Geometry
+        propulsion_id = self.options["propulsion_id"]
+        l_fus = inputs["data:geometry:fuselage:length"]
+        d_fus_mid = inputs["data:geometry:fuselage:diameter:mid"]
+        lmbda_f = inputs["data:geometry:fuselage:fineness"]
+        S_ref = inputs["data:geometry:wing:surface"]
+
+        # Flight parameters
+        V_cruise = inputs["mission:sizing:main_route:cruise:speed:%s" % propulsion_id]
+        altitude_cruise = inputs["mission:sizing:main_route:cruise:altitude"]
+        dISA = inputs["mission:sizing:dISA"]
+        atm = AtmosphereWithPartials(altitude_cruise, dISA, altitude_in_feet=False)
+        atm.true_airspeed = V_cruise
+        a_air = atm.speed_of_sound
+        nu_air = atm.kinematic_viscosity
+        air_partials = AirframeAerodynamicsModel.air_properties_partials(atm)
+
+        # Friction coefficients assuming cruise conditions
+        cf_fus = AirframeAerodynamicsModel.friction_flatplate(V_cruise, l_fus, nu_air, a_air)
+        cf_partials = AirframeAerodynamicsModel.friction_flatplate_partials(
+            V_cruise, l_fus, nu_air, a_air
+        )
+
+        # Form drag factors
+        ff_fus = 1 + 60 / lmbda_f**3 + lmbda_f / 400
+        dff_dlmbda = -180 / lmbda_f**4 + 1 / 400
+
+        # Wetted areas
+        S_wet_fus = (
+            np.pi * d_fus_mid * l_fus * (1 - 2 / lmbda_f) ** (2 / 3) * (1 + 1 / (lmbda_f**2))
+        )
+        dSwet_dlmbda = S_wet_fus * (
+            (4 / 3) / (lmbda_f**2 * (1 - 2 / lmbda_f)) - 2 / (lmbda_f**3 * (1 + 1 / lmbda_f**2))
+        )
+
+        # Parasitic drag coefficient
+        CD_0_fus = (cf_fus * S_wet_fus * ff_fus) / S_ref
+        dCD_dcf = S_wet_fus * ff_fus / S_ref
+
+        partials["data:aerodynamics:CD0:fuselage", "data:geometry:fuselage:length"] = (
+            dCD_dcf * cf_partials["L"] + CD_0_fus / l_fus
+        )
+        partials["data:aerodynamics:CD0:fuselage", "data:geometry:fuselage:diameter:mid"] = (
+            CD_0_fus / d_fus_mid
+        )
+        partials["data:aerodynamics:CD0:fuselage", "data:geometry:fuselage:fineness"] = (
+            cf_fus * (dSwet_dlmbda * ff_fus + S_wet_fus * dff_dlmbda) / S_ref
+        )
+        partials["data:aerodynamics:CD0:fuselage", "data:geometry:wing:surface"] = -CD_0_fus / S_ref
+        partials[
+            "data:aerodynamics:CD0:fuselage",
+            "mission:sizing:main_route:cruise:speed:%s" % propulsion_id,
+        ] = dCD_dcf * cf_partials["V_air"]
+        for input_name, key in (
+            ("mission:sizing:main_route:cruise:altitude", "altitude"),
+            ("mission:sizing:dISA", "dISA"),
+        ):
+            partials["data:aerodynamics:CD0:fuselage", input_name] = (
+                dCD_dcf * cf_partials["nu_air"] * air_partials[key]["nu_air"]
+            )
+
 
 class ParasiticDragConstraint(om.ExplicitComponent):
     """
@@ -312,8 +516,7 @@ class MaxLiftToDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:LD:max", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         CD_0 = inputs["data:aerodynamics:CD0"]
@@ -324,6 +527,15 @@ class MaxLiftToDrag(om.ExplicitComponent):
 
         outputs["data:aerodynamics:LD:max"] = LDmax
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        CD_0 = inputs["data:aerodynamics:CD0"]
+        K = inputs["data:aerodynamics:CDi:K"]
+
+        LDmax = 0.5 / np.sqrt(CD_0 * K)
+
+        partials["data:aerodynamics:LD:max", "data:aerodynamics:CD0"] = -LDmax / (2 * CD_0)
+        partials["data:aerodynamics:LD:max", "data:aerodynamics:CDi:K"] = -LDmax / (2 * K)
+
 
 class SpanEfficiency(om.ExplicitComponent):
     """
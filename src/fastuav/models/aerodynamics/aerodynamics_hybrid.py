@@ -86,8 +86,8 @@ class ParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # Parasitic drag is a plain sum of the contributing drags
+        self.declare_partials("*", "*", val=1.0)
 
     def compute(self, inputs, outputs):
         outputs["data:aerodynamics:CD0"] = (
@@ -123,8 +123,7 @@ class StoppedPropellersParasiticDrag(om.ExplicitComponent):
         self.add_output("data:aerodynamics:CD0:stopped_propellers", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -142,3 +141,29 @@ class StoppedPropellersParasiticDrag(om.ExplicitComponent):
         )
 
         outputs["data:aerodynamics:CD0:stopped_propellers"] = CD_0_pro
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id = self.options["propulsion_id"]
+        N_pro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+        D_pro = inputs["data:propulsion:%s:propeller:diameter" % propulsion_id]
+        S_ref = inputs["data:geometry:wing:surface"]
+        alpha = 0.0
+
+        # Total area of propellers
+        S_pro = N_pro * np.pi * (D_pro / 2) ** 2
+
+        # Parasitic drag coefficient
+        CD_prop = StoppedPropellersAerodynamicsModel.stopped_propeller_drag_coefficient(alpha)
+        CD_0_pro = CD_prop * (S_pro / S_ref)
+
+        partials[
+            "data:aerodynamics:CD0:stopped_propellers",
+            "data:propulsion:%s:propeller:number" % propulsion_id,
+        ] = CD_0_pro / N_pro
+        partials[
+            "data:aerodynamics:CD0:stopped_propellers",
+            "data:propulsion:%s:propeller:diameter" % propulsion_id,
+        ] = 2 * CD_0_pro / D_pro
+        partials["data:aerodynamics:CD0:stopped_propellers", "data:geometry:wing:surface"] = (
+            -CD_0_pro / S_ref
+        )
@@ -0,0 +1,40 @@
+"""
+Tests of the partial derivatives of the fixed-wing and hybrid aerodynamics.
+"""
+
+import pytest
+
+from fastuav.tests.partials import check_partials
+
+INPUTS = {
+    "mission:sizing:main_route:cruise:altitude": 150.0,
+    "mission:sizing:main_route:cruise:speed:fixedwing": 16.0,
+    "mission:sizing:dISA": 15.0,
+    "data:geometry:wing:tc": 0.15,
+    "data:geometry:wing:MAC:length": 0.3,
+    "data:geometry:wing:surface": 0.8,
+    "data:geometry:tail:horizontal:MAC:length": 0.15,
+    "data:geometry:tail:horizontal:surface": 0.12,
+    "data:geometry:tail:vertical:MAC:length": 0.18,
+    "data:geometry:tail:vertical:surface": 0.06,
+    "data:geometry:fuselage:length": 1.2,
+    "data:geometry:fuselage:diameter:mid": 0.15,
+    "data:geometry:fuselage:fineness": 8.0,
+    "data:propulsion:multirotor:propeller:number": 4.0,
+    "data:propulsion:multirotor:propeller:diameter": 0.4,
+    "optimization:variables:aerodynamics:CD0:guess": 0.04,
+    "data:aerodynamics:CDi:K": 0.05,
+}
+
+
+@pytest.mark.parametrize(
+    "system_id, altitude",
+    [
+        ("fastuav.aerodynamics.fixedwing", 150.0),
+        ("fastuav.aerodynamics.fixedwing", 12000.0),  # stratosphere
+        ("fastuav.aerodynamics.hybrid", 150.0),
+    ],
+)
+def test_aerodynamics_partials(system_id, altitude):
+    inputs = dict(INPUTS, **{"mission:sizing:main_route:cruise:altitude": altitude})
+    check_partials(system_id, inputs, atol=1e-8, step=1e-6)
@@ -27,6 +27,86 @@ class Geometry(om.Group):
         constraints.add_subsystem("fuselage_volume", FuselageVolumeConstraint(), promotes=["*"])
 
 
+def _planform_partials(S, AR, lmbda):
+    """
+    Computes the partial derivatives of the span, root and tip chords, mean aerodynamic chord and
+    spanwise location of the MAC of a trapezoidal planform (see WingGeometry.compute),
+    with respect to its surface S, aspect ratio AR and taper ratio lmbda.
+    """
+    b = np.sqrt(AR * S)  # span [m]
+    c_root = 2 * S / b / (1 + lmbda)  # chord at root [m]
+    c_tip = lmbda * c_root  # chord at tip [m]
+    c_MAC = (2 / 3) * c_root * (1 + lmbda + lmbda**2) / (1 + lmbda)  # MAC = MGC [m]
+    y_MAC = (b / 6) * (1 + 2 * lmbda) / (1 + lmbda)  # spanwise location of MAC [m]
+    return {
+        "span": {"S": b / (2 * S), "AR": b / (2 * AR), "lambda": 0.0},
+        "root:chord": {
+            "S": c_root / (2 * S),
+            "AR": -c_root / (2 * AR),
+            "lambda": -c_root / (1 + lmbda),
+        },
+        "tip:chord": {
+            "S": c_tip / (2 * S),
+            "AR": -c_tip / (2 * AR),
+            "lambda": c_root / (1 + lmbda),
+        },
+        "MAC:length": {
+            "S": c_MAC / (2 * S),
+            "AR": -c_MAC / (2 * AR),
+            "lambda": c_MAC
+            * (lmbda * (2 + lmbda) / ((1 + lmbda) * (1 + lmbda + lmbda**2)) - 1 / (1 + lmbda)),
+        },
+        "MAC:y": {
+            "S": y_MAC / (2 * S),
+            "AR": y_MAC / (2 * AR),
+            "lambda": (b / 6) / (1 + lmbda) ** 2,
+        },
+    }
+
+
+def _tail_partials(tail, S_t, AR_t, lmbda_t, tc_ratio, input_partials):
+    """
+    Computes the partial derivatives of the outputs of HorizontalTailGeometry or
+    VerticalTailGeometry.
+
+    :param tail: "horizontal" or "vertical"
+    :param S_t: tail surface [m2]
+    :param AR_t: tail aspect ratio [-]
+    :param lmbda_t: tail taper ratio [-]
+    :param tc_ratio: thickness ratio [-]
+    :param input_partials: partials of the tail surface ("S"), aspect ratio ("AR"), taper ratio
+                           ("lambda"), arm ("arm") and wing MAC quarter chord location ("x"),
+                           by input name (missing keys are zero)
+    :return: dict of the partials, by (output name, input name)
+    """
+    prefix = "data:geometry:tail:%s:" % tail
+    MAC_location = "MAC:y" if tail == "horizontal" else "MAC:z"
+    planform_partials = _planform_partials(S_t, AR_t, lmbda_t)
+    planform_partials[MAC_location] = planform_partials.pop("MAC:y")
+    c_root = 2 * S_t / np.sqrt(AR_t * S_t) / (1 + lmbda_t)  # chord at root [m]
+
+    J = {
+        (prefix + "root:thickness", "data:geometry:wing:tc"): c_root,
+        (prefix + "tip:thickness", "data:geometry:wing:tc"): lmbda_t * c_root,
+    }
+    for input_name, input_partial in input_partials.items():
+        d = {
+            key: sum(p[var] * input_partial.get(var, 0.0) for var in ("S", "AR", "lambda"))
+            for key, p in planform_partials.items()
+        }
+        d["surface"] = input_partial.get("S", 0.0)
+        d["arm"] = input_partial.get("arm", 0.0)
+        d["root:thickness"] = d["root:chord"] * tc_ratio
+        d["tip:thickness"] = d["tip:chord"] * tc_ratio
+        d["MAC:C4:x"] = input_partial.get("x", 0.0) + d["arm"]
+        d["MAC:LE:x"] = d["MAC:C4:x"] - 0.25 * d["MAC:length"]
+        d["root:LE:x"] = d["MAC:LE:x"]
+        d["root:TE:x"] = d["root:LE:x"] + d["root:chord"]
+        for key, value in d.items():
+            J[prefix + key, input_name] = value
+    return J
+
+
 class WingGeometry(om.ExplicitComponent):
     """
     Computes Wing geometry
@@ -55,8 +135,35 @@ class WingGeometry(om.ExplicitComponent):
         self.add_output("data:geometry:wing:sweep:TE", units="rad")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            self.declare_partials(output_name, input_names, method="exact")
+
+    # inputs on which each output depends
+    _PLANFORM_INPUTS = [
+        "optimization:variables:weight:mtow:guess",
+        "data:geometry:wing:loading",
+        "optimization:variables:geometry:wing:AR",
+        "optimization:variables:geometry:wing:lambda",
+    ]
+    _PARTIALS_DEPENDENCIES = {
+        "data:geometry:wing:surface": _PLANFORM_INPUTS[:2],
+        "data:geometry:wing:span": _PLANFORM_INPUTS[:3],
+        "data:geometry:wing:root:chord": _PLANFORM_INPUTS,
+        "data:geometry:wing:tip:chord": _PLANFORM_INPUTS,
+        "data:geometry:wing:MAC:length": _PLANFORM_INPUTS,
+        "data:geometry:wing:root:thickness": _PLANFORM_INPUTS + ["data:geometry:wing:tc"],
+        "data:geometry:wing:tip:thickness": _PLANFORM_INPUTS + ["data:geometry:wing:tc"],
+        "data:geometry:wing:MAC:y": _PLANFORM_INPUTS,
+        "data:geometry:wing:MAC:LE:x": _PLANFORM_INPUTS[:3]
+        + ["optimization:variables:geometry:wing:MAC:LE:x:k"],
+        "data:geometry:wing:MAC:C4:x": _PLANFORM_INPUTS
+        + ["optimization:variables:geometry:wing:MAC:LE:x:k"],
+        "data:geometry:wing:root:LE:x": _PLANFORM_INPUTS
+        + ["optimization:variables:geometry:wing:MAC:LE:x:k", "data:geometry:wing:sweep:LE"],
+        "data:geometry:wing:root:TE:x": _PLANFORM_INPUTS
+        + ["optimization:variables:geometry:wing:MAC:LE:x:k", "data:geometry:wing:sweep:LE"],
+        "data:geometry:wing:sweep:TE": _PLANFORM_INPUTS[2:] + ["data:geometry:wing:sweep:LE"],
+    }
 
     def compute(self, inputs, outputs):
         WS = inputs["data:geometry:wing:loading"]
@@ -105,6 +212,72 @@ class WingGeometry(om.ExplicitComponent):
         outputs["data:geometry:wing:root:TE:x"] = x_root_TE
         outputs["data:geometry:wing:sweep:TE"] = sweep_TE
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        WS = inputs["data:geometry:wing:loading"]
+        m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
+        tc_ratio = inputs["data:geometry:wing:tc"]
+        sweep_LE = inputs["data:geometry:wing:sweep:LE"]
+        AR_w = inputs["optimization:variables:geometry:wing:AR"]
+        lmbda_w = inputs["optimization:variables:geometry:wing:lambda"]
+        k_xw = inputs["optimization:variables:geometry:wing:MAC:LE:x:k"]
+
+        S_w = m_uav_guess * g / WS  # wing surface [m2]
+        b_w = np.sqrt(AR_w * S_w)  # wing span [m]
+        c_root = 2 * S_w / b_w / (1 + lmbda_w)  # chord at root [m]
+        y_MAC = (b_w / 6) * (1 + 2 * lmbda_w) / (1 + lmbda_w)  # y-location of MAC [m]
+        tan_sweep_TE = np.tan(sweep_LE) - 4 / AR_w * (1 - lmbda_w) / (1 + lmbda_w)
+
+        # Wing sizing and location, from the planform parameters
+        planform_partials = _planform_partials(S_w, AR_w, lmbda_w)
+        J = {}
+        for input_name, dS, dAR, dlmbda in zip(
+            self._PLANFORM_INPUTS,
+            [g / WS, -S_w / WS, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ):
+            d = {
+                key: p["S"] * dS + p["AR"] * dAR + p["lambda"] * dlmbda
+                for key, p in planform_partials.items()
+            }
+            d["surface"] = dS
+            d["root:thickness"] = d["root:chord"] * tc_ratio
+            d["tip:thickness"] = d["tip:chord"] * tc_ratio
+            d["MAC:LE:x"] = k_xw * d["span"]
+            d["MAC:C4:x"] = d["MAC:LE:x"] + 0.25 * d["MAC:length"]
+            d["root:LE:x"] = d["MAC:LE:x"] - d["MAC:y"] * np.tan(sweep_LE)
+            d["root:TE:x"] = d["root:LE:x"] + d["root:chord"]
+            for key, value in d.items():
+                J["data:geometry:wing:%s" % key, input_name] = value
+
+        # Thickness ratio and wing location
+        J["data:geometry:wing:root:thickness", "data:geometry:wing:tc"] = c_root
+        J["data:geometry:wing:tip:thickness", "data:geometry:wing:tc"] = lmbda_w * c_root
+        for key in ["MAC:LE:x", "MAC:C4:x", "root:LE:x", "root:TE:x"]:
+            J["data:geometry:wing:%s" % key, "optimization:variables:geometry:wing:MAC:LE:x:k"] = (
+                b_w
+            )
+            if key.startswith("root"):
+                J["data:geometry:wing:%s" % key, "data:geometry:wing:sweep:LE"] = (
+                    -y_MAC / np.cos(sweep_LE) ** 2
+                )
+
+        # Trailing edge sweep
+        dsweep_TE = 1 / (1 + tan_sweep_TE**2)
+        J["data:geometry:wing:sweep:TE", "data:geometry:wing:sweep:LE"] = (
+            dsweep_TE / np.cos(sweep_LE) ** 2
+        )
+        J["data:geometry:wing:sweep:TE", "optimization:variables:geometry:wing:AR"] = (
+            dsweep_TE * 4 / AR_w**2 * (1 - lmbda_w) / (1 + lmbda_w)
+        )
+        J["data:geometry:wing:sweep:TE", "optimization:variables:geometry:wing:lambda"] = (
+            dsweep_TE * 8 / AR_w / (1 + lmbda_w) ** 2
+        )
+
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            for input_name in input_names:
+                partials[output_name, input_name] = J[output_name, input_name]
+
 
 class HorizontalTailGeometry(om.ExplicitComponent):
     """
@@ -143,8 +316,42 @@ class HorizontalTailGeometry(om.ExplicitComponent):
         # self.add_output("optimization:variables:geometry:tail:horizontal:AR", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            self.declare_partials(output_name, input_names, method="exact")
+
+    # inputs on which each output depends
+    _ARM_INPUTS = [
+        "optimization:variables:geometry:tail:horizontal:arm:k",
+        "data:geometry:wing:span",
+    ]
+    _SURFACE_INPUTS = _ARM_INPUTS + [
+        "data:geometry:tail:horizontal:coefficient",
+        "data:geometry:wing:surface",
+        "data:geometry:wing:MAC:length",
+    ]
+    _PLANFORM_INPUTS = _SURFACE_INPUTS + [
+        "optimization:variables:geometry:tail:horizontal:AR",
+        "data:geometry:tail:horizontal:lambda",
+    ]
+    _PARTIALS_DEPENDENCIES = {
+        "data:geometry:tail:horizontal:arm": _ARM_INPUTS,
+        "data:geometry:tail:horizontal:surface": _SURFACE_INPUTS,
+        "data:geometry:tail:horizontal:span": _PLANFORM_INPUTS[:-1],
+        "data:geometry:tail:horizontal:root:chord": _PLANFORM_INPUTS,
+        "data:geometry:tail:horizontal:tip:chord": _PLANFORM_INPUTS,
+        "data:geometry:tail:horizontal:MAC:length": _PLANFORM_INPUTS,
+        "data:geometry:tail:horizontal:root:thickness": _PLANFORM_INPUTS
+        + ["data:geometry:wing:tc"],
+        "data:geometry:tail:horizontal:tip:thickness": _PLANFORM_INPUTS + ["data:geometry:wing:tc"],
+        "data:geometry:tail:horizontal:MAC:y": _PLANFORM_INPUTS,
+        "data:geometry:tail:horizontal:MAC:LE:x": _PLANFORM_INPUTS
+        + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:horizontal:MAC:C4:x": _ARM_INPUTS + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:horizontal:root:LE:x": _PLANFORM_INPUTS
+        + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:horizontal:root:TE:x": _PLANFORM_INPUTS
+        + ["data:geometry:wing:MAC:C4:x"],
+    }
 
     def compute(self, inputs, outputs):
         AR_ht = inputs["optimization:variables:geometry:tail:horizontal:AR"]
@@ -207,6 +414,43 @@ class HorizontalTailGeometry(om.ExplicitComponent):
         outputs["data:geometry:tail:horizontal:root:TE:x"] = x_root_TE_ht
         # outputs["optimization:variables:geometry:tail:horizontal:AR"] = AR_ht
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        AR_ht = inputs["optimization:variables:geometry:tail:horizontal:AR"]
+        S_w = inputs["data:geometry:wing:surface"]
+        b_w = inputs["data:geometry:wing:span"]
+        c_MAC_w = inputs["data:geometry:wing:MAC:length"]
+        V_ht = inputs["data:geometry:tail:horizontal:coefficient"]
+        lmbda_ht = inputs["data:geometry:tail:horizontal:lambda"]
+        tc_ratio = inputs["data:geometry:wing:tc"]
+        k_ht = inputs["optimization:variables:geometry:tail:horizontal:arm:k"]
+
+        l_ht = k_ht * b_w  # horizontal tail arm [m]
+        S_ht = V_ht * S_w * c_MAC_w / l_ht  # horizontal tail surface [m2]
+
+        J = _tail_partials(
+            "horizontal",
+            S_ht,
+            AR_ht,
+            lmbda_ht,
+            tc_ratio,
+            {
+                "optimization:variables:geometry:tail:horizontal:arm:k": {
+                    "S": -S_ht / k_ht,
+                    "arm": b_w,
+                },
+                "data:geometry:wing:span": {"S": -S_ht / b_w, "arm": k_ht},
+                "data:geometry:tail:horizontal:coefficient": {"S": S_ht / V_ht},
+                "data:geometry:wing:surface": {"S": S_ht / S_w},
+                "data:geometry:wing:MAC:length": {"S": S_ht / c_MAC_w},
+                "optimization:variables:geometry:tail:horizontal:AR": {"AR": 1.0},
+                "data:geometry:tail:horizontal:lambda": {"lambda": 1.0},
+                "data:geometry:wing:MAC:C4:x": {"x": 1.0},
+            },
+        )
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            for input_name in input_names:
+                partials[output_name, input_name] = J[output_name, input_name]
+
 
 class VerticalTailGeometry(om.ExplicitComponent):
     """
@@ -240,8 +484,36 @@ class VerticalTailGeometry(om.ExplicitComponent):
         # self.add_output("optimization:variables:geometry:tail:vertical:AR", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            self.declare_partials(output_name, input_names, method="exact")
+
+    # inputs on which each output depends
+    _SURFACE_INPUTS = [
+        "data:geometry:tail:horizontal:arm",
+        "data:geometry:tail:vertical:coefficient",
+        "data:geometry:wing:surface",
+        "data:geometry:wing:span",
+    ]
+    _PLANFORM_INPUTS = _SURFACE_INPUTS + [
+        "optimization:variables:geometry:tail:vertical:AR",
+        "data:geometry:tail:vertical:lambda",
+    ]
+    _PARTIALS_DEPENDENCIES = {
+        "data:geometry:tail:vertical:arm": _SURFACE_INPUTS[:1],
+        "data:geometry:tail:vertical:surface": _SURFACE_INPUTS,
+        "data:geometry:tail:vertical:span": _PLANFORM_INPUTS[:-1],
+        "data:geometry:tail:vertical:root:chord": _PLANFORM_INPUTS,
+        "data:geometry:tail:vertical:tip:chord": _PLANFORM_INPUTS,
+        "data:geometry:tail:vertical:MAC:length": _PLANFORM_INPUTS,
+        "data:geometry:tail:vertical:root:thickness": _PLANFORM_INPUTS + ["data:geometry:wing:tc"],
+        "data:geometry:tail:vertical:tip:thickness": _PLANFORM_INPUTS + ["data:geometry:wing:tc"],
+        "data:geometry:tail:vertical:MAC:z": _PLANFORM_INPUTS,
+        "data:geometry:tail:vertical:MAC:LE:x": _PLANFORM_INPUTS + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:vertical:MAC:C4:x": _SURFACE_INPUTS[:1]
+        + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:vertical:root:LE:x": _PLANFORM_INPUTS + ["data:geometry:wing:MAC:C4:x"],
+        "data:geometry:tail:vertical:root:TE:x": _PLANFORM_INPUTS + ["data:geometry:wing:MAC:C4:x"],
+    }
 
     def compute(self, inputs, outputs):
         AR_vt = inputs["optimization:variables:geometry:tail:vertical:AR"]
@@ -299,6 +571,37 @@ class VerticalTailGeometry(om.ExplicitComponent):
         outputs["data:geometry:tail:vertical:root:TE:x"] = x_root_TE_vt
         # outputs["optimization:variables:geometry:tail:vertical:AR"] = AR_vt
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        AR_vt = inputs["optimization:variables:geometry:tail:vertical:AR"]
+        S_w = inputs["data:geometry:wing:surface"]
+        b_w = inputs["data:geometry:wing:span"]
+        V_vt = inputs["data:geometry:tail:vertical:coefficient"]
+        lmbda_vt = inputs["data:geometry:tail:vertical:lambda"]
+        tc_ratio = inputs["data:geometry:wing:tc"]
+        l_vt = inputs["data:geometry:tail:horizontal:arm"]
+
+        S_vt = V_vt * S_w * b_w / l_vt  # vertical tail surface [m2]
+
+        J = _tail_partials(
+            "vertical",
+            S_vt,
+            AR_vt,
+            lmbda_vt,
+            tc_ratio,
+            {
+                "data:geometry:tail:horizontal:arm": {"S": -S_vt / l_vt, "arm": 1.0},
+                "data:geometry:tail:vertical:coefficient": {"S": S_vt / V_vt},
+                "data:geometry:wing:surface": {"S": S_vt / S_w},
+                "data:geometry:wing:span": {"S": S_vt / b_w},
+                "optimization:variables:geometry:tail:vertical:AR": {"AR": 1.0},
+                "data:geometry:tail:vertical:lambda": {"lambda": 1.0},
+                "data:geometry:wing:MAC:C4:x": {"x": 1.0},
+            },
+        )
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            for input_name in input_names:
+                partials[output_name, input_name] = J[output_name, input_name]
+
 
 class FuselageGeometry(om.ExplicitComponent):
     """
@@ -325,8 +628,35 @@ class FuselageGeometry(om.ExplicitComponent):
         self.add_output("data:geometry:fuselage:volume:rear", units="m**3", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            self.declare_partials(output_name, input_names, method="exact")
+
+    # inputs on which each output depends
+    _DIAMETER_INPUTS = [
+        "data:geometry:tail:horizontal:root:TE:x",
+        "data:geometry:fuselage:fineness",
+    ]
+    _MID_INPUTS = _DIAMETER_INPUTS + ["data:geometry:wing:root:TE:x"]
+    _ALL_INPUTS = _MID_INPUTS + ["data:geometry:fuselage:diameter:k"]
+    _PARTIALS_DEPENDENCIES = {
+        "data:geometry:fuselage:length": _DIAMETER_INPUTS[:1],
+        "data:geometry:fuselage:length:nose": _DIAMETER_INPUTS,
+        "data:geometry:fuselage:length:mid": _MID_INPUTS,
+        "data:geometry:fuselage:length:rear": [
+            "data:geometry:tail:horizontal:root:TE:x",
+            "data:geometry:wing:root:TE:x",
+        ],
+        "data:geometry:fuselage:diameter:mid": _DIAMETER_INPUTS,
+        "data:geometry:fuselage:diameter:tip": _DIAMETER_INPUTS
+        + ["data:geometry:fuselage:diameter:k"],
+        "data:geometry:fuselage:surface": _ALL_INPUTS,
+        "data:geometry:fuselage:surface:nose": _DIAMETER_INPUTS,
+        "data:geometry:fuselage:surface:mid": _MID_INPUTS,
+        "data:geometry:fuselage:surface:rear": _ALL_INPUTS,
+        "data:geometry:fuselage:volume:nose": _DIAMETER_INPUTS,
+        "data:geometry:fuselage:volume:mid": _MID_INPUTS,
+        "data:geometry:fuselage:volume:rear": _ALL_INPUTS,
+    }
 
     def compute(self, inputs, outputs):
         lmbda_f = inputs["data:geometry:fuselage:fineness"]  # fuselage fineness ratio [-]
@@ -376,6 +706,64 @@ class FuselageGeometry(om.ExplicitComponent):
         outputs["data:geometry:fuselage:volume:mid"] = V_mid
         outputs["data:geometry:fuselage:volume:rear"] = V_rear
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        lmbda_f = inputs["data:geometry:fuselage:fineness"]
+        k_df = inputs["data:geometry:fuselage:diameter:k"]
+        x_root_TE_w = inputs["data:geometry:wing:root:TE:x"]
+        x_root_TE_ht = inputs["data:geometry:tail:horizontal:root:TE:x"]
+
+        d_fus_mid = x_root_TE_ht / lmbda_f  # max. fuselage diameter (mid) [m]
+        d_fus_tip = k_df * d_fus_mid  # min. fuselage diameter (tail tip) [m]
+        l_rear = x_root_TE_ht - x_root_TE_w  # [m] rear fuselage length
+        l_mid = x_root_TE_ht - l_rear - d_fus_mid / 2  # [m] mid fuselage length
+
+        J = {}
+        for input_name, dl_fus, dd_mid, dl_rear, dk in zip(
+            self._ALL_INPUTS,
+            [1.0, 0.0, 0.0, 0.0],
+            [1 / lmbda_f, -d_fus_mid / lmbda_f, 0.0, 0.0],
+            [1.0, 0.0, -1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ):
+            dd_tip = k_df * dd_mid + d_fus_mid * dk
+            dl_nose = dd_mid / 2
+            dl_mid = dl_fus - dl_rear - dl_nose
+            d = {
+                "length": dl_fus,
+                "length:nose": dl_nose,
+                "length:mid": dl_mid,
+                "length:rear": dl_rear,
+                "diameter:mid": dd_mid,
+                "diameter:tip": dd_tip,
+                "surface:nose": np.pi * d_fus_mid * dd_mid,
+                "surface:mid": np.pi * (dd_mid * l_mid + d_fus_mid * dl_mid),
+                "surface:rear": np.pi
+                / 2
+                * ((dd_mid + dd_tip) * l_rear + (d_fus_mid + d_fus_tip) * dl_rear)
+                + np.pi / 2 * d_fus_tip * dd_tip,
+                "volume:nose": np.pi / 4 * d_fus_mid**2 * dd_mid,
+                "volume:mid": np.pi / 4 * (2 * d_fus_mid * dd_mid * l_mid + d_fus_mid**2 * dl_mid),
+                "volume:rear": np.pi
+                / 12
+                * (
+                    dl_rear * (d_fus_mid**2 + d_fus_tip**2 + d_fus_mid * d_fus_tip)
+                    + l_rear
+                    * (
+                        2 * d_fus_mid * dd_mid
+                        + 2 * d_fus_tip * dd_tip
+                        + dd_mid * d_fus_tip
+                        + d_fus_mid * dd_tip
+                    )
+                ),
+            }
+            d["surface"] = d["surface:nose"] + d["surface:mid"] + d["surface:rear"]
+            for key, value in d.items():
+                J["data:geometry:fuselage:%s" % key, input_name] = value
+
+        for output_name, input_names in self._PARTIALS_DEPENDENCIES.items():
+            for input_name in input_names:
+                partials[output_name, input_name] = J[output_name, input_name]
+
 
 class ProjectedAreasGuess(om.ExplicitComponent):
     """
@@ -393,7 +781,7 @@ class ProjectedAreasGuess(om.ExplicitComponent):
         self.add_output("data:geometry:projected_area:top", units="m**2")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         WS = inputs["data:geometry:wing:loading"]
@@ -404,6 +792,22 @@ class ProjectedAreasGuess(om.ExplicitComponent):
 
         outputs["data:geometry:projected_area:top"] = S_top
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        WS = inputs["data:geometry:wing:loading"]
+        mtow_guess = inputs["optimization:variables:weight:mtow:guess"]
+        k_top = inputs["optimization:variables:geometry:projected_area:top:k"]
+
+        partials["data:geometry:projected_area:top", "data:geometry:wing:loading"] = (
+            -k_top * mtow_guess * g / WS**2
+        )
+        partials["data:geometry:projected_area:top", "optimization:variables:weight:mtow:guess"] = (
+            k_top * g / WS
+        )
+        partials[
+            "data:geometry:projected_area:top",
+            "optimization:variables:geometry:projected_area:top:k",
+        ] = mtow_guess * g / WS
+
 
 class ProjectedAreasConstraint(om.ExplicitComponent):
     """
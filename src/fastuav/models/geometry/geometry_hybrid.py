@@ -85,7 +85,32 @@ class PropellersVTOL(om.ExplicitComponent):
         self.add_output("data:geometry:%s:propeller:x:rear" % propulsion_mr, units="m")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        propulsion_fw = self.options["propulsion_fw"]
+        propulsion_mr = self.options["propulsion_mr"]
+        y_inputs = [
+            "optimization:variables:geometry:%s:propeller:y:k" % propulsion_mr,
+            "data:propulsion:%s:propeller:diameter" % propulsion_fw,
+            "data:propulsion:%s:propeller:diameter" % propulsion_mr,
+            "data:geometry:%s:propeller:clearance" % propulsion_mr,
+        ]
+        self.declare_partials(
+            "data:geometry:%s:propeller:y" % propulsion_mr, y_inputs, method="exact"
+        )
+        self.declare_partials(
+            "data:geometry:%s:propeller:x:front" % propulsion_mr,
+            y_inputs + ["data:geometry:wing:root:LE:x", "data:geometry:wing:sweep:LE"],
+            method="exact",
+        )
+        self.declare_partials(
+            "data:geometry:%s:propeller:x:rear" % propulsion_mr,
+            y_inputs
+            + [
+                "data:geometry:wing:root:TE:x",
+                "data:geometry:wing:sweep:LE",
+                "data:geometry:wing:sweep:TE",
+            ],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         propulsion_fw = self.options["propulsion_fw"]
@@ -116,6 +141,47 @@ class PropellersVTOL(om.ExplicitComponent):
         outputs["data:geometry:%s:propeller:x:front" % propulsion_mr] = x_front
         outputs["data:geometry:%s:propeller:x:rear" % propulsion_mr] = x_rear
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_fw = self.options["propulsion_fw"]
+        propulsion_mr = self.options["propulsion_mr"]
+
+        k_y = inputs["optimization:variables:geometry:%s:propeller:y:k" % propulsion_mr]
+        D_pro_FW = inputs["data:propulsion:%s:propeller:diameter" % propulsion_fw]
+        D_pro_MR = inputs["data:propulsion:%s:propeller:diameter" % propulsion_mr]
+        c_pro_MR = inputs["data:geometry:%s:propeller:clearance" % propulsion_mr]
+        sweep_LE = inputs["data:geometry:wing:sweep:LE"]
+        sweep_TE = inputs["data:geometry:wing:sweep:TE"]
+
+        y = k_y * (D_pro_FW / 2 + c_pro_MR + D_pro_MR / 2)  # [m] y-location
+        offset = D_pro_MR / 2 + c_pro_MR  # [m] x-offset of the propellers from the wing edges
+
+        y_name = "data:geometry:%s:propeller:y" % propulsion_mr
+        x_front_name = "data:geometry:%s:propeller:x:front" % propulsion_mr
+        x_rear_name = "data:geometry:%s:propeller:x:rear" % propulsion_mr
+        for input_name, dy, doffset in (
+            (
+                "optimization:variables:geometry:%s:propeller:y:k" % propulsion_mr,
+                D_pro_FW / 2 + c_pro_MR + D_pro_MR / 2,
+                0.0,
+            ),
+            ("data:propulsion:%s:propeller:diameter" % propulsion_fw, k_y / 2, 0.0),
+            ("data:propulsion:%s:propeller:diameter" % propulsion_mr, k_y / 2, 0.5),
+            ("data:geometry:%s:propeller:clearance" % propulsion_mr, k_y, 1.0),
+        ):
+            partials[y_name, input_name] = dy
+            partials[x_front_name, input_name] = dy * np.tan(sweep_LE) - doffset / np.cos(sweep_LE)
+            partials[x_rear_name, input_name] = dy * np.tan(sweep_TE) + doffset / np.cos(sweep_LE)
+
+        partials[x_front_name, "data:geometry:wing:root:LE:x"] = 1.0
+        partials[x_front_name, "data:geometry:wing:sweep:LE"] = (
+            y - offset * np.sin(sweep_LE)
+        ) / np.cos(sweep_LE) ** 2
+        partials[x_rear_name, "data:geometry:wing:root:TE:x"] = 1.0
+        partials[x_rear_name, "data:geometry:wing:sweep:LE"] = (
+            offset * np.sin(sweep_LE) / np.cos(sweep_LE) ** 2
+        )
+        partials[x_rear_name, "data:geometry:wing:sweep:TE"] = y / np.cos(sweep_TE) ** 2
+
 
 class PropellersVTOLConstraint(om.ExplicitComponent):
     """
@@ -184,7 +250,24 @@ class ArmsVTOL(om.ExplicitComponent):
         self.add_output("data:geometry:arms:length", units="m", lower=0.0)
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+
+        # Number of propellers per arm and arms length are linear functions of the inputs
+        self.declare_partials(
+            "data:geometry:arms:prop_per_arm",
+            "data:propulsion:%s:propeller:is_coaxial" % propulsion_id,
+            val=1.0,
+        )
+        self.declare_partials(
+            "data:geometry:arms:length",
+            "data:geometry:%s:propeller:x:front" % propulsion_id,
+            val=-0.5,
+        )
+        self.declare_partials(
+            "data:geometry:arms:length",
+            "data:geometry:%s:propeller:x:rear" % propulsion_id,
+            val=0.5,
+        )
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -56,8 +56,21 @@ class ArmsGeometry(om.ExplicitComponent):
         self.add_output("data:geometry:arms:length", units="m", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+        self.declare_partials(
+            "data:geometry:arms:prop_per_arm",
+            "data:propulsion:%s:propeller:is_coaxial" % propulsion_id,
+            val=1.0,
+        )
+        self.declare_partials(
+            "data:geometry:arms:number",
+            [
+                "data:propulsion:%s:propeller:number" % propulsion_id,
+                "data:propulsion:%s:propeller:is_coaxial" % propulsion_id,
+            ],
+            method="exact",
+        )
+        self.declare_partials("data:geometry:arms:length", "*", method="exact")
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -75,6 +88,28 @@ class ArmsGeometry(om.ExplicitComponent):
         outputs["data:geometry:arms:number"] = Narm
         outputs["data:geometry:arms:length"] = Larm
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id = self.options["propulsion_id"]
+        Dpro = inputs["data:propulsion:%s:propeller:diameter" % propulsion_id]
+        N_pro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+        is_coaxial = inputs["data:propulsion:%s:propeller:is_coaxial" % propulsion_id]
+
+        Npro_arm = 1 + is_coaxial
+        Narm = N_pro / Npro_arm
+        dLarm_dNarm = (
+            Dpro * np.pi * np.cos(np.pi / Narm) / (2 * np.sin(np.pi / Narm) ** 2 * Narm**2)
+        )
+
+        for input_name, dNarm in (
+            ("data:propulsion:%s:propeller:number" % propulsion_id, 1 / Npro_arm),
+            ("data:propulsion:%s:propeller:is_coaxial" % propulsion_id, -N_pro / Npro_arm**2),
+        ):
+            partials["data:geometry:arms:number", input_name] = dNarm
+            partials["data:geometry:arms:length", input_name] = dLarm_dNarm * dNarm
+        partials[
+            "data:geometry:arms:length", "data:propulsion:%s:propeller:diameter" % propulsion_id
+        ] = 1 / 2 / np.sin(np.pi / Narm)
+
 
 class BodyGeometry(om.ExplicitComponent):
     """
@@ -90,7 +125,12 @@ class BodyGeometry(om.ExplicitComponent):
         self.add_output("data:geometry:body:surface:front", units="m**2")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials(
+            "data:geometry:body:surface:top", "data:geometry:projected_area:top", val=1.0
+        )
+        self.declare_partials(
+            "data:geometry:body:surface:front", "data:geometry:projected_area:front", val=1.0
+        )
 
     def compute(self, inputs, outputs):
         outputs["data:geometry:body:surface:top"] = inputs["data:geometry:projected_area:top"]
@@ -118,7 +158,17 @@ class ProjectedAreasGuess(om.ExplicitComponent):
         self.add_output("data:geometry:projected_area:front", units="m**2")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        for view in ("top", "front"):
+            self.declare_partials(
+                "data:geometry:projected_area:%s" % view,
+                [
+                    "optimization:variables:weight:mtow:guess",
+                    "models:geometry:body:surface:%s:reference" % view,
+                    "models:weight:mtow:reference",
+                    "optimization:variables:geometry:projected_area:%s:k" % view,
+                ],
+                method="exact",
+            )
 
     def compute(self, inputs, outputs):
         m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
@@ -137,3 +187,24 @@ class ProjectedAreasGuess(om.ExplicitComponent):
 
         outputs["data:geometry:projected_area:top"] = S_top
         outputs["data:geometry:projected_area:front"] = S_front
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
+        MTOW_ref = inputs["models:weight:mtow:reference"]
+
+        for view in ("top", "front"):
+            S_ref = inputs["models:geometry:body:surface:%s:reference" % view]
+            k = inputs["optimization:variables:geometry:projected_area:%s:k" % view]
+            S = k * S_ref * (m_uav_guess / MTOW_ref) ** (2 / 3)
+
+            area_name = "data:geometry:projected_area:%s" % view
+            partials[area_name, "optimization:variables:weight:mtow:guess"] = (
+                2 / 3 * S / m_uav_guess
+            )
+            partials[area_name, "models:weight:mtow:reference"] = -2 / 3 * S / MTOW_ref
+            partials[area_name, "models:geometry:body:surface:%s:reference" % view] = k * (
+                m_uav_guess / MTOW_ref
+            ) ** (2 / 3)
+            partials[area_name, "optimization:variables:geometry:projected_area:%s:k" % view] = (
+                S_ref * (m_uav_guess / MTOW_ref) ** (2 / 3)
+            )
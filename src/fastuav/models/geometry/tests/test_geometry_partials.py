@@ -0,0 +1,83 @@
+"""
+Tests of the partial derivatives of the geometry components.
+"""
+
+import importlib
+
+import fastoad.api as oad
+import pytest
+
+from fastuav.tests.partials import check_partials
+
+INPUTS = {
+    # wing
+    "data:geometry:wing:loading": 120.0,
+    "optimization:variables:weight:mtow:guess": 15.0,
+    "optimization:variables:geometry:wing:AR": 8.0,
+    "optimization:variables:geometry:wing:lambda": 0.6,
+    "optimization:variables:geometry:wing:MAC:LE:x:k": 0.4,
+    "data:geometry:wing:sweep:LE": 0.1,
+    "data:geometry:wing:tc": 0.15,
+    # tails
+    "data:geometry:wing:surface": 1.2,
+    "data:geometry:wing:span": 3.1,
+    "data:geometry:wing:MAC:length": 0.4,
+    "data:geometry:wing:MAC:C4:x": 0.7,
+    "optimization:variables:geometry:tail:horizontal:AR": 4.0,
+    "optimization:variables:geometry:tail:horizontal:arm:k": 0.5,
+    "data:geometry:tail:horizontal:coefficient": 0.5,
+    "data:geometry:tail:horizontal:lambda": 0.9,
+    "data:geometry:tail:horizontal:arm": 1.5,
+    "optimization:variables:geometry:tail:vertical:AR": 1.5,
+    "data:geometry:tail:vertical:coefficient": 0.04,
+    "data:geometry:tail:vertical:lambda": 0.8,
+    # fuselage
+    "data:geometry:fuselage:diameter:k": 0.2,
+    "data:geometry:fuselage:fineness": 8.0,
+    "data:geometry:wing:root:TE:x": 0.9,
+    "data:geometry:tail:horizontal:root:TE:x": 2.0,
+    # VTOL propellers and arms
+    "optimization:variables:geometry:multirotor:propeller:y:k": 1.1,
+    "data:propulsion:fixedwing:propeller:diameter": 0.3,
+    "data:propulsion:multirotor:propeller:diameter": 0.5,
+    "data:propulsion:multirotor:propeller:number": 6.0,
+    "data:propulsion:multirotor:propeller:is_coaxial": 1.0,
+    "data:geometry:multirotor:propeller:clearance": 0.1,
+    "data:geometry:multirotor:propeller:x:front": 0.1,
+    "data:geometry:multirotor:propeller:x:rear": 1.3,
+    "data:geometry:wing:root:LE:x": 0.5,
+    "data:geometry:wing:sweep:TE": -0.05,
+    # projected areas
+    "optimization:variables:geometry:projected_area:top:k": 1.2,
+    "optimization:variables:geometry:projected_area:front:k": 0.9,
+    "models:geometry:body:surface:top:reference": 0.1,
+    "models:geometry:body:surface:front:reference": 0.05,
+    "models:weight:mtow:reference": 10.0,
+    "data:geometry:projected_area:top": 0.2,
+    "data:geometry:projected_area:front": 0.1,
+}
+
+
+def _geometry_module(name):
+    # the registered modules are loaded by FAST-OAD, importing them beforehand breaks the registry
+    oad.get_plugin_information()
+    return importlib.import_module("fastuav.models.geometry.%s" % name)
+
+
+@pytest.mark.parametrize(
+    "module_name, component_name",
+    [
+        ("geometry_fixedwing", "WingGeometry"),
+        ("geometry_fixedwing", "HorizontalTailGeometry"),
+        ("geometry_fixedwing", "VerticalTailGeometry"),
+        ("geometry_fixedwing", "FuselageGeometry"),
+        ("geometry_fixedwing", "ProjectedAreasGuess"),
+        ("geometry_hybrid", "PropellersVTOL"),
+        ("geometry_hybrid", "ArmsVTOL"),
+        ("geometry_multirotor", "ArmsGeometry"),
+        ("geometry_multirotor", "BodyGeometry"),
+        ("geometry_multirotor", "ProjectedAreasGuess"),
+    ],
+)
+def test_geometry_partials(module_name, component_name):
+    check_partials(getattr(_geometry_module(module_name), component_name)(), INPUTS)
@@ -0,0 +1,242 @@
+"""
+Compact mission: all the phases and routes of a mission computed in a single component.
+"""
+
+from itertools import chain
+from types import SimpleNamespace
+
+import numpy as np
+import openmdao.api as om
+
+from fastuav.constants import CLIMB_TAG, CRUISE_TAG, HOVER_TAG
+from fastuav.models.performance.mission.flight_performance import BatchFlightPerformanceModel
+from fastuav.models.performance.mission.phase_builder import PhaseComponent
+
+
+class CompactMissionComponent(om.ExplicitComponent):
+    """
+    This component computes the take-off weight, and the energy consumption and duration of the
+    phases and routes of an off-design mission (see ComputeTOW, PhaseComponent and RouteComponent).
+    The variables are the same as those of the RouteBuilder groups, but the flight points of all the
+    phases flown with the same propulsion system are evaluated in a single
+    BatchFlightPerformanceModel call, instead of one component per phase.
+    """
+
+    def initialize(self):
+        self.options.declare("mission_name", default=None, types=str)
+        self.options.declare(
+            "routes_dict",
+            default={},
+            types=dict,
+            desc="Phases (phase name: propulsion identifier) of each route, by route name",
+        )
+        self.options.declare(
+            "n_segments",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of segments of the climb phases (see PhaseComponent)",
+        )
+
+    def setup(self):
+        mission_name = self.options["mission_name"]
+        routes_dict = self.options["routes_dict"]
+
+        self.add_input("data:weight:mtow", val=np.nan, units="kg")
+        self.add_input("mission:sizing:payload:mass", val=np.nan, units="kg")
+        self.add_input("mission:%s:dISA" % mission_name, val=np.nan, units="K")
+        for propulsion_id in self._propulsion_id_list():
+            PhaseComponent.add_uav_inputs(self, propulsion_id)
+
+        for route_name, phases_dict in routes_dict.items():
+            route = "mission:%s:%s" % (mission_name, route_name)
+            self.add_input("%s:payload:mass" % route, val=np.nan, units="kg")
+            self.add_output("%s:tow" % route, units="kg")
+
+            if CLIMB_TAG in phases_dict:
+                self.add_input("%s:takeoff:altitude" % route, val=np.nan, units="m")
+                self.add_input("%s:climb:rate" % route, val=np.nan, units="m/s")
+                self.add_input("%s:climb:speed" % route, val=np.nan, units="m/s")
+                self.add_output("%s:climb:duration" % route, units="min")
+            if CRUISE_TAG in phases_dict:
+                self.add_input("%s:cruise:distance" % route, val=np.nan, units="m")
+                self.add_input("%s:cruise:speed" % route, val=np.nan, units="m/s")
+                self.add_output("%s:cruise:duration" % route, units="min")
+            if HOVER_TAG in phases_dict:
+                self.add_input("%s:hover:duration" % route, val=np.nan, units="min")
+            if phases_dict:
+                self.add_input("%s:cruise:altitude" % route, val=np.nan, units="m")
+
+            for phase_name in phases_dict:
+                self.add_input("%s:%s:payload:power" % (route, phase_name), val=np.nan, units="W")
+                self.add_output("%s:%s:energy" % (route, phase_name), units="kJ")
+
+            for propulsion_id in set(phases_dict.values()):
+                self.add_output("%s:energy:%s" % (route, propulsion_id), units="kJ")
+                self.add_output("%s:duration:%s" % (route, propulsion_id), units="min")
+            self.add_output("%s:energy" % route, units="kJ")
+            self.add_output("%s:duration" % route, units="min")
+
+    def setup_partials(self):
+        mission_name = self.options["mission_name"]
+        routes_dict = self.options["routes_dict"]
+
+        # The outputs of a route only depend on its own inputs and on the UAV inputs of the
+        # propulsion systems used on the route.
+        for route_name, phases_dict in routes_dict.items():
+            route = "mission:%s:%s" % (mission_name, route_name)
+            wrt = [
+                "data:weight:mtow",
+                "mission:sizing:payload:mass",
+                "mission:%s:dISA" % mission_name,
+                "%s:*" % route,
+            ]
+            for propulsion_id in sorted(set(phases_dict.values())):
+                wrt += _uav_input_names(propulsion_id)
+            self.declare_partials("%s:*" % route, wrt, method="fd")
+
+    def compute(self, inputs, outputs):
+        mission_name = self.options["mission_name"]
+        routes_dict = self.options["routes_dict"]
+        dISA = inputs["mission:%s:dISA" % mission_name]
+
+        # FLIGHT CONDITIONS of all the phases, by propulsion system
+        phases = {propulsion_id: [] for propulsion_id in self._propulsion_id_list()}
+        durations = {}  # [min] phase durations, by route and phase names
+        for route_name, phases_dict in routes_dict.items():
+            route = "mission:%s:%s" % (mission_name, route_name)
+            tow = (
+                inputs["data:weight:mtow"]
+                - inputs["mission:sizing:payload:mass"]
+                + inputs["%s:payload:mass" % route]
+            )  # [kg]
+            outputs["%s:tow" % route] = tow
+
+            for phase_name, propulsion_id in phases_dict.items():
+                phase = self._flight_conditions(inputs, route, phase_name)
+                phase.update(
+                    route_name=route_name,
+                    phase_name=phase_name,
+                    tow=tow,
+                    payload_power=inputs["%s:%s:payload:power" % (route, phase_name)],
+                )
+                phases[propulsion_id].append(phase)
+                durations[route_name, phase_name] = phase["duration"] / 60  # [min]
+                if phase_name != HOVER_TAG:
+                    outputs["%s:%s:duration" % (route, phase_name)] = phase["duration"] / 60
+
+        # POWER CONSUMPTION (one batch of flight points for each propulsion system)
+        energies = {}  # [kJ] phase energies, by route and phase names
+        for propulsion_id, phases_list in phases.items():
+            sizes = [len(phase["altitudes"]) for phase in phases_list]
+
+            def flight_points(key):
+                return np.concatenate(
+                    [np.broadcast_to(phase[key], (n,)) for phase, n in zip(phases_list, sizes)]
+                )
+
+            flight_model = BatchFlightPerformanceModel(
+                propulsion_id,
+                flight_points("tow"),
+                flight_points("airspeed"),
+                flight_points("climb_rate"),
+                flight_points("altitudes"),
+                dISA,
+            )
+            PhaseComponent.set_uav_parameters(flight_model, inputs, propulsion_id)
+            flight_model.payload_power = flight_points("payload_power")
+            power = flight_model.battery_power  # [W]
+
+            for phase, phase_power in zip(phases_list, np.split(power, np.cumsum(sizes)[:-1])):
+                t = phase["duration"]  # [s]
+                n_segments = len(phase_power) - 1
+                if n_segments == 0:
+                    energy = phase_power * t  # [J]
+                else:
+                    energy = (
+                        t
+                        * (phase_power[0] / 2 + np.sum(phase_power[1:-1]) + phase_power[-1] / 2)
+                        / n_segments
+                    )  # [J] trapezoidal rule
+                key = (phase["route_name"], phase["phase_name"])
+                energies[key] = energy / 1000  # [kJ]
+                outputs["mission:%s:%s:%s:energy" % (mission_name, *key)] = energies[key]
+
+        # ROUTES
+        for route_name, phases_dict in routes_dict.items():
+            route = "mission:%s:%s" % (mission_name, route_name)
+            E_route = 0.0  # [kJ] energy consumption on whole route
+            t_route = 0.0  # [min] duration of whole route
+            for propulsion_id in set(phases_dict.values()):
+                E_route_prop_id = sum(
+                    energies[route_name, phase_name]
+                    for phase_name in phases_dict
+                    if phases_dict[phase_name] == propulsion_id
+                )
+                t_route_prop_id = sum(
+                    durations[route_name, phase_name]
+                    for phase_name in phases_dict
+                    if phases_dict[phase_name] == propulsion_id
+                )
+                outputs["%s:energy:%s" % (route, propulsion_id)] = E_route_prop_id
+                outputs["%s:duration:%s" % (route, propulsion_id)] = t_route_prop_id
+                E_route += E_route_prop_id
+                t_route += t_route_prop_id
+            outputs["%s:energy" % route] = E_route
+            outputs["%s:duration" % route] = t_route
+
+    def _propulsion_id_list(self):
+        """
+        :return: sorted list of the propulsion systems used to complete the mission
+        """
+        routes_dict = self.options["routes_dict"]
+        return sorted(set(chain(*(phases_dict.values() for phases_dict in routes_dict.values()))))
+
+    def _flight_conditions(self, inputs, route, phase_name):
+        """
+        Flight conditions and duration of a phase (see PhaseComponent.compute).
+        The climb phases are discretized into n_segments segments of equal altitude gain.
+
+        :param inputs: inputs of the component
+        :param route: route variables prefix (mission:<mission_name>:<route_name>)
+        :param phase_name: phase name
+        :return: dict of the airspeed [m/s], climb rate [m/s], altitudes [m] of the flight points
+                 and duration [s] of the phase
+        """
+        V = np.zeros(1)  # [m/s] airspeed
+        RoC = np.zeros(1)  # [m/s] climb rate
+        altitude = inputs["%s:cruise:altitude" % route]  # [m]
+
+        if phase_name == HOVER_TAG:
+            t = inputs["%s:hover:duration" % route] * 60  # [s]
+            altitudes = altitude
+        elif phase_name == CRUISE_TAG:
+            d = inputs["%s:cruise:distance" % route]  # [m]
+            V = inputs["%s:cruise:speed" % route]
+            t = d / V if V > 0 else np.zeros(1)  # [s]
+            altitudes = altitude
+        else:  # climb
+            n_segments = self.options["n_segments"]
+            altitude_min = inputs["%s:takeoff:altitude" % route]  # [m]
+            V = inputs["%s:climb:speed" % route]
+            RoC = inputs["%s:climb:rate" % route]
+            d = (altitude - altitude_min) * V / RoC
+            t = d / V if V > 0 else np.zeros(1)  # [s]
+            altitudes = (
+                np.linspace(altitude_min, altitude, n_segments + 1).ravel()
+                if n_segments > 1
+                else altitude  # conservative assumption
+            )
+        return {"airspeed": V, "climb_rate": RoC, "altitudes": altitudes, "duration": t}
+
+
+def _uav_input_names(propulsion_id):
+    """
+    :param propulsion_id: propulsion system identifier
+    :return: names of the inputs added by PhaseComponent.add_uav_inputs for this propulsion system
+    """
+    names = []
+    PhaseComponent.add_uav_inputs(
+        SimpleNamespace(add_input=lambda name, **kwargs: names.append(name)), propulsion_id
+    )
+    return names
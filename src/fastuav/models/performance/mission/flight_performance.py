@@ -3,6 +3,7 @@ This module provides the flight performance model for the UAV,
 based on the individual models defined in each discipline.
 """
 
+import numpy as np
 from scipy.constants import g
 from scipy.optimize import brentq, newton
 from stdatm import AtmosphereWithPartials
@@ -356,3 +357,219 @@ class FlightPerformanceModel:
                 self.altitude, self.delta_isa, altitude_in_feet=False
             ).density
         return self._air_density
+
+
+def _bracketed_roots(func, lower, upper, xtol: float = 1e-12, maxiter: int = 100):
+    """
+    Vectorized root finding with the Illinois (modified regula falsi) method.
+    The function is evaluated element-wise on arrays, and each element is solved within its own
+    bracket [lower, upper]. The roots of the elements that are not bracketed are set to NaN.
+    """
+    a, b = (np.array(x, dtype=float) for x in np.broadcast_arrays(lower, upper))
+    fa, fb = func(a), func(b)
+    bracketed = np.sign(fa) * np.sign(fb) <= 0
+    roots = np.where(fa == 0.0, a, b)
+    converged = ~bracketed | (fa == 0.0) | (fb == 0.0)
+
+    for _ in range(maxiter):
+        if converged.all():
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = b - fb * (b - a) / (fb - fa)
+        c = np.where(np.isfinite(c), c, (a + b) / 2)
+        fc = func(c)
+        active = ~converged
+        swap = np.sign(fc) * np.sign(fb) < 0  # root between b and c
+        a = np.where(active & swap, b, a)
+        fa = np.where(active, np.where(swap, fb, fa / 2), fa)
+        b = np.where(active, c, b)
+        fb = np.where(active, fc, fb)
+        roots = np.where(active, c, roots)
+        converged = converged | (fc == 0.0) | (np.abs(b - a) <= xtol)
+
+    roots[~bracketed] = np.nan
+    return roots
+
+
+def _safe_divide(x, y, where=None):
+    """
+    Element-wise division of arrays, that is set to zero where the denominator is zero
+    (or where the condition is not met).
+    """
+    x, y = np.broadcast_arrays(x, y)
+    return np.divide(x, y, out=np.zeros(x.shape), where=(y != 0) if where is None else where)
+
+
+class BatchFlightPerformanceModel(FlightPerformanceModel):
+    """
+    Flight performance model of UAV, evaluated on many flight points at once.
+    The flight conditions are arrays (or scalars) that are broadcast together,
+    and the flight parameters are returned as arrays with one value per flight point.
+    The UAV parameters (aerodynamics, geometry, propulsion system) are set as for the
+    FlightPerformanceModel and are shared by all the flight points.
+    """
+
+    def __init__(
+        self,
+        uav_model: str,
+        uav_mass,
+        airspeed,
+        climb_rate=0.0,
+        altitude=0.0,
+        delta_isa=0.0,
+    ):
+        """
+        :param uav_model: fixed wing or multirotor or hybrid
+        :param uav_mass: mass of the uav (kg) at each flight point
+        :param airspeed: true airspeed (m/s) at each flight point
+        :param climb_rate: rate of climb (m/s) at each flight point
+        :param altitude: altitude (m) of each flight point
+        :param delta_isa: temperature deviation (K) from standard atmosphere at each flight point
+        """
+        uav_mass, airspeed, climb_rate, altitude, delta_isa = (
+            np.array(x, dtype=float)
+            for x in np.broadcast_arrays(uav_mass, airspeed, climb_rate, altitude, delta_isa)
+        )
+        super().__init__(uav_model, uav_mass, airspeed, climb_rate, altitude, delta_isa)
+
+    @property
+    def thrust_per_propeller(self) -> np.ndarray:
+        """Thrust per propeller in N."""
+        if (
+            self._thrust_per_propeller is None
+            and self.uav_model == MR_PROPULSION
+            and self.mr_area_front is not None
+            and self.mr_area_top is not None
+            and self.mr_parasitic_drag_coef is not None
+        ):
+            thrust = MultirotorFlightModel.get_thrust(
+                self.uav_mass,
+                self.airspeed,
+                self.climb_rate,
+                self.propeller_angle_of_attack,
+                self.mr_area_front,
+                self.mr_area_top,
+                self.mr_parasitic_drag_coef,
+                self.mr_lift_coef,
+                self.air_density,
+            )
+            self._thrust_per_propeller = thrust / self.propeller_number
+        return super().thrust_per_propeller
+
+    @property
+    def propeller_angle_of_attack(self) -> np.ndarray:
+        """
+        Propeller disk angle of attack in rad.
+        In multirotor configuration, it is obtained by solving the equilibrium equation
+        for all the flight points at once, within [0, pi/2].
+        """
+        if self._propeller_angle_of_attack is None:
+            if self.uav_model == MR_PROPULSION:
+                if (
+                    self.mr_area_front is not None
+                    and self.mr_area_top is not None
+                    and self.mr_parasitic_drag_coef is not None
+                ):
+                    theta = MultirotorFlightModel.get_flight_path_angle(
+                        self.airspeed, self.climb_rate
+                    )
+
+                    def func(x):
+                        return MultirotorFlightModel.get_equilibrium_residual(
+                            x,
+                            self.uav_mass,
+                            self.airspeed,
+                            theta,
+                            self.mr_area_front,
+                            self.mr_area_top,
+                            self.mr_parasitic_drag_coef,
+                            self.mr_lift_coef,
+                            self.air_density,
+                        )
+
+                    lower = np.zeros_like(self.airspeed)
+                    upper = np.full_like(self.airspeed, np.pi / 2)
+                    alpha = _bracketed_roots(func, lower, upper)
+                    alpha = np.where(func(lower) > 0, 0.0, alpha)  # equilibrium out of bounds
+                    alpha = np.where(np.isnan(alpha), np.pi / 2, alpha)
+                    forward = (self.airspeed != 0.0) & (self.airspeed > self.climb_rate)
+                    self._propeller_angle_of_attack = np.where(forward, alpha, np.pi / 2)
+            elif self.uav_model == FW_PROPULSION:
+                self._propeller_angle_of_attack = np.full_like(
+                    self.airspeed, FixedwingFlightModel.get_angle_of_attack()
+                )
+        return self._propeller_angle_of_attack
+
+    @property
+    def advance_ratio(self) -> np.ndarray:
+        """
+        Advance ratio (J) of the propeller, solved for all the flight points at once.
+        See FlightPerformanceModel.advance_ratio.
+        """
+        if (
+            self._advance_ratio is None
+            and self.propeller_diameter is not None
+            and self.propeller_beta is not None
+            and self.thrust_per_propeller is not None
+        ):
+
+            def func(x, idx=slice(None)):
+                propeller_ct, _ = PropellerAerodynamicsModel.aero_coefficients_incidence(
+                    self.propeller_beta,
+                    x,
+                    self.propeller_angle_of_attack[idx],
+                    ct_model=self.propeller_ct_model,
+                    cp_model=self.propeller_cp_model,
+                )
+                res = (
+                    x**2
+                    - self.airspeed[idx] ** 2
+                    * self.air_density[idx]
+                    * self.propeller_diameter**2
+                    * propeller_ct
+                    / self.thrust_per_propeller[idx]
+                )
+                return res
+
+            J = np.zeros_like(self.airspeed)  # [-] zero advance ratio if no airspeed
+            J[self.thrust_per_propeller <= 0] = np.nan
+            moving = (self.airspeed > 0) & (self.thrust_per_propeller > 0)
+            J[moving] = _bracketed_roots(
+                lambda x: func(x, moving), np.zeros(moving.sum()), np.full(moving.sum(), 3.0)
+            )
+            failed = np.flatnonzero(moving & np.isnan(J))
+            if failed.size:
+                J[failed] = newton(lambda x: func(x, failed), np.zeros(failed.size))
+            self._advance_ratio = J
+        return self._advance_ratio
+
+    @property
+    def propeller_speed(self) -> np.ndarray:
+        """Propeller rotation speed in rad/s."""
+        if self._propeller_speed is None and self.propeller_diameter is not None:
+            n_pro = np.sqrt(
+                _safe_divide(
+                    self.thrust_per_propeller,
+                    self.propeller_ct * self.air_density * self.propeller_diameter**4,
+                )
+            )  # [Hz] propeller speed
+            self._propeller_speed = n_pro * 2 * np.pi
+        return self._propeller_speed
+
+    @property
+    def propeller_torque(self) -> np.ndarray:
+        """Propeller torque in N*m."""
+        if self._propeller_torque is None:
+            self._propeller_torque = _safe_divide(self.propeller_power, self.propeller_speed)
+        return self._propeller_torque
+
+    @property
+    def esc_power(self) -> np.ndarray:
+        """ESC power in W."""
+        if self._esc_power is None and self.battery_voltage is not None:
+            self._esc_power = _safe_divide(
+                self.motor_power * self.battery_voltage,
+                self.motor_voltage,
+                where=self.motor_voltage > 0,
+            )
+        return self._esc_power
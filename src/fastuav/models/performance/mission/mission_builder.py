@@ -14,6 +14,7 @@ from fastuav.constants import (
     ROUTE_DEFINITION_TAG,
     SIZING_MISSION_TAG,
 )
+from fastuav.models.performance.mission.compact_mission import CompactMissionComponent
 from fastuav.models.performance.mission.mission_definition.schema import (
     MissionDefinition,
 )
@@ -24,14 +25,38 @@ from fastuav.models.performance.mission.route_builder import RouteBuilder
 class MissionBuilder(om.Group):
     """
     This class builds a mission from a provided definition.
+    The climb phases of the off-design missions can be discretized into n_segments segments
+    (see PhaseComponent).
+    In compact mode, all the routes of each off-design mission are computed by a single component
+    (see CompactMissionComponent), which reduces the setup time and the cost of the finite
+    differences for mission files with many routes.
     """
 
     def initialize(self):
         self.options.declare("file_path", default=None, types=str)
+        self.options.declare(
+            "use_file_cache",
+            default=False,
+            types=bool,
+            desc="Cache the parsed mission definition in a JSON file next to the YAML file",
+        )
+        self.options.declare(
+            "n_segments",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of segments of the climb phases of the off-design missions",
+        )
+        self.options.declare(
+            "compact",
+            default=False,
+            types=bool,
+            desc="Compute all the routes of each off-design mission in a single component",
+        )
 
     def setup(self):
         file_path = self.options["file_path"]
-        mission_dict = MissionDefinition(file_path)
+        mission_dict = MissionDefinition(file_path, use_file_cache=self.options["use_file_cache"])
 
         for mission_name, mission_definition in mission_dict[MISSION_DEFINITION_TAG].items():
             routes_list = []  # list of routes names
@@ -42,6 +67,7 @@ class MissionBuilder(om.Group):
             mission_group = self.add_subsystem(mission_name, om.Group(), promotes=["*"])
 
             # Add routes to the mission group
+            routes_dict = {}  # phases of each route, by route name
             for route in mission_definition[PARTS_TAG]:
                 _, route_name = tuple(*route.items())  # get route name
                 route_definition = mission_dict[ROUTE_DEFINITION_TAG][
@@ -51,6 +77,9 @@ class MissionBuilder(om.Group):
                 propulsion_id_dict[route_name] = RouteBuilder.get_propulsion_id_list(
                     route_definition
                 )
+                if self.options["compact"] and not is_sizing:
+                    routes_dict[route_name] = RouteBuilder.get_phases_dict(route_definition)
+                    continue
                 # Add OpenMDAO subgroup to mission group
                 mission_group.add_subsystem(
                     route_name,
@@ -59,6 +88,19 @@ class MissionBuilder(om.Group):
                         is_sizing=is_sizing,
                         route_name=route_name,
                         route_definition=route_definition,
+                        n_segments=self.options["n_segments"],
+                    ),
+                    promotes=["*"],
+                )
+
+            # Compact mode: all the routes in a single component
+            if routes_dict:
+                mission_group.add_subsystem(
+                    "routes",
+                    CompactMissionComponent(
+                        mission_name=mission_name,
+                        routes_dict=routes_dict,
+                        n_segments=self.options["n_segments"],
                     ),
                     promotes=["*"],
                 )
@@ -14,13 +14,18 @@ Schema for mission definition files.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
 import json
+import os
+import os.path as pth
+from copy import deepcopy
+from functools import lru_cache
 from importlib.resources import open_text
 from os import PathLike
 from typing import Union
 
 from ensure import Ensure
-from jsonschema import validate
+from jsonschema.validators import validator_for
 from ruamel.yaml import YAML
 
 from . import resources
@@ -41,9 +46,12 @@ ROUTE_DEFINITION_TAG = "routes"
 SIZING_MISSION_TAG = "sizing"
 MAIN_ROUTE_TAG = "main_route"
 
+# Validated mission definitions, by file path, modification time and size
+_definitions = {}
+
 
 class MissionDefinition(dict):
-    def __init__(self, file_path: Union[str, PathLike] = None):
+    def __init__(self, file_path: Union[str, PathLike] = None, use_file_cache: bool = False):
         """
         Class for reading a mission definition from a YAML file.
 
@@ -51,31 +59,87 @@ class MissionDefinition(dict):
         :meth:`load`.
 
         :param file_path: path of YAML file to read.
+        :param use_file_cache: if True, the validated definition is also cached in a JSON file
+                               next to the YAML file (see :meth:`load`).
         """
         super().__init__()
         if file_path:
-            self.load(file_path)
+            self.load(file_path, use_file_cache)
 
-    def load(self, file_path: Union[str, PathLike]):
+    def load(self, file_path: Union[str, PathLike], use_file_cache: bool = False):
         """
         Loads a mission definition from provided file path.
 
         Any existing definition will be overwritten.
 
+        Validated definitions are kept in memory for the whole process, and are read again only
+        if the file has been modified. If use_file_cache is True, they are also stored in a
+        hidden JSON file next to the YAML file, so that other processes (e.g. the workers of a
+        DoE) do not have to parse and validate the YAML file again.
+
         :param file_path: path of YAML file to read.
+        :param use_file_cache: if True, reads and updates the JSON cache file.
         """
         self.clear()
+        stat = os.stat(file_path)
+        key = (pth.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+        if key not in _definitions:
+            data = self._read_file_cache(file_path, key) if use_file_cache else None
+            if data is None:
+                data = self._read(file_path)
+                if use_file_cache:
+                    self._write_file_cache(file_path, key, data)
+            _definitions[key] = data
+
+        self.update(deepcopy(_definitions[key]))
+
+    @classmethod
+    def _read(cls, file_path: Union[str, PathLike]) -> dict:
+        """
+        Reads and validates a mission definition file.
+
+        :param file_path: path of YAML file to read.
+        :return: file content
+        """
         yaml = YAML()
 
         with open(file_path) as yaml_file:
             data = yaml.load(yaml_file)
 
-        with open_text(resources, JSON_SCHEMA_NAME) as json_file:
-            json_schema = json.loads(json_file.read())
-        validate(data, json_schema)
+        _schema_validator()[0].validate(data)
 
-        self._validate(data)
-        self.update(data)
+        cls._validate(data)
+        return data
+
+    @staticmethod
+    def _read_file_cache(file_path, key):
+        """
+        :return: the cached definition of the file, or None if there is no up-to-date cache.
+        """
+        try:
+            with open(_file_cache_path(file_path)) as json_file:
+                cache = json.load(json_file)
+        except (OSError, ValueError):
+            return None
+        if cache.get("key") != [*key[1:], _schema_validator()[1]]:
+            return None
+        return cache["definition"]
+
+    @staticmethod
+    def _write_file_cache(file_path, key, data):
+        """
+        Writes the definition of the file to its cache file, if possible.
+        """
+        cache_path = _file_cache_path(file_path)
+        tmp_path = cache_path + ".%i.tmp" % os.getpid()
+        cache = {"key": [*key[1:], _schema_validator()[1]], "definition": data}
+        try:
+            with open(tmp_path, "w") as json_file:
+                json.dump(cache, json_file)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # definition is not cached
 
     @classmethod
     def _validate(cls, content: dict):
@@ -102,3 +166,26 @@ class MissionDefinition(dict):
             # Ensure "sizing" mission contains "main_route"
             if mission_definition == SIZING_MISSION_TAG:
                 Ensure(MAIN_ROUTE_TAG).is_in(mission_definition.keys())
+
+
+@lru_cache(maxsize=None)
+def _schema_validator():
+    """
+    Builds the JSON schema validator of the mission definitions once for the whole process.
+
+    :return: validator, and digest of the JSON schema (to invalidate the file caches)
+    """
+    with open_text(resources, JSON_SCHEMA_NAME) as json_file:
+        schema_text = json_file.read()
+    json_schema = json.loads(schema_text)
+    validator_class = validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema), hashlib.sha1(schema_text.encode()).hexdigest()
+
+
+def _file_cache_path(file_path: Union[str, PathLike]) -> str:
+    """
+    :return: path of the JSON cache file of a mission definition file
+    """
+    file_path = pth.abspath(file_path)
+    return pth.join(pth.dirname(file_path), ".%s.cache.json" % pth.basename(file_path))
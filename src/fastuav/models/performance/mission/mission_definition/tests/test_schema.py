@@ -12,8 +12,10 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os.path as pth
+import shutil
 from collections import OrderedDict
 
+from .. import schema
 from ..schema import MissionDefinition
 
 MISSIONS_FOLDER_PATH = pth.join(pth.dirname(__file__), "data")
@@ -31,6 +33,29 @@ def test_schema():
     assert obtained_dict == expected_dict
 
 
+def test_schema_cache(tmp_path, monkeypatch):
+    file_path = tmp_path / "mission.yaml"
+    shutil.copy(pth.join(MISSIONS_FOLDER_PATH, "mission.yaml"), file_path)
+    expected_dict = _to_ordered_dict(_get_expected_dict())
+    schema._definitions.clear()
+
+    # first load: file is parsed and validated, then cached in memory and next to the file
+    obtained_dict = MissionDefinition(file_path, use_file_cache=True)
+    assert _to_ordered_dict(obtained_dict) == expected_dict
+    assert (tmp_path / ".mission.yaml.cache.json").exists()
+
+    # next loads: file is not parsed again
+    def fail(file_path):
+        raise AssertionError("mission file should not be parsed again")
+
+    monkeypatch.setattr(MissionDefinition, "_read", staticmethod(fail))
+    obtained_dict["routes"].clear()  # definitions in cache are not modified
+    assert _to_ordered_dict(MissionDefinition(file_path)) == expected_dict
+    schema._definitions.clear()
+    assert _to_ordered_dict(MissionDefinition(file_path, use_file_cache=True)) == expected_dict
+    schema._definitions.clear()
+
+
 def _to_ordered_dict(item):
     """Returns the item with all dictionaries inside transformed to OrderedDict."""
     if isinstance(item, dict):
@@ -14,7 +14,10 @@ from fastuav.constants import (
     PHASE_TAGS_LIST,
     PROPULSION_ID_LIST,
 )
-from fastuav.models.performance.mission.flight_performance import FlightPerformanceModel
+from fastuav.models.performance.mission.flight_performance import (
+    BatchFlightPerformanceModel,
+    FlightPerformanceModel,
+)
 
 
 class PhaseBuilder(om.Group):
@@ -30,6 +33,7 @@ class PhaseBuilder(om.Group):
         self.options.declare("route_name", default=None, types=str)
         self.options.declare("phase_name", default=None, types=str)
         self.options.declare("propulsion_id", default=None, values=PROPULSION_ID_LIST)
+        self.options.declare("n_segments", default=1, types=int, lower=1)
 
     def setup(self):
         mission_name = self.options["mission_name"]
@@ -58,6 +62,7 @@ class PhaseBuilder(om.Group):
                 route_name=route_name,
                 phase_name=phase_name,
                 propulsion_id=propulsion_id,
+                n_segments=self.options["n_segments"],
             ),
             promotes=["*"],
         )
@@ -140,6 +145,10 @@ class PhaseComponent(om.ExplicitComponent):
         - If the mission is a sizing mission, then the parameters required for calculation are directly retrieved
         from the sizing process.
         - Else, the parameters are recalculated under the new flight conditions.
+    The climb phase can be discretized into n_segments segments of equal altitude gain. The power is
+    then evaluated at the boundaries of the segments in a single vectorized call, and the energy is
+    obtained by the trapezoidal rule. With one segment (default), the power is evaluated at the
+    cruise altitude (conservative assumption).
     """
 
     def initialize(self):
@@ -148,6 +157,13 @@ class PhaseComponent(om.ExplicitComponent):
         self.options.declare("route_name", default=None, types=str)
         self.options.declare("phase_name", default=None, values=PHASE_TAGS_LIST)
         self.options.declare("propulsion_id", default=None, values=PROPULSION_ID_LIST)
+        self.options.declare(
+            "n_segments",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of segments of the climb phase (off-design missions only)",
+        )
 
     def setup(self):
         mission_name = self.options["mission_name"]
@@ -221,76 +237,12 @@ class PhaseComponent(om.ExplicitComponent):
         else:
             self.add_input("mission:%s:%s:tow" % (mission_name, route_name), val=np.nan, units="kg")
             self.add_input("mission:%s:dISA" % mission_name, val=np.nan, units="K")
-            self.add_input(
-                "data:propulsion:%s:battery:voltage" % propulsion_id,
-                val=np.nan,
-                units="V",
-            )
-            self.add_input(
-                "data:propulsion:%s:esc:efficiency" % propulsion_id,
-                val=np.nan,
-                units=None,
-            )
-            self.add_input(
-                "data:propulsion:%s:gearbox:N_red" % propulsion_id,
-                val=np.nan,
-                units=None,
-            )
-            self.add_input(
-                "data:propulsion:%s:motor:speed:constant" % propulsion_id,
-                val=np.nan,
-                units="rad/V/s",
-            )
-            self.add_input(
-                "data:propulsion:%s:motor:torque:friction" % propulsion_id,
-                val=np.nan,
-                units="N*m",
-            )
-            self.add_input(
-                "data:propulsion:%s:motor:resistance" % propulsion_id,
-                val=np.nan,
-                units="V/A",
-            )
-            self.add_input(
-                "data:propulsion:%s:propeller:number" % propulsion_id,
-                val=np.nan,
-                units=None,
-            )
-            self.add_input(
-                "data:propulsion:%s:propeller:diameter" % propulsion_id,
-                val=np.nan,
-                units="m",
-            )
-            self.add_input(
-                "data:propulsion:%s:propeller:beta" % propulsion_id,
-                val=np.nan,
-                units=None,
-            )
-            self.add_input(
-                "data:propulsion:%s:propeller:Ct:dynamic:polynomial" % propulsion_id,
-                shape_by_conn=True,
-                val=np.nan,
-                units=None,
-            )
-            self.add_input(
-                "data:propulsion:%s:propeller:Cp:dynamic:polynomial" % propulsion_id,
-                shape_by_conn=True,
-                val=np.nan,
-                units=None,
-            )
+            self.add_uav_inputs(self, propulsion_id)
             self.add_input(
                 "mission:%s:%s:%s:payload:power" % (mission_name, route_name, phase_name),
                 val=np.nan,
                 units="W",
             )
-            if propulsion_id == MR_PROPULSION:
-                self.add_input("data:aerodynamics:%s:CD0" % propulsion_id, val=np.nan, units=None)
-                self.add_input("data:geometry:projected_area:front", val=np.nan, units="m**2")
-                self.add_input("data:geometry:projected_area:top", val=np.nan, units="m**2")
-            elif propulsion_id == FW_PROPULSION:
-                self.add_input("data:aerodynamics:CD0", val=np.nan, units=None)
-                self.add_input("data:aerodynamics:CDi:K", val=np.nan, units=None)
-                self.add_input("data:geometry:wing:surface", val=np.nan, units="m**2")
 
         self.add_output(
             "mission:%s:%s:%s:energy" % (mission_name, route_name, phase_name),
@@ -345,69 +297,172 @@ class PhaseComponent(om.ExplicitComponent):
         # POWER CONSUMPTION
         if is_sizing:
             power = inputs["data:propulsion:%s:battery:power:%s" % (propulsion_id, phase_name)]
+            energy = power * t  # [J] required energy to complete the flight phase_name
+        elif phase_name == CLIMB_TAG and self.options["n_segments"] > 1:
+            n_segments = self.options["n_segments"]
+            altitudes = np.linspace(altitude_min, altitude_max, n_segments + 1).ravel()  # [m]
+            flight_model = self._flight_model(inputs, BatchFlightPerformanceModel, V, altitudes)
+            power = flight_model.battery_power  # [W] power at the segments boundaries
+            energy = (
+                t * (power[0] / 2 + np.sum(power[1:-1]) + power[-1] / 2) / n_segments
+            )  # [J] trapezoidal rule
         else:
-            # flight parameters
-            tow = inputs["mission:%s:%s:tow" % (mission_name, route_name)]
-            dISA = inputs["mission:%s:dISA" % mission_name]
-            RoC = (
-                inputs["mission:%s:%s:climb:rate" % (mission_name, route_name)]
-                if phase_name == CLIMB_TAG
-                else 0.0
-            )
-
-            # setup flight model
-            flight_model = FlightPerformanceModel(propulsion_id, tow, V, RoC, altitude, dISA)
-            flight_model.battery_voltage = inputs[
-                "data:propulsion:%s:battery:voltage" % propulsion_id
-            ]
-            flight_model.esc_efficiency = inputs[
-                "data:propulsion:%s:esc:efficiency" % propulsion_id
-            ]
-            flight_model.gearbox_ratio = inputs["data:propulsion:%s:gearbox:N_red" % propulsion_id]
-            flight_model.motor_speed_constant = inputs[
-                "data:propulsion:%s:motor:speed:constant" % propulsion_id
-            ]
-            flight_model.motor_torque_friction = inputs[
-                "data:propulsion:%s:motor:torque:friction" % propulsion_id
-            ]
-            flight_model.motor_resistance = inputs[
-                "data:propulsion:%s:motor:resistance" % propulsion_id
-            ]
-            flight_model.propeller_number = inputs[
-                "data:propulsion:%s:propeller:number" % propulsion_id
-            ]
-            flight_model.propeller_diameter = inputs[
-                "data:propulsion:%s:propeller:diameter" % propulsion_id
-            ]
-            flight_model.propeller_beta = inputs[
-                "data:propulsion:%s:propeller:beta" % propulsion_id
-            ]
-            flight_model.propeller_ct_model = inputs[
-                "data:propulsion:%s:propeller:Ct:dynamic:polynomial" % propulsion_id
-            ]
-            flight_model.propeller_cp_model = inputs[
-                "data:propulsion:%s:propeller:Cp:dynamic:polynomial" % propulsion_id
-            ]
-            flight_model.payload_power = inputs[
-                "mission:%s:%s:%s:payload:power" % (mission_name, route_name, phase_name)
-            ]
+            power = self._flight_model(inputs, FlightPerformanceModel, V, altitude).battery_power
+            energy = power * t  # [J] required energy to complete the flight phase_name
 
-            if propulsion_id == MR_PROPULSION:
-                flight_model.mr_parasitic_drag_coef = inputs[
-                    "data:aerodynamics:%s:CD0" % propulsion_id
-                ]
-                flight_model.mr_area_front = inputs["data:geometry:projected_area:front"]
-                flight_model.mr_area_top = inputs["data:geometry:projected_area:top"]
+        outputs["mission:%s:%s:%s:energy" % (mission_name, route_name, phase_name)] = (
+            energy / 1000
+        )  # [kJ]
 
-            elif propulsion_id == FW_PROPULSION:
-                flight_model.fw_induced_drag_constant = inputs["data:aerodynamics:CDi:K"]
-                flight_model.fw_parasitic_drag_coef = inputs["data:aerodynamics:CD0"]
-                flight_model.wing_area = inputs["data:geometry:wing:surface"]
+    def _flight_model(self, inputs, model_class, airspeed, altitude):
+        """
+        Sets up the flight performance model of the phase (off-design missions).
 
-            power = flight_model.battery_power
+        :param model_class: FlightPerformanceModel, or BatchFlightPerformanceModel to evaluate
+                            several flight points at once
+        :param airspeed: airspeed [m/s]
+        :param altitude: altitude [m] of the flight point(s)
+        :return: flight performance model
+        """
+        mission_name = self.options["mission_name"]
+        route_name = self.options["route_name"]
+        phase_name = self.options["phase_name"]
+        propulsion_id = self.options["propulsion_id"]
 
-        energy = power * t  # [J] required energy to complete the flight phase_name
+        # flight parameters
+        tow = inputs["mission:%s:%s:tow" % (mission_name, route_name)]
+        dISA = inputs["mission:%s:dISA" % mission_name]
+        RoC = (
+            inputs["mission:%s:%s:climb:rate" % (mission_name, route_name)]
+            if phase_name == CLIMB_TAG
+            else 0.0
+        )
 
-        outputs["mission:%s:%s:%s:energy" % (mission_name, route_name, phase_name)] = (
-            energy / 1000
-        )  # [kJ]
+        # setup flight model
+        flight_model = model_class(propulsion_id, tow, airspeed, RoC, altitude, dISA)
+        self.set_uav_parameters(flight_model, inputs, propulsion_id)
+        flight_model.payload_power = inputs[
+            "mission:%s:%s:%s:payload:power" % (mission_name, route_name, phase_name)
+        ]
+
+        return flight_model
+
+    @staticmethod
+    def add_uav_inputs(component, propulsion_id):
+        """
+        Adds the inputs describing the UAV (propulsion system, aerodynamics and geometry),
+        required to compute the flight performance with a given propulsion system.
+
+        :param component: component to which the inputs are added
+        :param propulsion_id: propulsion system identifier
+        """
+        component.add_input(
+            "data:propulsion:%s:battery:voltage" % propulsion_id,
+            val=np.nan,
+            units="V",
+        )
+        component.add_input(
+            "data:propulsion:%s:esc:efficiency" % propulsion_id,
+            val=np.nan,
+            units=None,
+        )
+        component.add_input(
+            "data:propulsion:%s:gearbox:N_red" % propulsion_id,
+            val=np.nan,
+            units=None,
+        )
+        component.add_input(
+            "data:propulsion:%s:motor:speed:constant" % propulsion_id,
+            val=np.nan,
+            units="rad/V/s",
+        )
+        component.add_input(
+            "data:propulsion:%s:motor:torque:friction" % propulsion_id,
+            val=np.nan,
+            units="N*m",
+        )
+        component.add_input(
+            "data:propulsion:%s:motor:resistance" % propulsion_id,
+            val=np.nan,
+            units="V/A",
+        )
+        component.add_input(
+            "data:propulsion:%s:propeller:number" % propulsion_id,
+            val=np.nan,
+            units=None,
+        )
+        component.add_input(
+            "data:propulsion:%s:propeller:diameter" % propulsion_id,
+            val=np.nan,
+            units="m",
+        )
+        component.add_input(
+            "data:propulsion:%s:propeller:beta" % propulsion_id,
+            val=np.nan,
+            units=None,
+        )
+        component.add_input(
+            "data:propulsion:%s:propeller:Ct:dynamic:polynomial" % propulsion_id,
+            shape_by_conn=True,
+            val=np.nan,
+            units=None,
+        )
+        component.add_input(
+            "data:propulsion:%s:propeller:Cp:dynamic:polynomial" % propulsion_id,
+            shape_by_conn=True,
+            val=np.nan,
+            units=None,
+        )
+        if propulsion_id == MR_PROPULSION:
+            component.add_input("data:aerodynamics:%s:CD0" % propulsion_id, val=np.nan, units=None)
+            component.add_input("data:geometry:projected_area:front", val=np.nan, units="m**2")
+            component.add_input("data:geometry:projected_area:top", val=np.nan, units="m**2")
+        elif propulsion_id == FW_PROPULSION:
+            component.add_input("data:aerodynamics:CD0", val=np.nan, units=None)
+            component.add_input("data:aerodynamics:CDi:K", val=np.nan, units=None)
+            component.add_input("data:geometry:wing:surface", val=np.nan, units="m**2")
+
+    @staticmethod
+    def set_uav_parameters(flight_model, inputs, propulsion_id):
+        """
+        Sets the UAV parameters of a flight performance model from the inputs added by add_uav_inputs.
+
+        :param flight_model: FlightPerformanceModel or BatchFlightPerformanceModel
+        :param inputs: inputs of the component
+        :param propulsion_id: propulsion system identifier
+        """
+        flight_model.battery_voltage = inputs["data:propulsion:%s:battery:voltage" % propulsion_id]
+        flight_model.esc_efficiency = inputs["data:propulsion:%s:esc:efficiency" % propulsion_id]
+        flight_model.gearbox_ratio = inputs["data:propulsion:%s:gearbox:N_red" % propulsion_id]
+        flight_model.motor_speed_constant = inputs[
+            "data:propulsion:%s:motor:speed:constant" % propulsion_id
+        ]
+        flight_model.motor_torque_friction = inputs[
+            "data:propulsion:%s:motor:torque:friction" % propulsion_id
+        ]
+        flight_model.motor_resistance = inputs[
+            "data:propulsion:%s:motor:resistance" % propulsion_id
+        ]
+        flight_model.propeller_number = inputs[
+            "data:propulsion:%s:propeller:number" % propulsion_id
+        ]
+        flight_model.propeller_diameter = inputs[
+            "data:propulsion:%s:propeller:diameter" % propulsion_id
+        ]
+        flight_model.propeller_beta = inputs["data:propulsion:%s:propeller:beta" % propulsion_id]
+        flight_model.propeller_ct_model = inputs[
+            "data:propulsion:%s:propeller:Ct:dynamic:polynomial" % propulsion_id
+        ]
+        flight_model.propeller_cp_model = inputs[
+            "data:propulsion:%s:propeller:Cp:dynamic:polynomial" % propulsion_id
+        ]
+
+        if propulsion_id == MR_PROPULSION:
+            flight_model.mr_parasitic_drag_coef = inputs["data:aerodynamics:%s:CD0" % propulsion_id]
+            flight_model.mr_area_front = inputs["data:geometry:projected_area:front"]
+            flight_model.mr_area_top = inputs["data:geometry:projected_area:top"]
+
+        elif propulsion_id == FW_PROPULSION:
+            flight_model.fw_induced_drag_constant = inputs["data:aerodynamics:CDi:K"]
+            flight_model.fw_parasitic_drag_coef = inputs["data:aerodynamics:CD0"]
+            flight_model.wing_area = inputs["data:geometry:wing:surface"]
@@ -32,6 +32,7 @@ class RouteBuilder(om.Group):
         self.options.declare("is_sizing", default=False, types=bool)
         self.options.declare("route_name", default=None, types=str)
         self.options.declare("route_definition", default=None, types=dict)
+        self.options.declare("n_segments", default=1, types=int, lower=1)
 
     def setup(self):
         mission_name = self.options["mission_name"]
@@ -60,6 +61,7 @@ class RouteBuilder(om.Group):
                         route_name=route_name,
                         phase_name=phase_name,
                         propulsion_id=propulsion_id,
+                        n_segments=self.options["n_segments"],
                     ),
                     promotes=["*"],
                 )
@@ -101,6 +103,19 @@ class RouteBuilder(om.Group):
             propulsion_id = None
         return part_name, propulsion_id
 
+    @staticmethod
+    def get_phases_dict(route_definition):
+        """
+        Gets the phases names (e.g. "climb") of the route, with the propulsion identifiers used to complete them.
+        """
+        phases_dict = {}
+        for phase_definition in route_definition.values():
+            phase_id = phase_definition[PHASE_ID_TAG]
+            phase_name, propulsion_id = RouteBuilder.get_part_attributes(phase_id)
+            if phase_name is not None:
+                phases_dict[phase_name] = propulsion_id
+        return phases_dict
+
     @staticmethod
     def get_propulsion_id_list(route_definition):
         """
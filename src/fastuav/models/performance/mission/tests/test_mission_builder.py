@@ -0,0 +1,192 @@
+"""
+Tests of the mission builder: compact mode and discretization of the climb phases.
+"""
+
+import os.path as pth
+
+import fastoad.api as oad
+import numpy as np
+import pytest
+import yaml
+
+from fastuav.tests.test_convergence_specs import _make_configuration
+
+DATA_FOLDER_PATH = pth.join(
+    pth.dirname(pth.abspath(__file__)), "..", "..", "..", "..", "notebooks", "data"
+)
+
+# Off-design mission of each architecture, flown after the sizing mission
+MISSIONS = {
+    "multirotor": """
+routes:
+  main_route:
+    climb_part:
+      phase_id: multirotor_climb
+    hover_part:
+      phase_id: hover
+    cruise_part:
+      phase_id: multirotor_cruise
+missions:
+  sizing:
+    parts:
+      - route: main_route
+  operational:
+    parts:
+      - route: main_route
+""",
+    "hybrid": """
+routes:
+  main_route:
+    climb_part:
+      phase_id: multirotor_climb
+    hover_part:
+      phase_id: hover
+    cruise_part:
+      phase_id: fixedwing_cruise
+  diversion:
+    climb_part:
+      phase_id: fixedwing_climb
+    cruise_part:
+      phase_id: fixedwing_cruise
+missions:
+  sizing:
+    parts:
+      - route: main_route
+  operational:
+    parts:
+      - route: main_route
+      - route: diversion
+""",
+}
+
+# Inputs of the routes of the off-design mission
+ROUTE_INPUTS = {
+    "payload:mass": (3.0, "kg"),
+    "takeoff:altitude": (0.0, "m"),
+    "cruise:altitude": (150.0, "m"),
+    "climb:rate": (3.0, "m/s"),
+    "climb:speed": (12.0, "m/s"),
+    "cruise:distance": (5.0, "km"),
+    "cruise:speed": (15.0, "m/s"),
+    "hover:duration": (5.0, "min"),
+    "payload:power": (10.0, "W"),
+}
+
+
+@pytest.fixture(scope="module")
+def uav_data(tmp_path_factory):
+    """
+    Files of the data of the UAV of each architecture (sizing mission and propulsion systems).
+    """
+    hybrid_problem = oad.evaluate_problem(
+        _make_configuration("hybrid", {}, str(tmp_path_factory.mktemp("hybrid"))), overwrite=True
+    )
+    return {
+        "multirotor": pth.join(
+            DATA_FOLDER_PATH, "source_files", "problem_outputs_DJI_M600_mdo.xml"
+        ),
+        "hybrid": hybrid_problem.output_file_path,
+    }
+
+
+def _mission_problem(architecture, uav_data, tmp_path, **options):
+    """
+    :return: problem of the missions of an architecture, run with the given MissionBuilder options
+    """
+    mission_path = tmp_path / "missions.yaml"
+    mission_path.write_text(MISSIONS[architecture])
+    conf = {
+        "input_file": str(tmp_path / "problem_inputs.xml"),
+        "output_file": str(tmp_path / "problem_outputs.xml"),
+        "model": {
+            "missions": dict(
+                id="fastuav.performance.mission", file_path=str(mission_path), **options
+            )
+        },
+    }
+    conf_path = tmp_path / "configuration.yaml"
+    with open(conf_path, "w") as file:
+        yaml.safe_dump(conf, file)
+
+    # inputs of the UAV, and of the routes of the off-design mission
+    oad.generate_inputs(str(conf_path), uav_data[architecture], overwrite=True)
+    inputs = oad.DataFile(conf["input_file"])
+    for variable in inputs:
+        if variable.name == "mission:operational:dISA":
+            variable.value, variable.units = 5.0, "K"
+        elif variable.name.startswith("mission:operational:"):
+            suffix = next(suffix for suffix in ROUTE_INPUTS if variable.name.endswith(suffix))
+            variable.value, variable.units = ROUTE_INPUTS[suffix]
+    inputs.save()
+
+    prob = oad.FASTOADProblemConfigurator(str(conf_path)).get_problem(read_inputs=True)
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+def _outputs(prob):
+    return {
+        meta["prom_name"]: meta["val"]
+        for _, meta in prob.model.list_outputs(out_stream=None, prom_name=True)
+    }
+
+
+@pytest.mark.parametrize("architecture", list(MISSIONS))
+@pytest.mark.parametrize("n_segments", [1, 4])
+def test_compact_mission(architecture, n_segments, uav_data, tmp_path):
+    prob_ref = _mission_problem(architecture, uav_data, tmp_path, n_segments=n_segments)
+    prob = _mission_problem(architecture, uav_data, tmp_path, n_segments=n_segments, compact=True)
+
+    outputs_ref = _outputs(prob_ref)
+    outputs = _outputs(prob)
+    assert outputs.keys() == outputs_ref.keys()
+    assert outputs["mission:operational:energy"] > 0.0
+    for name, value in outputs.items():
+        np.testing.assert_allclose(value, outputs_ref[name], rtol=1e-12, err_msg=name)
+
+    # the dependencies declared by the compact component are those of the route components
+    # (derivatives are computed by finite differences with different steps)
+    of = ["mission:operational:energy", "mission:operational:duration"]
+    wrt = [
+        "data:weight:mtow",
+        "data:propulsion:multirotor:propeller:diameter",
+        "mission:operational:main_route:cruise:distance",
+    ]
+    if architecture == "hybrid":
+        wrt += [
+            "data:propulsion:fixedwing:propeller:diameter",
+            "mission:operational:diversion:climb:speed",
+        ]
+    totals_ref = prob_ref.compute_totals(of, wrt)
+    totals = prob.compute_totals(of, wrt)
+    for key, value in totals.items():
+        np.testing.assert_allclose(value, totals_ref[key], rtol=1e-4, err_msg=key)
+
+
+def test_climb_segments(uav_data, tmp_path):
+    energies = {}
+    for n_segments in [1, 2, 4, 8, 16]:
+        prob = _mission_problem("multirotor", uav_data, tmp_path, n_segments=n_segments)
+        energies[n_segments] = {
+            phase_name: prob.get_val(
+                "mission:operational:main_route:%s:energy" % phase_name, units="kJ"
+            )[0]
+            for phase_name in ["climb", "hover", "cruise"]
+        }
+
+    # a single segment is the former single flight point at cruise altitude
+    assert energies[1] == pytest.approx(
+        {"climb": 97.28234265631077, "hover": 453.4955439961618, "cruise": 517.7378475544876},
+        rel=1e-9,
+    )
+
+    # second-order convergence of the trapezoidal rule on the climb phase
+    climb = np.array([energies[n_segments]["climb"] for n_segments in [2, 4, 8, 16]])
+    ratios = -np.diff(climb)[:-1] / -np.diff(climb)[1:]
+    assert ratios == pytest.approx(4.0, rel=0.1)
+
+    # the other phases are flown at constant altitude
+    for n_segments in [2, 4, 8, 16]:
+        assert energies[n_segments]["hover"] == energies[1]["hover"]
+        assert energies[n_segments]["cruise"] == energies[1]["cruise"]
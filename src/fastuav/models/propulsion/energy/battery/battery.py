@@ -26,13 +26,23 @@ class Battery(om.Group):
 
     def initialize(self):
         self.options.declare("off_the_shelf", default=False, types=bool)
+        self.options.declare(
+            "catalogue_path",
+            default=None,
+            types=str,
+            allow_none=True,
+            desc="Path to a custom catalogue (CSV file). The default catalogue is used if None.",
+        )
 
     def setup(self):
         self.add_subsystem("definition_parameters", BatteryDefinitionParameters(), promotes=["*"])
         self.add_subsystem("estimation_models", BatteryEstimationModels(), promotes=["*"])
+        catalogue_selection = BatteryCatalogueSelection(off_the_shelf=self.options["off_the_shelf"])
+        if self.options["catalogue_path"] is not None:
+            catalogue_selection.options["catalogue_path"] = self.options["catalogue_path"]
         self.add_subsystem(
             "catalogue_selection" if self.options["off_the_shelf"] else "skip_catalogue_selection",
-            BatteryCatalogueSelection(off_the_shelf=self.options["off_the_shelf"]),
+            catalogue_selection,
             promotes=["*"],
         )
         self.add_subsystem("performance_analysis", BatteryPerformanceGroup(), promotes=["*"])
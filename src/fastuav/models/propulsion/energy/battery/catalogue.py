@@ -2,14 +2,14 @@
 Off-the-shelf Battery selection.
 """
 
+import functools
 import os.path as pth
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
 from fastoad.openmdao.validity_checker import ValidityDomainChecker
 
-from fastuav.utils.catalogues.estimators import NearestNeighbor
+from fastuav.utils.catalogues.registry import catalogue_estimator, load_catalogue
 
 # Database import
 PATH = pth.join(
@@ -24,21 +24,29 @@ PATH = pth.join(
     "Batteries",
     "Non-Dominated-Augmented-Batteries.csv",
 )
-DF = pd.read_csv(PATH, sep=";")
 
 
-@ValidityDomainChecker(
-    {
-        "data:propulsion:battery:voltage:estimated": (
-            DF["Voltage_V"].min(),
-            DF["Voltage_V"].max(),
-        ),
-        "data:propulsion:battery:capacity:estimated": (
-            DF["Capacity_As"].min(),
-            DF["Capacity_As"].max(),
-        ),
-    },
-)
+@functools.lru_cache(maxsize=None)
+def _validity_domain_checker(catalogue_path: str) -> ValidityDomainChecker:
+    """
+    :param catalogue_path: path to the catalogue (CSV file)
+    :return: checker of the validity domain of the battery selection, i.e. the range of the catalogue
+    """
+    df = load_catalogue(catalogue_path)
+    return ValidityDomainChecker(
+        {
+            "data:propulsion:battery:voltage:estimated": (
+                df["Voltage_V"].min(),
+                df["Voltage_V"].max(),
+            ),
+            "data:propulsion:battery:capacity:estimated": (
+                df["Capacity_As"].min(),
+                df["Capacity_As"].max(),
+            ),
+        },
+    )
+
+
 class BatteryCatalogueSelection(om.ExplicitComponent):
     """
     Battery selection and component's parameters assignment:
@@ -49,19 +57,29 @@ class BatteryCatalogueSelection(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare("off_the_shelf", default=False, types=bool)
+        self.options.declare(
+            "catalogue_path", default=PATH, types=str, desc="Path to the catalogue (CSV file)"
+        )
+
+    def _estimator(self):
+        """
+        :return: nearest neighbor estimator of the catalogue, loaded and trained on first use
+        """
         C_bat_selection = "next"
         U_bat_selection = "next"
         # E_bat_selection = 'next'
-        self._clf = NearestNeighbor(
-            df=DF,
+        # return catalogue_estimator(self.options["catalogue_path"], X_names=['Voltage_V', 'Energy_kJ'],
+        #                            crits=[U_bat_selection, E_bat_selection])
+        return catalogue_estimator(
+            self.options["catalogue_path"],
             X_names=["Voltage_V", "Capacity_As"],
             crits=[U_bat_selection, C_bat_selection],
         )
-        # self._clf = NearestNeighbor(df=DF, X_names=['Voltage_V', 'Energy_kJ'],
-        #                             crits=[U_bat_selection, E_bat_selection])
-        self._clf.train()
 
     def setup(self):
+        # validity domain of the catalogue in use, loaded on first setup
+        _validity_domain_checker(self.options["catalogue_path"])(self)
+
         # inputs: estimated values
         self.add_input(
             "data:propulsion:battery:cell:number:series:estimated",
@@ -173,6 +191,50 @@ class BatteryCatalogueSelection(om.ExplicitComponent):
             val=1.0,
         )
 
+    def catalogue_outputs(self, indices):
+        """
+        Catalogue values of the selected products.
+
+        :param indices: positions of the products in the catalogue (see NearestNeighbor.predict2_many)
+        :return: dict of the values of the catalogue outputs, with one value per product
+        """
+        df_y = load_catalogue(self.options["catalogue_path"]).iloc[np.asarray(indices)]
+        U_bat = df_y["Voltage_V"].to_numpy()  # battery pack voltage [V]
+        C_bat = df_y["Capacity_As"].to_numpy()  # battery pack capacity [A*s]
+        m_bat = df_y["Weight_kg"].to_numpy()  # battery pack weight [kg]
+        Vol_bat = df_y["Volume_cm3"].to_numpy()  # battery pack volume [cm3]
+        I_bat_max = df_y["Imax_A"].to_numpy()  # max current [A]
+        N_series = df_y[
+            "n_series"
+        ].to_numpy()  # number of series connections to ensure sufficient voltage
+        N_parallel = df_y["n_parallel"].to_numpy()  # number of parallel connections
+        N_cell = N_series * N_parallel  # number of cells
+        P_bat = U_bat * I_bat_max  # battery power [W]
+        E_bat = df_y["Energy_kJ"].to_numpy()  # C_bat * U_bat / 1000  # stored energy [kJ]
+        return {
+            "data:propulsion:battery:cell:number:catalogue": N_cell,
+            "data:propulsion:battery:cell:number:series:catalogue": N_series,
+            "data:propulsion:battery:cell:number:parallel:catalogue": N_parallel,
+            "data:propulsion:battery:voltage:catalogue": U_bat,
+            "data:propulsion:battery:capacity:catalogue": C_bat,
+            "data:propulsion:battery:power:max:catalogue": P_bat,
+            "data:propulsion:battery:energy:catalogue": E_bat,
+            "data:propulsion:battery:current:max:catalogue": I_bat_max,
+            "data:weight:propulsion:battery:mass:catalogue": m_bat,
+            "data:propulsion:battery:cell:voltage:catalogue": U_bat / N_series,
+            "data:propulsion:battery:volume:catalogue": Vol_bat,
+        }
+
+    def select_many(self, X):
+        """
+        Selects the closest products for many designs at once, e.g. to turn the designs of a DoE
+        into parts lists.
+
+        :param X: (N, 2) array of the estimated voltages [V] and capacities [A*s]
+        :return: dict of the values of the catalogue outputs, with one value per design
+        """
+        return self.catalogue_outputs(self._estimator().predict2_many(X))
+
     def compute(self, inputs, outputs):
         # OFF-THE-SHELF COMPONENTS SELECTION
         if self.options["off_the_shelf"]:
@@ -182,55 +244,12 @@ class BatteryCatalogueSelection(om.ExplicitComponent):
             # E_bat_opt = inputs['data:propulsion:battery:energy:estimated']  # [kJ]
 
             # Get closest product
-            df_y = self._clf.predict2([U_bat_opt, C_bat_opt])
-            # df_y = self._clf.predict2([U_bat_opt, E_bat_opt])
-            U_bat = df_y["Voltage_V"].iloc[0]  # battery pack voltage [V]
-            C_bat = df_y["Capacity_As"].iloc[0]  # battery pack capacity [A*s]
-            m_bat = df_y["Weight_kg"].iloc[0]  # battery pack weight [kg]
-            Vol_bat = df_y["Volume_cm3"].iloc[0]  # battery pack volume [cm3]
-            I_bat_max = df_y["Imax_A"].iloc[0]  # max current [A]
-            N_series = df_y["n_series"].iloc[
-                0
-            ]  # number of series connections to ensure sufficient voltage
-            N_parallel = df_y["n_parallel"].iloc[0]  # number of parallel connections
-            N_cell = N_series * N_parallel  # number of cells
-            P_bat = U_bat * I_bat_max  # battery power [W]
-            E_bat = df_y["Energy_kJ"].iloc[0]  # C_bat * U_bat / 1000  # stored energy [kJ]
+            index = self._estimator().predict2_index([U_bat_opt, C_bat_opt])
+            # index = self._estimator().predict2_index([U_bat_opt, E_bat_opt])
 
             # Outputs
-            outputs["data:propulsion:battery:cell:number"] = outputs[
-                "data:propulsion:battery:cell:number:catalogue"
-            ] = N_cell
-            outputs["data:propulsion:battery:cell:number:series"] = outputs[
-                "data:propulsion:battery:cell:number:series:catalogue"
-            ] = N_series
-            outputs["data:propulsion:battery:cell:number:parallel"] = outputs[
-                "data:propulsion:battery:cell:number:parallel:catalogue"
-            ] = N_parallel
-            outputs["data:propulsion:battery:voltage"] = outputs[
-                "data:propulsion:battery:voltage:catalogue"
-            ] = U_bat
-            outputs["data:propulsion:battery:capacity"] = outputs[
-                "data:propulsion:battery:capacity:catalogue"
-            ] = C_bat
-            outputs["data:propulsion:battery:power:max"] = outputs[
-                "data:propulsion:battery:power:max:catalogue"
-            ] = P_bat
-            outputs["data:propulsion:battery:energy"] = outputs[
-                "data:propulsion:battery:energy:catalogue"
-            ] = E_bat
-            outputs["data:propulsion:battery:current:max"] = outputs[
-                "data:propulsion:battery:current:max:catalogue"
-            ] = I_bat_max
-            outputs["data:weight:propulsion:battery:mass"] = outputs[
-                "data:weight:propulsion:battery:mass:catalogue"
-            ] = m_bat
-            outputs["data:propulsion:battery:cell:voltage"] = outputs[
-                "data:propulsion:battery:cell:voltage:catalogue"
-            ] = U_bat / N_series
-            outputs["data:propulsion:battery:volume"] = outputs[
-                "data:propulsion:battery:volume:catalogue"
-            ] = Vol_bat
+            for name, value in self.catalogue_outputs([index]).items():
+                outputs[name.replace(":catalogue", "")] = outputs[name] = value[0]
             outputs["data:propulsion:battery:DoD:max"] = inputs[
                 "data:propulsion:battery:DoD:max:estimated"
             ]
@@ -2,14 +2,14 @@
 Off-the-shelf ESC selection.
 """
 
+import functools
 import os.path as pth
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
 from fastoad.openmdao.validity_checker import ValidityDomainChecker
 
-from fastuav.utils.catalogues.estimators import NearestNeighbor
+from fastuav.utils.catalogues.registry import catalogue_estimator, load_catalogue
 
 PATH = pth.join(
     pth.dirname(pth.abspath(__file__)),
@@ -22,21 +22,23 @@ PATH = pth.join(
     "ESC",
     "Non-Dominated-ESC.csv",
 )
-DF = pd.read_csv(PATH, sep=";")
-
-
-@ValidityDomainChecker(
-    {
-        "data:propulsion:esc:power:max:estimated": (
-            DF["Pmax_W"].min(),
-            DF["Pmax_W"].max(),
-        ),
-        "data:propulsion:esc:voltage:estimated": (
-            DF["Vmax_V"].min(),
-            DF["Vmax_V"].max(),
-        ),
-    },
-)
+
+
+@functools.lru_cache(maxsize=None)
+def _validity_domain_checker(catalogue_path: str) -> ValidityDomainChecker:
+    """
+    :param catalogue_path: path to the catalogue (CSV file)
+    :return: checker of the validity domain of the ESC selection, i.e. the range of the catalogue
+    """
+    df = load_catalogue(catalogue_path)
+    return ValidityDomainChecker(
+        {
+            "data:propulsion:esc:power:max:estimated": (df["Pmax_W"].min(), df["Pmax_W"].max()),
+            "data:propulsion:esc:voltage:estimated": (df["Vmax_V"].min(), df["Vmax_V"].max()),
+        },
+    )
+
+
 class ESCCatalogueSelection(om.ExplicitComponent):
     def initialize(self):
         """
@@ -46,14 +48,26 @@ class ESCCatalogueSelection(om.ExplicitComponent):
             - Otherwise, the previously estimated parameters are kept to describe the component.
         """
         self.options.declare("off_the_shelf", default=False, types=bool)
+        self.options.declare(
+            "catalogue_path", default=PATH, types=str, desc="Path to the catalogue (CSV file)"
+        )
+
+    def _estimator(self):
+        """
+        :return: nearest neighbor estimator of the catalogue, loaded and trained on first use
+        """
         Pmax_selection = "next"
         Vmax_selection = "next"
-        self._clf = NearestNeighbor(
-            df=DF, X_names=["Pmax_W", "Vmax_V"], crits=[Pmax_selection, Vmax_selection]
+        return catalogue_estimator(
+            self.options["catalogue_path"],
+            X_names=["Pmax_W", "Vmax_V"],
+            crits=[Pmax_selection, Vmax_selection],
         )
-        self._clf.train()
 
     def setup(self):
+        # validity domain of the catalogue in use, loaded on first setup
+        _validity_domain_checker(self.options["catalogue_path"])(self)
+
         # inputs: estimated values
         self.add_input("data:propulsion:esc:power:max:estimated", val=np.nan, units="W")
         self.add_input("data:propulsion:esc:voltage:estimated", val=np.nan, units="V")
@@ -93,6 +107,33 @@ class ESCCatalogueSelection(om.ExplicitComponent):
             val=1.0,
         )
 
+    def catalogue_outputs(self, indices):
+        """
+        Catalogue values of the selected products.
+
+        :param indices: positions of the products in the catalogue (see NearestNeighbor.predict_many)
+        :return: dict of the values of the catalogue outputs, with one value per product
+        """
+        df_y = load_catalogue(self.options["catalogue_path"]).iloc[np.asarray(indices)]
+        P_esc = df_y["Pmax_W"].to_numpy()  # [W] ESC power
+        U_esc = df_y["Vmax_V"].to_numpy()  # [V] ESC voltage
+        m_esc = df_y["Weight_g"].to_numpy() / 1000  # [kg] ESC mass
+        return {
+            "data:propulsion:esc:power:max:catalogue": P_esc,
+            "data:propulsion:esc:voltage:catalogue": U_esc,
+            "data:weight:propulsion:esc:mass:catalogue": m_esc,
+        }
+
+    def select_many(self, X):
+        """
+        Selects the closest products for many designs at once, e.g. to turn the designs of a DoE
+        into parts lists.
+
+        :param X: (N, 2) array of the estimated max powers [W] and voltages [V]
+        :return: dict of the values of the catalogue outputs, with one value per design
+        """
+        return self.catalogue_outputs(self._estimator().predict_many(X))
+
     def compute(self, inputs, outputs):
         """
         This method evaluates the decision tree
@@ -105,21 +146,11 @@ class ESCCatalogueSelection(om.ExplicitComponent):
             U_esc_opt = inputs["data:propulsion:esc:voltage:estimated"]
 
             # Get closest product
-            df_y = self._clf.predict([P_esc_opt, U_esc_opt])
-            P_esc = df_y["Pmax_W"].iloc[0]  # [W] ESC power
-            U_esc = df_y["Vmax_V"].iloc[0]  # [V] ESC voltage
-            m_esc = df_y["Weight_g"].iloc[0] / 1000  # [kg] ESC mass
+            index = self._estimator().predict_index([P_esc_opt, U_esc_opt])
 
             # Outputs
-            outputs["data:propulsion:esc:power:max"] = outputs[
-                "data:propulsion:esc:power:max:catalogue"
-            ] = P_esc
-            outputs["data:propulsion:esc:voltage"] = outputs[
-                "data:propulsion:esc:voltage:catalogue"
-            ] = U_esc
-            outputs["data:weight:propulsion:esc:mass"] = outputs[
-                "data:weight:propulsion:esc:mass:catalogue"
-            ] = m_esc
+            for name, value in self.catalogue_outputs([index]).items():
+                outputs[name.replace(":catalogue", "")] = outputs[name] = value[0]
             outputs["data:propulsion:esc:efficiency"] = inputs[
                 "data:propulsion:esc:efficiency:estimated"
             ]
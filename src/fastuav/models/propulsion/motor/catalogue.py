@@ -2,14 +2,14 @@
 Off-the-shelf motor selection.
 """
 
+import functools
 import os.path as pth
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
 from fastoad.openmdao.validity_checker import ValidityDomainChecker
 
-from fastuav.utils.catalogues.estimators import NearestNeighbor
+from fastuav.utils.catalogues.registry import catalogue_estimator, load_catalogue
 
 PATH = pth.join(
     pth.dirname(pth.abspath(__file__)),
@@ -22,21 +22,29 @@ PATH = pth.join(
     "Motors",
     "Non-Dominated-Motors.csv",
 )
-DF = pd.read_csv(PATH, sep=";")
-
-
-@ValidityDomainChecker(
-    {
-        "data:propulsion:motor:torque:max:estimated": (
-            DF["Tmax_Nm"].min(),
-            DF["Tmax_Nm"].max(),
-        ),
-        "data:propulsion:motor:speed:constant:estimated": (
-            DF["Kv_SI"].min(),
-            DF["Kv_SI"].max(),
-        ),
-    },
-)
+
+
+@functools.lru_cache(maxsize=None)
+def _validity_domain_checker(catalogue_path: str) -> ValidityDomainChecker:
+    """
+    :param catalogue_path: path to the catalogue (CSV file)
+    :return: checker of the validity domain of the motor selection, i.e. the range of the catalogue
+    """
+    df = load_catalogue(catalogue_path)
+    return ValidityDomainChecker(
+        {
+            "data:propulsion:motor:torque:max:estimated": (
+                df["Tmax_Nm"].min(),
+                df["Tmax_Nm"].max(),
+            ),
+            "data:propulsion:motor:speed:constant:estimated": (
+                df["Kv_SI"].min(),
+                df["Kv_SI"].max(),
+            ),
+        },
+    )
+
+
 class MotorCatalogueSelection(om.ExplicitComponent):
     def initialize(self):
         """
@@ -46,14 +54,26 @@ class MotorCatalogueSelection(om.ExplicitComponent):
             - Otherwise, the previously estimated parameters are kept to describe the component.
         """
         self.options.declare("off_the_shelf", default=False, types=bool)
+        self.options.declare(
+            "catalogue_path", default=PATH, types=str, desc="Path to the catalogue (CSV file)"
+        )
+
+    def _estimator(self):
+        """
+        :return: nearest neighbor estimator of the catalogue, loaded and trained on first use
+        """
         T_selection = "next"
         Kv_selection = "average"
-        self._clf = NearestNeighbor(
-            df=DF, X_names=["Tmax_Nm", "Kv_SI"], crits=[T_selection, Kv_selection]
+        return catalogue_estimator(
+            self.options["catalogue_path"],
+            X_names=["Tmax_Nm", "Kv_SI"],
+            crits=[T_selection, Kv_selection],
         )
-        self._clf.train()
 
     def setup(self):
+        # validity domain of the catalogue in use, loaded on first setup
+        _validity_domain_checker(self.options["catalogue_path"])(self)
+
         # inputs: estimated values
         self.add_input("data:propulsion:motor:torque:max:estimated", val=np.nan, units="N*m")
         self.add_input(
@@ -113,6 +133,39 @@ class MotorCatalogueSelection(om.ExplicitComponent):
             val=1.0,
         )
 
+    def catalogue_outputs(self, indices):
+        """
+        Catalogue values of the selected products.
+
+        :param indices: positions of the products in the catalogue (see NearestNeighbor.predict_many)
+        :return: dict of the values of the catalogue outputs, with one value per product
+        """
+        df_y = load_catalogue(self.options["catalogue_path"]).iloc[np.asarray(indices)]
+        Tmax = df_y["Tmax_Nm"].to_numpy()  # max motor torque [Nm]
+        Kv = df_y["Kv_SI"].to_numpy()  # speed constant [rad/V/s]
+        Tnom = df_y["Tnom_Nm"].to_numpy()  # nominal torque [N.m]
+        Tf = df_y["Cf_Nm"].to_numpy()  # friction torque [Nm]
+        R = df_y["R_ohm"].to_numpy()  # motor resistance [ohm]
+        m_mot = df_y["Mass_g"].to_numpy() / 1000  # motor mass [kg]
+        return {
+            "data:propulsion:motor:torque:max:catalogue": Tmax,
+            "data:propulsion:motor:speed:constant:catalogue": Kv,
+            "data:propulsion:motor:torque:nominal:catalogue": Tnom,
+            "data:propulsion:motor:torque:friction:catalogue": Tf,
+            "data:propulsion:motor:resistance:catalogue": R,
+            "data:weight:propulsion:motor:mass:catalogue": m_mot,
+        }
+
+    def select_many(self, X):
+        """
+        Selects the closest products for many designs at once, e.g. to turn the designs of a DoE
+        into parts lists.
+
+        :param X: (N, 2) array of the estimated max torques [N.m] and speed constants [rad/V/s]
+        :return: dict of the values of the catalogue outputs, with one value per design
+        """
+        return self.catalogue_outputs(self._estimator().predict_many(X))
+
     def compute(self, inputs, outputs):
         """
         This method evaluates the decision tree
@@ -126,33 +179,11 @@ class MotorCatalogueSelection(om.ExplicitComponent):
             Kv_opt = inputs["data:propulsion:motor:speed:constant:estimated"]
 
             # Get closest product
-            df_y = self._clf.predict([Tmax_opt, Kv_opt])
-            Tnom = df_y["Tnom_Nm"].iloc[0]  # nominal torque [N.m]
-            Kv = df_y["Kv_SI"].iloc[0]  # speed constant [rad/V/s]
-            R = df_y["R_ohm"].iloc[0]  # motor resistance [ohm]
-            Tmax = df_y["Tmax_Nm"].iloc[0]  # max motor torque [Nm]
-            m_mot = df_y["Mass_g"].iloc[0] / 1000  # motor mass [kg]
-            Tf = df_y["Cf_Nm"].iloc[0]  # friction torque [Nm]
+            index = self._estimator().predict_index([Tmax_opt, Kv_opt])
 
             # Outputs
-            outputs["data:propulsion:motor:torque:max"] = outputs[
-                "data:propulsion:motor:torque:max:catalogue"
-            ] = Tmax
-            outputs["data:propulsion:motor:speed:constant"] = outputs[
-                "data:propulsion:motor:speed:constant:catalogue"
-            ] = Kv
-            outputs["data:propulsion:motor:torque:nominal"] = outputs[
-                "data:propulsion:motor:torque:nominal:catalogue"
-            ] = Tnom
-            outputs["data:propulsion:motor:torque:friction"] = outputs[
-                "data:propulsion:motor:torque:friction:catalogue"
-            ] = Tf
-            outputs["data:propulsion:motor:resistance"] = outputs[
-                "data:propulsion:motor:resistance:catalogue"
-            ] = R
-            outputs["data:weight:propulsion:motor:mass"] = outputs[
-                "data:weight:propulsion:motor:mass:catalogue"
-            ] = m_mot
+            for name, value in self.catalogue_outputs([index]).items():
+                outputs[name.replace(":catalogue", "")] = outputs[name] = value[0]
 
         # CUSTOM COMPONENTS (no change)
         else:
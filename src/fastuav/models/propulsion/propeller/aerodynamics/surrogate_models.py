@@ -6,6 +6,11 @@ import numpy as np
 
 # from scipy.optimize import fsolve
 
+# Exponents of beta (first column) and J (second column) in each term of the axial polynomial models
+AXIAL_MONOMIALS = np.array(
+    [[0, 0], [1, 0], [2, 0], [3, 0], [0, 1], [0, 2], [0, 3], [1, 1], [2, 1], [1, 2]]
+)
+
 
 class PropellerAerodynamicsModel:
     """
@@ -20,8 +25,58 @@ class PropellerAerodynamicsModel:
 
     The functions are defined as static method that can be called from anywhere without instantiating the class:
     >> c_t, c_p = PropellerAerodynamicsModel.aero_coefficients_incidence(beta, J, alpha)
+
+    The operating conditions (beta, J, alpha) can be scalars or arrays, which are broadcast together
+    so that many operating points (e.g. a propeller map) are evaluated in a single call.
     """
 
+    @staticmethod
+    def axial_monomial_basis(beta, J):
+        """
+        Monomial basis of the axial polynomial models, i.e. the terms
+        [1, beta, beta**2, beta**3, J, J**2, J**3, beta * J, beta**2 * J, beta * J**2].
+
+        Parameters
+        ----------
+        beta: pitch-to-diameter ratio (-)
+        J: advance ratio V/nD (-)
+
+        Returns
+        -------
+        basis: array of shape broadcast(beta, J).shape + (10,)
+        """
+        beta, J = np.broadcast_arrays(beta, J)
+        beta_powers = np.stack((np.ones_like(beta), beta, beta**2, beta**3), axis=-1)
+        J_powers = np.stack((np.ones_like(J), J, J**2, J**3), axis=-1)
+        return beta_powers[..., AXIAL_MONOMIALS[:, 0]] * J_powers[..., AXIAL_MONOMIALS[:, 1]]
+
+    @staticmethod
+    def axial_monomial_basis_partials(beta, J):
+        """
+        Partial derivatives of the monomial basis of the axial polynomial models
+        (see axial_monomial_basis).
+
+        Parameters
+        ----------
+        beta: pitch-to-diameter ratio (-)
+        J: advance ratio V/nD (-)
+
+        Returns
+        -------
+        basis_beta: derivatives of the basis with respect to beta
+        basis_J: derivatives of the basis with respect to J
+        """
+        beta, J = np.broadcast_arrays(beta, J)
+        zeros, ones = np.zeros_like(beta, dtype=float), np.ones_like(beta, dtype=float)
+        beta_powers = np.stack((ones, beta, beta**2, beta**3), axis=-1)
+        J_powers = np.stack((ones, J, J**2, J**3), axis=-1)
+        beta_powers_partials = np.stack((zeros, ones, 2 * beta, 3 * beta**2), axis=-1)
+        J_powers_partials = np.stack((zeros, ones, 2 * J, 3 * J**2), axis=-1)
+        i_beta, i_J = AXIAL_MONOMIALS[:, 0], AXIAL_MONOMIALS[:, 1]
+        basis_beta = beta_powers_partials[..., i_beta] * J_powers[..., i_J]
+        basis_J = beta_powers[..., i_beta] * J_powers_partials[..., i_J]
+        return basis_beta, basis_J
+
     @staticmethod
     def aero_coefficients_static(
         beta,
@@ -103,31 +158,10 @@ class PropellerAerodynamicsModel:
         c_t_axial: axial thrust coefficient (-)
         c_p_axial: axial power coefficient (-)
         """
-        c_t_axial = (
-            ct_model[0]
-            + ct_model[1] * beta
-            + ct_model[2] * beta**2
-            + ct_model[3] * beta**3
-            + ct_model[4] * J
-            + ct_model[5] * J**2
-            + ct_model[6] * J**3
-            + ct_model[7] * beta * J
-            + ct_model[8] * beta**2 * J
-            + ct_model[9] * beta * J**2
-        )
-        c_p_axial = (
-            cp_model[0]
-            + cp_model[1] * beta
-            + cp_model[2] * beta**2
-            + cp_model[3] * beta**3
-            + cp_model[4] * J
-            + cp_model[5] * J**2
-            + cp_model[6] * J**3
-            + cp_model[7] * beta * J
-            + cp_model[8] * beta**2 * J
-            + cp_model[9] * beta * J**2
-        )
-        return max(1e-10, c_t_axial), max(1e-10, c_p_axial)
+        basis = PropellerAerodynamicsModel.axial_monomial_basis(beta, J)
+        c_t_axial = basis @ ct_model
+        c_p_axial = basis @ cp_model
+        return np.maximum(1e-10, c_t_axial), np.maximum(1e-10, c_p_axial)
 
     @staticmethod
     def aero_coefficients_incidence(
@@ -259,6 +293,147 @@ class PropellerAerodynamicsModel:
         c_t = c_t_axial * eta_t
         c_p = c_p_axial * eta_p
 
-        return max(1e-10, c_t), max(
+        return np.maximum(1e-10, c_t), np.maximum(
             1e-10, c_p
         )  # set minimum value to avoid negative thrust or power
+
+    @staticmethod
+    def aero_coefficients_incidence_partials(
+        beta,
+        J,
+        alpha,
+        n_blades: int = 2,
+        chord_to_radius: float = 0.15,
+        r_norm: float = 0.75,
+        ct_model: np.array = np.array(
+            [
+                0.02791,
+                0.11867,
+                0.27334,
+                -0.28852,
+                -0.06543,
+                -0.23504,
+                0.02104,
+                0.0,
+                0.0,
+                0.18677,
+                0.197,
+                1.094,
+            ]
+        ),
+        cp_model: np.array = np.array(
+            [
+                0.01813,
+                -0.06218,
+                0.35712,
+                -0.23774,
+                0.00343,
+                -0.1235,
+                0.0,
+                0.07549,
+                0.0,
+                0.0,
+                0.286,
+                0.993,
+            ]
+        ),
+    ):
+        """
+        Partial derivatives of the thrust and power coefficients of the generalized model
+        (see aero_coefficients_incidence).
+
+        Parameters
+        ----------
+        Same as aero_coefficients_incidence.
+
+        Returns
+        -------
+        c_t_partials: dict of the derivatives of the thrust coefficient with respect to
+                      "beta", "J", "alpha" and "model" (the latter with one value per model parameter)
+        c_p_partials: dict of the derivatives of the power coefficient, with the same keys
+        """
+        sigma = n_blades * chord_to_radius / np.pi
+        return (
+            _incidence_coefficient_partials(beta, J, alpha, ct_model, sigma, r_norm),
+            _incidence_coefficient_partials(beta, J, alpha, cp_model, sigma, r_norm),
+        )
+
+
+def _incidence_coefficient_partials(beta, J, alpha, model, sigma, r_norm):
+    """
+    Partial derivatives of a coefficient (thrust or power) of the generalized model
+    with respect to beta, J, alpha and the model parameters.
+    """
+    beta, J, alpha = np.broadcast_arrays(
+        np.asarray(beta, dtype=float), np.asarray(J, dtype=float), np.asarray(alpha, dtype=float)
+    )
+    sin_alpha, cos_alpha = np.sin(alpha), np.cos(alpha)
+
+    # axial coefficient
+    J_axial = J * sin_alpha
+    basis = PropellerAerodynamicsModel.axial_monomial_basis(beta, J_axial)
+    basis_beta, basis_J = PropellerAerodynamicsModel.axial_monomial_basis_partials(beta, J_axial)
+    c_axial_raw = basis @ model[:-2]
+    c_axial = np.maximum(1e-10, c_axial_raw)
+    is_axial_active = c_axial_raw > 1e-10
+    c_axial_beta = np.where(is_axial_active, basis_beta @ model[:-2], 0.0)
+    c_axial_J_axial = np.where(is_axial_active, basis_J @ model[:-2], 0.0)
+    c_axial_model = np.where(is_axial_active[..., None], basis, 0.0)
+
+    # zero thrust (or power) advance ratio
+    J_0_axial = model[-2] + model[-1] * beta
+
+    # solidity correction factor, with tan(pitch_angle) = beta / (0.7 * pi)
+    tan_pitch = beta / 0.7 / np.pi
+    cos_pitch = 1 / np.sqrt(1 + tan_pitch**2)
+    sqrt_term = np.sqrt(1 + 2 * tan_pitch / sigma)
+    h = sigma / tan_pitch * (1 + sqrt_term)
+    h_tan = -sigma * (1 + sqrt_term) / tan_pitch**2 + 1 / (tan_pitch * sqrt_term)
+    delta = 3 / 2 * cos_pitch * (1 + h * (1 - sin_alpha))
+    delta_beta = (
+        3
+        / 2
+        * (
+            -tan_pitch * cos_pitch**3 * (1 + h * (1 - sin_alpha))
+            + cos_pitch * h_tan * (1 - sin_alpha)
+        )
+        / 0.7
+        / np.pi
+    )
+    delta_alpha = -3 / 2 * cos_pitch * h * cos_alpha
+
+    # incidence ratio eta = 1 + u**2 / 2 / w * delta
+    u = J * cos_alpha / np.pi / r_norm
+    w = 1 - J / J_0_axial * sin_alpha
+    eta = 1 + u**2 / 2 / w * delta
+    eta_u = u / w * delta
+    eta_w = -(u**2) / 2 / w**2 * delta
+    eta_delta = u**2 / 2 / w
+    u_J, u_alpha = cos_alpha / np.pi / r_norm, -J * sin_alpha / np.pi / r_norm
+    w_J, w_alpha, w_J0 = (
+        -sin_alpha / J_0_axial,
+        -J * cos_alpha / J_0_axial,
+        J * sin_alpha / J_0_axial**2,
+    )
+
+    # coefficient c = c_axial * eta
+    is_active = c_axial * eta > 1e-10
+    c_beta = c_axial_beta * eta + c_axial * (eta_delta * delta_beta + eta_w * w_J0 * model[-1])
+    c_J = c_axial_J_axial * sin_alpha * eta + c_axial * (eta_u * u_J + eta_w * w_J)
+    c_alpha = c_axial_J_axial * J * cos_alpha * eta + c_axial * (
+        eta_u * u_alpha + eta_w * w_alpha + eta_delta * delta_alpha
+    )
+    c_model = np.concatenate(
+        (
+            c_axial_model * eta[..., None],
+            (c_axial * eta_w * w_J0)[..., None],
+            (c_axial * eta_w * w_J0 * beta)[..., None],
+        ),
+        axis=-1,
+    )
+    return {
+        "beta": np.where(is_active, c_beta, 0.0),
+        "J": np.where(is_active, c_J, 0.0),
+        "alpha": np.where(is_active, c_alpha, 0.0),
+        "model": np.where(is_active[..., None], c_model, 0.0),
+    }
@@ -6,9 +6,8 @@ import os.path as pth
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
 
-from fastuav.utils.catalogues.estimators import NearestNeighbor
+from fastuav.utils.catalogues.registry import catalogue_estimator, load_catalogue
 
 PATH = pth.join(
     pth.dirname(pth.abspath(__file__)),
@@ -21,7 +20,6 @@ PATH = pth.join(
     "Propeller",
     "APC_propellers_MR.csv",
 )
-DF = pd.read_csv(PATH, sep=";")
 
 
 # @ValidityDomainChecker(
@@ -39,14 +37,21 @@ class PropellerCatalogueSelection(om.ExplicitComponent):
             - Otherwise, the previously estimated parameters are kept to describe the component.
         """
         self.options.declare("off_the_shelf", default=False, types=bool)
+        self.options.declare(
+            "catalogue_path", default=PATH, types=str, desc="Path to the catalogue (CSV file)"
+        )
+
+    def _estimator(self):
+        """
+        :return: nearest neighbor estimator of the catalogue, loaded and trained on first use
+        """
         beta_selection = "average"
         Dpro_selection = "next"
-        self._clf = NearestNeighbor(
-            df=DF,
+        return catalogue_estimator(
+            self.options["catalogue_path"],
             X_names=["Pitch (-)", "Diameter (METERS)"],
             crits=[beta_selection, Dpro_selection],
         )
-        self._clf.train()
 
     def setup(self):
         # inputs: estimated values
@@ -167,6 +172,38 @@ class PropellerCatalogueSelection(om.ExplicitComponent):
             val=1.0,
         )
 
+    def catalogue_outputs(self, indices):
+        """
+        Catalogue values of the selected products.
+
+        :param indices: positions of the products in the catalogue (see NearestNeighbor.predict_many)
+        :return: dict of the values of the catalogue outputs, with one row per product
+        """
+        df_y = load_catalogue(self.options["catalogue_path"]).iloc[np.asarray(indices)]
+        ct_static = df_y["Ct_static"].to_numpy()  # [-] static thrust coefficient
+        cp_static = df_y["Cp_static"].to_numpy()  # [-] static power coefficient
+        return {
+            "data:propulsion:propeller:beta:catalogue": df_y["Pitch (-)"].to_numpy(),
+            "data:propulsion:propeller:diameter:catalogue": df_y["Diameter (METERS)"].to_numpy(),
+            "data:weight:propulsion:propeller:mass:catalogue": df_y["Weight (KG)"].to_numpy(),
+            "data:propulsion:propeller:Ct:static:polynomial:catalogue": np.column_stack(
+                (ct_static, np.zeros_like(ct_static))
+            ),
+            "data:propulsion:propeller:Cp:static:polynomial:catalogue": np.column_stack(
+                (cp_static, np.zeros_like(cp_static))
+            ),
+        }
+
+    def select_many(self, X):
+        """
+        Selects the closest products for many designs at once, e.g. to turn the designs of a DoE
+        into parts lists.
+
+        :param X: (N, 2) array of the estimated pitch-to-diameter ratios and diameters [m]
+        :return: dict of the values of the catalogue outputs, with one row per design
+        """
+        return self.catalogue_outputs(self._estimator().predict_many(X))
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         This method evaluates the decision tree and updates aero parameters according to the new geometry
@@ -179,29 +216,11 @@ class PropellerCatalogueSelection(om.ExplicitComponent):
             Dpro_opt = inputs["data:propulsion:propeller:diameter:estimated"]
 
             # Get closest product
-            df_y = self._clf.predict([beta_opt, Dpro_opt])
-            beta = df_y["Pitch (-)"].iloc[0]  # [-] pitch-to-diameter ratio
-            Dpro = df_y["Diameter (METERS)"].iloc[0]  # [m] diameter
-            m_pro = df_y["Weight (KG)"].iloc[0]  # [kg] mass
-            ct_static = df_y["Ct_static"].iloc[0]  # [-] static thrust coefficient
-            cp_static = df_y["Cp_static"].iloc[0]  # [-] static power coefficient
+            index = self._estimator().predict_index([beta_opt, Dpro_opt])
 
             # Outputs
-            outputs["data:propulsion:propeller:beta"] = outputs[
-                "data:propulsion:propeller:beta:catalogue"
-            ] = beta
-            outputs["data:propulsion:propeller:diameter"] = outputs[
-                "data:propulsion:propeller:diameter:catalogue"
-            ] = Dpro
-            outputs["data:weight:propulsion:propeller:mass"] = outputs[
-                "data:weight:propulsion:propeller:mass:catalogue"
-            ] = m_pro
-            outputs["data:propulsion:propeller:Ct:static:polynomial"] = outputs[
-                "data:propulsion:propeller:Ct:static:polynomial:catalogue"
-            ] = np.array([ct_static, 0])
-            outputs["data:propulsion:propeller:Cp:static:polynomial"] = outputs[
-                "data:propulsion:propeller:Cp:static:polynomial:catalogue"
-            ] = np.array([cp_static, 0])
+            for name, value in self.catalogue_outputs([index]).items():
+                outputs[name.replace(":catalogue", "")] = outputs[name] = value[0]
             outputs["data:propulsion:propeller:Ct:dynamic:polynomial"] = outputs[
                 "data:propulsion:propeller:Ct:dynamic:polynomial:catalogue"
             ] = inputs[
@@ -4,7 +4,6 @@ Propeller performances
 
 import numpy as np
 import openmdao.api as om
-from scipy.optimize import fsolve
 from stdatm import AtmosphereWithPartials
 
 from fastuav.models.propulsion.propeller.aerodynamics.surrogate_models import (
@@ -38,19 +37,52 @@ class PropellerPerformanceModel:
     @staticmethod
     def induced_velocity(F_pro, D_pro, V_inf, alpha, rho_air):
         """
-        Computes the induced velocity from Glauert's model
+        Computes the induced velocity from Glauert's model.
+        The equation is solved with Newton's method, starting from the momentum theory solution
+        in axial flight. Inputs can be scalars or arrays.
         """
+        k = F_pro / (
+            2 * rho_air * np.pi * (D_pro / 2) ** 2
+        )  # [m2/s2] squared hover induced velocity
+        V_x = V_inf * np.cos(alpha)  # [m/s] airspeed component in the rotor disk plane
+        V_z = V_inf * np.sin(alpha)  # [m/s] airspeed component normal to the rotor disk
 
-        def func(x):
-            return x - F_pro / (2 * rho_air * np.pi * (D_pro / 2) ** 2) / (
-                (V_inf * np.cos(alpha)) ** 2 + (V_inf * np.sin(alpha) + x) ** 2
-            ) ** (1 / 2)
-
-        # Tight tolerance: the result is finite-differenced upstream, so the solver
-        # residual must be well below the FD step to avoid noisy/inconsistent gradients.
-        v_i = fsolve(func, x0=1, xtol=1e-12)[0]
+        v_i = -V_z / 2 + np.sqrt(V_z**2 / 4 + k)  # [m/s] momentum theory in axial flight
+        for _ in range(50):
+            r = np.maximum(np.sqrt(V_x**2 + (V_z + v_i) ** 2), 1e-12)  # [m/s] no flow at rest
+            res = v_i - k / r
+            res_v = 1 + k * (V_z + v_i) / r**3
+            step = res / res_v
+            v_i = np.maximum(v_i - step, v_i / 2)  # safeguard against overshooting below zero
+            if np.all(np.abs(step) <= 1e-12 * (1 + np.abs(v_i))):
+                break
         return v_i
 
+    @staticmethod
+    def induced_velocity_partials(v_i, F_pro, D_pro, V_inf, alpha, rho_air):
+        """
+        Computes the partial derivatives of the induced velocity v_i (see induced_velocity)
+        with respect to F_pro, D_pro, V_inf, alpha and rho_air,
+        from the implicit function theorem applied to Glauert's equation.
+        """
+        k = F_pro / (2 * rho_air * np.pi * (D_pro / 2) ** 2)
+        V_x = V_inf * np.cos(alpha)
+        V_z = V_inf * np.sin(alpha)
+        r = np.maximum(np.sqrt(V_x**2 + (V_z + v_i) ** 2), 1e-12)
+
+        res_v = 1 + k * (V_z + v_i) / r**3
+        res_k = -1 / r
+        res_r = k / r**2
+        r_V = (V_x * np.cos(alpha) + (V_z + v_i) * np.sin(alpha)) / r
+        r_alpha = (-V_x * V_inf * np.sin(alpha) + (V_z + v_i) * V_inf * np.cos(alpha)) / r
+        return {
+            "F_pro": -res_k / (2 * rho_air * np.pi * (D_pro / 2) ** 2) / res_v,
+            "D_pro": res_k * 2 * k / D_pro / res_v,
+            "V_inf": -res_r * r_V / res_v,
+            "alpha": -res_r * r_alpha / res_v,
+            "rho_air": res_k * k / rho_air / res_v,
+        }
+
     @staticmethod
     def efficiency(F_pro, W_pro, D_pro, c_p, c_t, V_inf, alpha, rho_air):
         """
@@ -161,8 +193,53 @@ class PropellerPerformance(om.ExplicitComponent):
         self.add_output("data:propulsion:propeller:power:%s" % scenario, units="W")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        for output_name, input_names in self._partials_dependencies().items():
+            self.declare_partials(output_name, input_names, method="exact")
+
+    def _partials_dependencies(self):
+        """
+        :return: dict of the inputs on which each output depends
+        """
+        scenario = self.options["scenario"]
+        input_names = [
+            "data:propulsion:propeller:diameter",
+            "data:propulsion:propeller:beta",
+            "mission:sizing:dISA",
+            "data:propulsion:propeller:thrust:%s" % scenario,
+        ]
+        if scenario == "takeoff":
+            input_names += [
+                "data:propulsion:propeller:Ct:static:polynomial",
+                "data:propulsion:propeller:Cp:static:polynomial",
+                "mission:sizing:main_route:takeoff:altitude",
+            ]
+        elif scenario == "hover":
+            input_names += [
+                "data:propulsion:propeller:Ct:static:polynomial",
+                "data:propulsion:propeller:Cp:static:polynomial",
+                "mission:sizing:main_route:cruise:altitude",
+            ]
+        else:
+            input_names += [
+                "data:propulsion:propeller:Ct:dynamic:polynomial",
+                "data:propulsion:propeller:Cp:dynamic:polynomial",
+                "mission:sizing:main_route:cruise:altitude",
+                "optimization:variables:propulsion:propeller:advance_ratio:%s" % scenario,
+                "data:propulsion:propeller:AoA:%s" % scenario,
+            ]
+
+        dependencies = {
+            "data:propulsion:propeller:speed:%s" % scenario: [
+                name for name in input_names if ":Cp:" not in name
+            ],
+            "data:propulsion:propeller:torque:%s" % scenario: input_names,
+            "data:propulsion:propeller:power:%s" % scenario: input_names,
+        }
+        if scenario in ["climb", "cruise"]:
+            dependencies["data:propulsion:propeller:efficiency:%s" % scenario] = input_names + [
+                "mission:sizing:main_route:%s:speed" % scenario
+            ]
+        return dependencies
 
     def compute(self, inputs, outputs):
         scenario = self.options["scenario"]
@@ -213,3 +290,166 @@ class PropellerPerformance(om.ExplicitComponent):
         outputs["data:propulsion:propeller:speed:%s" % scenario] = W_pro
         outputs["data:propulsion:propeller:torque:%s" % scenario] = Q_pro
         outputs["data:propulsion:propeller:power:%s" % scenario] = P_pro
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        scenario = self.options["scenario"]
+        D_pro = inputs["data:propulsion:propeller:diameter"]
+        beta = inputs["data:propulsion:propeller:beta"]
+        F_pro = inputs["data:propulsion:propeller:thrust:%s" % scenario]
+        dISA = inputs["mission:sizing:dISA"]
+        alpha = 0.0
+
+        # Aerodynamic coefficients
+        if scenario in ["takeoff", "hover"]:
+            altitude_name = (
+                "mission:sizing:main_route:takeoff:altitude"
+                if scenario == "takeoff"
+                else "mission:sizing:main_route:cruise:altitude"
+            )
+            ct_model_name = "data:propulsion:propeller:Ct:static:polynomial"
+            cp_model_name = "data:propulsion:propeller:Cp:static:polynomial"
+            ct_model = inputs[ct_model_name]
+            cp_model = inputs[cp_model_name]
+            c_t, c_p = PropellerAerodynamicsModel.aero_coefficients_static(
+                beta, ct_model=ct_model, cp_model=cp_model
+            )
+            model_partials = np.zeros_like(ct_model)
+            model_partials[:2] = [1.0, beta[0]]
+            c_t_partials = {
+                "data:propulsion:propeller:beta": ct_model[1],
+                ct_model_name: model_partials,
+            }
+            c_p_partials = {
+                "data:propulsion:propeller:beta": cp_model[1],
+                cp_model_name: model_partials,
+            }
+        else:
+            altitude_name = "mission:sizing:main_route:cruise:altitude"
+            J_name = "optimization:variables:propulsion:propeller:advance_ratio:%s" % scenario
+            alpha_name = "data:propulsion:propeller:AoA:%s" % scenario
+            ct_model_name = "data:propulsion:propeller:Ct:dynamic:polynomial"
+            cp_model_name = "data:propulsion:propeller:Cp:dynamic:polynomial"
+            J = inputs[J_name]
+            alpha = inputs[alpha_name]
+            c_t, c_p = PropellerAerodynamicsModel.aero_coefficients_incidence(
+                beta, J, alpha, ct_model=inputs[ct_model_name], cp_model=inputs[cp_model_name]
+            )
+            c_t_model_partials, c_p_model_partials = (
+                PropellerAerodynamicsModel.aero_coefficients_incidence_partials(
+                    beta, J, alpha, ct_model=inputs[ct_model_name], cp_model=inputs[cp_model_name]
+                )
+            )
+            c_t_partials = {
+                "data:propulsion:propeller:beta": c_t_model_partials["beta"],
+                J_name: c_t_model_partials["J"],
+                alpha_name: c_t_model_partials["alpha"],
+                ct_model_name: c_t_model_partials["model"],
+            }
+            c_p_partials = {
+                "data:propulsion:propeller:beta": c_p_model_partials["beta"],
+                J_name: c_p_model_partials["J"],
+                alpha_name: c_p_model_partials["alpha"],
+                cp_model_name: c_p_model_partials["model"],
+            }
+
+        # Air density
+        atm = AtmosphereWithPartials(inputs[altitude_name], dISA, altitude_in_feet=False)
+        rho_air = atm.density  # [kg/m3] Air density
+        rho_air_partials = {
+            altitude_name: atm.partial_density_altitude,
+            "mission:sizing:dISA": -rho_air / atm.temperature,  # pressure does not depend on dISA
+        }
+
+        # Speed, power and torque
+        W_pro = PropellerPerformanceModel.speed(F_pro, D_pro, c_t, rho_air)
+        n_pro = W_pro / (2 * np.pi)  # [Hz]
+        W_pro_partials = _chain(
+            (
+                W_pro / 2 / F_pro if F_pro > 0 else 0.0,
+                {"data:propulsion:propeller:thrust:%s" % scenario: 1.0},
+            ),
+            (-2 * W_pro / D_pro, {"data:propulsion:propeller:diameter": 1.0}),
+            (-W_pro / 2 / c_t, c_t_partials),
+            (-W_pro / 2 / rho_air, rho_air_partials),
+        )
+        P_pro_partials = _chain(
+            (3 * c_p * rho_air * n_pro**2 * D_pro**5 / (2 * np.pi), W_pro_partials),
+            (5 * c_p * rho_air * n_pro**3 * D_pro**4, {"data:propulsion:propeller:diameter": 1.0}),
+            (rho_air * n_pro**3 * D_pro**5, c_p_partials),
+            (c_p * n_pro**3 * D_pro**5, rho_air_partials),
+        )
+        # Q_pro = P_pro / W_pro = c_p * F_pro * D_pro / (2 * pi * c_t), which stays differentiable
+        # with respect to the thrust when the propeller is stopped (e.g. VTOL rotors in cruise)
+        Q_pro_partials = (
+            _chain(
+                (
+                    c_p * D_pro / (2 * np.pi * c_t),
+                    {"data:propulsion:propeller:thrust:%s" % scenario: 1.0},
+                ),
+                (c_p * F_pro / (2 * np.pi * c_t), {"data:propulsion:propeller:diameter": 1.0}),
+                (F_pro * D_pro / (2 * np.pi * c_t), c_p_partials),
+                (-c_p * F_pro * D_pro / (2 * np.pi * c_t**2), c_t_partials),
+            )
+            if (c_t and rho_air and D_pro)
+            else {}
+        )
+
+        # Efficiency
+        eta_partials = {}
+        if scenario in ["climb", "cruise"]:
+            V_inf_name = "mission:sizing:main_route:%s:speed" % scenario
+            V_inf = inputs[V_inf_name]
+            denom = n_pro * D_pro
+            if denom > 1e-12 and c_p > 1e-12:
+                v_i = PropellerPerformanceModel.induced_velocity(
+                    F_pro, D_pro, V_inf, alpha, rho_air
+                )
+                v_i_partials = PropellerPerformanceModel.induced_velocity_partials(
+                    v_i, F_pro, D_pro, V_inf, alpha, rho_air
+                )
+                num = V_inf * np.sin(alpha) + v_i
+                eta = num / denom * c_t / c_p
+                num_partials = _chain(
+                    (
+                        v_i_partials["F_pro"],
+                        {"data:propulsion:propeller:thrust:%s" % scenario: 1.0},
+                    ),
+                    (v_i_partials["D_pro"], {"data:propulsion:propeller:diameter": 1.0}),
+                    (np.sin(alpha) + v_i_partials["V_inf"], {V_inf_name: 1.0}),
+                    (V_inf * np.cos(alpha) + v_i_partials["alpha"], {alpha_name: 1.0}),
+                    (v_i_partials["rho_air"], rho_air_partials),
+                )
+                eta_partials = _chain(
+                    (eta / num, num_partials),
+                    (-eta / W_pro, W_pro_partials),
+                    (-eta / D_pro, {"data:propulsion:propeller:diameter": 1.0}),
+                    (eta / c_t, c_t_partials),
+                    (-eta / c_p, c_p_partials),
+                )
+
+        outputs_partials = {
+            "data:propulsion:propeller:speed:%s" % scenario: W_pro_partials,
+            "data:propulsion:propeller:torque:%s" % scenario: Q_pro_partials,
+            "data:propulsion:propeller:power:%s" % scenario: P_pro_partials,
+            "data:propulsion:propeller:efficiency:%s" % scenario: eta_partials,
+        }
+        for output_name, input_names in self._partials_dependencies().items():
+            for input_name in input_names:
+                partials[output_name, input_name] = outputs_partials[output_name].get(
+                    input_name, 0.0
+                )
+
+
+def _chain(*terms):
+    """
+    Chain rule: sums the partial derivatives of intermediate variables, weighted by factors.
+
+    :param terms: tuples (factor, partials), with partials a dict of the derivatives of an
+                  intermediate variable with respect to the inputs
+    :return: dict of the derivatives with respect to the inputs
+    """
+    chained = {}
+    for factor, term_partials in terms:
+        for name, value in term_partials.items():
+            chained[name] = chained.get(name, 0.0) + factor * value
+    return chained
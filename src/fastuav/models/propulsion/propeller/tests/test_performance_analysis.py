@@ -0,0 +1,77 @@
+"""
+Tests of the propeller performance models and of their analytic derivatives.
+"""
+
+import numpy as np
+import openmdao.api as om
+import pytest
+from openmdao.utils.assert_utils import assert_check_partials
+from scipy.optimize import fsolve
+
+from fastuav.models.propulsion.propeller.performance_analysis import (
+    PropellerPerformance,
+    PropellerPerformanceModel,
+)
+
+CT_DYNAMIC = [0.02791, 0.11867, 0.27334, -0.28852, -0.06543, -0.23504]
+CT_DYNAMIC += [0.02104, 0.0, 0.0, 0.18677, 0.197, 1.094]
+CP_DYNAMIC = [0.01813, -0.06218, 0.35712, -0.23774, 0.00343, -0.1235]
+CP_DYNAMIC += [0.0, 0.07549, 0.0, 0.0, 0.286, 0.993]
+
+
+@pytest.mark.parametrize(
+    "F_pro, V_inf, alpha", [(30.0, 0.0, 0.0), (30.0, 10.0, 0.2), (5.0, 15.0, np.pi / 2)]
+)
+def test_induced_velocity(F_pro, V_inf, alpha):
+    D_pro, rho_air = 0.5, 1.2
+
+    def func(x):
+        return x - F_pro / (2 * rho_air * np.pi * (D_pro / 2) ** 2) / (
+            (V_inf * np.cos(alpha)) ** 2 + (V_inf * np.sin(alpha) + x) ** 2
+        ) ** (1 / 2)
+
+    v_i = PropellerPerformanceModel.induced_velocity(F_pro, D_pro, V_inf, alpha, rho_air)
+    assert v_i == pytest.approx(fsolve(func, x0=1, xtol=1e-12)[0], rel=1e-10)
+
+
+def _performance_problem(scenario, thrust=30.0):
+    prob = om.Problem(reports=False)
+    ivc = prob.model.add_subsystem("ivc", om.IndepVarComp(), promotes=["*"])
+    ivc.add_output("data:propulsion:propeller:Ct:static:polynomial", [4.27e-02, 1.44e-01])
+    ivc.add_output("data:propulsion:propeller:Cp:static:polynomial", [-1.48e-03, 9.72e-02])
+    ivc.add_output("data:propulsion:propeller:Ct:dynamic:polynomial", CT_DYNAMIC)
+    ivc.add_output("data:propulsion:propeller:Cp:dynamic:polynomial", CP_DYNAMIC)
+    prob.model.add_subsystem("propeller", PropellerPerformance(scenario=scenario), promotes=["*"])
+    prob.setup()
+    prob["data:propulsion:propeller:diameter"] = 0.5
+    prob["data:propulsion:propeller:beta"] = 0.45
+    prob["data:propulsion:propeller:thrust:%s" % scenario] = thrust
+    prob["mission:sizing:dISA"] = 5.0
+    if scenario in ["climb", "cruise"]:
+        prob["mission:sizing:main_route:%s:speed" % scenario] = 8.0
+        prob["optimization:variables:propulsion:propeller:advance_ratio:%s" % scenario] = 0.2
+        prob["data:propulsion:propeller:AoA:%s" % scenario] = 0.4
+    prob.run_model()
+    return prob
+
+
+@pytest.mark.parametrize("scenario", ["takeoff", "hover", "climb", "cruise"])
+def test_propeller_performance_partials(scenario):
+    prob = _performance_problem(scenario)
+    data = prob.check_partials(
+        out_stream=None, method="fd", form="central", step=1e-7, includes=["propeller"]
+    )
+    assert_check_partials(data, atol=1e-5, rtol=1e-5)
+
+
+def test_propeller_performance_stopped():
+    # the propeller torque is linear in thrust, so its derivative is the same at zero thrust
+    # (e.g. VTOL rotors of the hybrid UAV in cruise)
+    key = ("data:propulsion:propeller:torque:cruise", "data:propulsion:propeller:thrust:cruise")
+    prob = _performance_problem("cruise")
+    dQ_dF = prob.check_partials(out_stream=None, includes=["propeller"])["propeller"][key]["J_fwd"]
+
+    prob = _performance_problem("cruise", thrust=0.0)
+    assert prob["data:propulsion:propeller:torque:cruise"] == pytest.approx(0.0, abs=1e-12)
+    J = prob.check_partials(out_stream=None, includes=["propeller"])["propeller"][key]["J_fwd"]
+    assert J == pytest.approx(dQ_dF, rel=1e-12)
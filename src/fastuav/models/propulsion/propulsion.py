@@ -28,11 +28,15 @@ class Propulsion(om.Group):
         )
 
         # TODO: declare the following options for each propulsion system (e.g. for hybrid UAVs with 2 propulsions)
-        # TODO: add option to provide paths to catalogues
         self.options.declare("off_the_shelf_propeller", default=False, types=bool)
         self.options.declare("off_the_shelf_motor", default=False, types=bool)
         self.options.declare("off_the_shelf_battery", default=False, types=bool)
         self.options.declare("off_the_shelf_esc", default=False, types=bool)
+        # paths to custom catalogues (default catalogues if None)
+        self.options.declare("catalogue_propeller", default=None, types=str, allow_none=True)
+        self.options.declare("catalogue_motor", default=None, types=str, allow_none=True)
+        self.options.declare("catalogue_battery", default=None, types=str, allow_none=True)
+        self.options.declare("catalogue_esc", default=None, types=str, allow_none=True)
         self.options.declare("gearbox", default=False, types=bool)
 
     def setup(self):
@@ -48,23 +52,45 @@ class Propulsion(om.Group):
             )
             propulsion.add_subsystem(
                 "propeller",
-                Propeller(off_the_shelf=off_the_shelf_propeller),
+                Propeller(
+                    off_the_shelf=off_the_shelf_propeller,
+                    catalogue_path=self.options["catalogue_propeller"],
+                ),
                 promotes=["*"],
             )
             if gearbox:
                 propulsion.add_subsystem(
-                    "motor", Motor(off_the_shelf=off_the_shelf_motor), promotes=["*"]
+                    "motor",
+                    Motor(
+                        off_the_shelf=off_the_shelf_motor,
+                        catalogue_path=self.options["catalogue_motor"],
+                    ),
+                    promotes=["*"],
                 )
                 propulsion.add_subsystem("gearbox", Gearbox(), promotes=["*"])
             else:
                 propulsion.add_subsystem("no_gearbox", NoGearbox(), promotes=["*"])
                 propulsion.add_subsystem(
-                    "motor", Motor(off_the_shelf=off_the_shelf_motor), promotes=["*"]
+                    "motor",
+                    Motor(
+                        off_the_shelf=off_the_shelf_motor,
+                        catalogue_path=self.options["catalogue_motor"],
+                    ),
+                    promotes=["*"],
                 )
             propulsion.add_subsystem(
-                "battery", Battery(off_the_shelf=off_the_shelf_battery), promotes=["*"]
+                "battery",
+                Battery(
+                    off_the_shelf=off_the_shelf_battery,
+                    catalogue_path=self.options["catalogue_battery"],
+                ),
+                promotes=["*"],
+            )
+            propulsion.add_subsystem(
+                "esc",
+                ESC(off_the_shelf=off_the_shelf_esc, catalogue_path=self.options["catalogue_esc"]),
+                promotes=["*"],
             )
-            propulsion.add_subsystem("esc", ESC(off_the_shelf=off_the_shelf_esc), promotes=["*"])
 
     def configure(self):
         for propulsion_id in self.options["propulsion_id"]:
@@ -0,0 +1,48 @@
+"""
+Tests of the validity domains of the off-the-shelf component selections.
+"""
+
+import openmdao.api as om
+import pandas as pd
+import pytest
+from fastoad.openmdao.validity_checker import ValidityDomainChecker, ValidityStatus
+
+from fastuav.models.propulsion.esc.catalogue import PATH, ESCCatalogueSelection
+from fastuav.utils.catalogues import registry
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "CACHE_DIR", str(tmp_path / "cache"))
+    registry.clear_catalogues()
+    yield tmp_path
+    registry.clear_catalogues()
+
+
+def _power_status(catalogue_path, power):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        "esc", ESCCatalogueSelection(catalogue_path=catalogue_path), promotes=["*"]
+    )
+    prob.setup()
+    prob["data:propulsion:esc:power:max:estimated"] = power
+    prob["data:propulsion:esc:voltage:estimated"] = 22.0
+    prob["data:weight:propulsion:esc:mass:estimated"] = 0.1
+    prob["data:propulsion:esc:efficiency:estimated"] = 0.95
+    prob.run_model()
+
+    records = ValidityDomainChecker.check_problem_variables(prob)
+    return {record.variable_name: record.status for record in records}[
+        "data:propulsion:esc:power:max:estimated"
+    ]
+
+
+def test_validity_domain_of_catalogue(cache_dir):
+    # validity domain is that of the catalogue in use
+    df = pd.read_csv(PATH, sep=";")
+    custom_path = str(cache_dir / "ESC.csv")
+    df[df["Pmax_W"] <= 1000.0].to_csv(custom_path, sep=";", index=False)
+
+    assert _power_status(PATH, 2000.0) == ValidityStatus.OK
+    assert _power_status(custom_path, 2000.0) == ValidityStatus.TOO_HIGH
+    assert _power_status(custom_path, 500.0) == ValidityStatus.OK
@@ -49,8 +49,24 @@ class MultirotorClimbThrust(om.ExplicitComponent):
         self.add_output("data:propulsion:%s:propeller:AoA:climb" % propulsion_id, units="rad")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+        self.declare_partials(
+            "data:propulsion:%s:propeller:thrust:climb" % propulsion_id, "*", method="exact"
+        )
+        self.declare_partials(
+            "data:propulsion:%s:propeller:AoA:climb" % propulsion_id,
+            [
+                "optimization:variables:weight:mtow:guess",
+                "data:aerodynamics:%s:CD0" % propulsion_id,
+                "data:geometry:projected_area:top",
+                "data:geometry:projected_area:front",
+                "mission:sizing:main_route:cruise:altitude",
+                "mission:sizing:main_route:climb:speed:%s" % propulsion_id,
+                "mission:sizing:main_route:climb:rate:%s" % propulsion_id,
+                "mission:sizing:dISA",
+            ],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         # UAV configuration
@@ -90,6 +106,62 @@ class MultirotorClimbThrust(om.ExplicitComponent):
         outputs["data:propulsion:%s:propeller:thrust:climb" % propulsion_id] = F_pro_cl
         outputs["data:propulsion:%s:propeller:AoA:climb" % propulsion_id] = alpha_cl
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # UAV configuration
+        propulsion_id = self.options["propulsion_id"]
+        Npro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+
+        # Flight parameters
+        V_v = inputs["mission:sizing:main_route:climb:rate:%s" % propulsion_id]
+        V_climb = inputs["mission:sizing:main_route:climb:speed:%s" % propulsion_id]
+        altitude_climb = inputs["mission:sizing:main_route:cruise:altitude"]
+        dISA = inputs["mission:sizing:dISA"]
+        atm = AtmosphereWithPartials(altitude_climb, dISA, altitude_in_feet=False)
+        rho_air = atm.density
+        drho_dISA = -rho_air / atm.temperature  # pressure does not depend on dISA
+
+        # Weight and drag parameters
+        m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
+        C_D0 = inputs["data:aerodynamics:%s:CD0" % propulsion_id]
+        C_L = 0.0
+        S_top = inputs["data:geometry:projected_area:top"]
+        S_front = inputs["data:geometry:projected_area:front"]
+
+        alpha_cl = MultirotorFlightModel.get_angle_of_attack(
+            m_uav_guess, V_climb, V_v, S_front, S_top, C_D0, C_L, rho_air
+        )
+        thrust = MultirotorFlightModel.get_thrust(
+            m_uav_guess, V_climb, V_v, alpha_cl, S_front, S_top, C_D0, C_L, rho_air
+        )
+        alpha_partials = MultirotorFlightModel.get_angle_of_attack_partials(
+            alpha_cl, m_uav_guess, V_climb, V_v, S_front, S_top, C_D0, C_L, rho_air
+        )
+        thrust_partials = MultirotorFlightModel.get_thrust_partials(
+            m_uav_guess, V_climb, V_v, alpha_cl, S_front, S_top, C_D0, C_L, rho_air
+        )
+
+        thrust_name = "data:propulsion:%s:propeller:thrust:climb" % propulsion_id
+        alpha_name = "data:propulsion:%s:propeller:AoA:climb" % propulsion_id
+        for input_name, key, factor in (
+            ("optimization:variables:weight:mtow:guess", "m_uav", 1.0),
+            ("data:aerodynamics:%s:CD0" % propulsion_id, "C_D", 1.0),
+            ("data:geometry:projected_area:top", "S_top", 1.0),
+            ("data:geometry:projected_area:front", "S_front", 1.0),
+            ("mission:sizing:main_route:climb:speed:%s" % propulsion_id, "V", 1.0),
+            ("mission:sizing:main_route:climb:rate:%s" % propulsion_id, "RoC", 1.0),
+            ("mission:sizing:main_route:cruise:altitude", "rho_air", atm.partial_density_altitude),
+            ("mission:sizing:dISA", "rho_air", drho_dISA),
+        ):
+            partials[alpha_name, input_name] = alpha_partials[key] * factor
+            partials[thrust_name, input_name] = (
+                (thrust_partials[key] + thrust_partials["alpha"] * alpha_partials[key])
+                * factor
+                / Npro
+            )
+        partials[thrust_name, "data:propulsion:%s:propeller:number" % propulsion_id] = (
+            -thrust / Npro**2
+        )
+
 
 class FixedwingClimbThrust(om.ExplicitComponent):
     """
@@ -41,8 +41,23 @@ class MultirotorCruiseThrust(om.ExplicitComponent):
         self.add_output("data:propulsion:%s:propeller:AoA:cruise" % propulsion_id, units="rad")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+        self.declare_partials(
+            "data:propulsion:%s:propeller:thrust:cruise" % propulsion_id, "*", method="exact"
+        )
+        self.declare_partials(
+            "data:propulsion:%s:propeller:AoA:cruise" % propulsion_id,
+            [
+                "optimization:variables:weight:mtow:guess",
+                "data:aerodynamics:%s:CD0" % propulsion_id,
+                "data:geometry:projected_area:top",
+                "data:geometry:projected_area:front",
+                "mission:sizing:main_route:cruise:altitude",
+                "mission:sizing:main_route:cruise:speed:%s" % propulsion_id,
+                "mission:sizing:dISA",
+            ],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         # UAV configuration
@@ -80,6 +95,61 @@ class MultirotorCruiseThrust(om.ExplicitComponent):
         outputs["data:propulsion:%s:propeller:thrust:cruise" % propulsion_id] = F_pro_cr
         outputs["data:propulsion:%s:propeller:AoA:cruise" % propulsion_id] = alpha_cr
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # UAV configuration
+        propulsion_id = self.options["propulsion_id"]
+        Npro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+
+        # Flight parameters
+        V_cruise = inputs["mission:sizing:main_route:cruise:speed:%s" % propulsion_id]
+        altitude_cruise = inputs["mission:sizing:main_route:cruise:altitude"]
+        dISA = inputs["mission:sizing:dISA"]
+        atm = AtmosphereWithPartials(altitude_cruise, dISA, altitude_in_feet=False)
+        rho_air = atm.density
+        drho_dISA = -rho_air / atm.temperature  # pressure does not depend on dISA
+
+        # Weight, drag and lift parameters
+        m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
+        C_D0 = inputs["data:aerodynamics:%s:CD0" % propulsion_id]
+        C_L = 0.0
+        S_top = inputs["data:geometry:projected_area:top"]
+        S_front = inputs["data:geometry:projected_area:front"]
+        V_v = 0.0
+
+        alpha_cr = MultirotorFlightModel.get_angle_of_attack(
+            m_uav_guess, V_cruise, V_v, S_front, S_top, C_D0, C_L, rho_air
+        )
+        thrust = MultirotorFlightModel.get_thrust(
+            m_uav_guess, V_cruise, V_v, alpha_cr, S_front, S_top, C_D0, C_L, rho_air
+        )
+        alpha_partials = MultirotorFlightModel.get_angle_of_attack_partials(
+            alpha_cr, m_uav_guess, V_cruise, V_v, S_front, S_top, C_D0, C_L, rho_air
+        )
+        thrust_partials = MultirotorFlightModel.get_thrust_partials(
+            m_uav_guess, V_cruise, V_v, alpha_cr, S_front, S_top, C_D0, C_L, rho_air
+        )
+
+        thrust_name = "data:propulsion:%s:propeller:thrust:cruise" % propulsion_id
+        alpha_name = "data:propulsion:%s:propeller:AoA:cruise" % propulsion_id
+        for input_name, key, factor in (
+            ("optimization:variables:weight:mtow:guess", "m_uav", 1.0),
+            ("data:aerodynamics:%s:CD0" % propulsion_id, "C_D", 1.0),
+            ("data:geometry:projected_area:top", "S_top", 1.0),
+            ("data:geometry:projected_area:front", "S_front", 1.0),
+            ("mission:sizing:main_route:cruise:speed:%s" % propulsion_id, "V", 1.0),
+            ("mission:sizing:main_route:cruise:altitude", "rho_air", atm.partial_density_altitude),
+            ("mission:sizing:dISA", "rho_air", drho_dISA),
+        ):
+            partials[alpha_name, input_name] = alpha_partials[key] * factor
+            partials[thrust_name, input_name] = (
+                (thrust_partials[key] + thrust_partials["alpha"] * alpha_partials[key])
+                * factor
+                / Npro
+            )
+        partials[thrust_name, "data:propulsion:%s:propeller:number" % propulsion_id] = (
+            -thrust / Npro**2
+        )
+
 
 class FixedwingCruiseThrust(om.ExplicitComponent):
     """
@@ -4,7 +4,7 @@ UAV flight models for thrust calculations - static methods definition.
 
 import numpy as np
 from scipy.constants import g
-from scipy.optimize import minimize
+from scipy.optimize import brentq
 
 
 class MultirotorFlightModel:
@@ -37,7 +37,8 @@ class MultirotorFlightModel:
     @staticmethod
     def get_angle_of_attack(m_uav, V, RoC, S_front, S_top, C_D, C_L0, rho_air):
         """
-        Computes angle of attack to maintain flight path
+        Computes angle of attack to maintain flight path.
+        The equilibrium residual is solved on [0, pi/2] with a bracketed root solver (Brent's method).
         """
         # flight path angle [rad]
         if V != 0.0 and V > RoC:
@@ -47,39 +48,189 @@ class MultirotorFlightModel:
             return alpha
 
         def func(x):
-            drag = MultirotorFlightModel.get_drag(V, x, S_front, S_top, C_D, rho_air)  # [N] drag
-            lift = MultirotorFlightModel.get_lift(V, x, S_top, C_L0, rho_air)  # [N] lift
-            weight = m_uav * g  # [N] weight
-            res = np.tan(abs(x - theta)) - (drag * np.cos(theta) + lift * np.sin(theta)) / (
-                weight + drag * np.sin(theta) - lift * np.cos(theta)
-            )  # [-] equilibrium residual
-            return res**2
-
-        bnds = ((0.0, np.pi / 2),)
-        res = minimize(func, (np.pi / 4), bounds=bnds, method="SLSQP")  # [rad] angle of attack
-        alpha = res.x if res.success else np.pi / 2
+            res = MultirotorFlightModel.get_equilibrium_residual(
+                x, m_uav, V, theta, S_front, S_top, C_D, C_L0, rho_air
+            )  # [rad] equilibrium residual
+            return float(np.squeeze(res))
+
+        if func(0.0) >= 0.0:
+            alpha = 0.0  # [rad] equilibrium out of bounds
+        elif func(np.pi / 2) <= 0.0:
+            alpha = np.pi / 2  # [rad] equilibrium out of bounds
+        else:
+            alpha = brentq(func, 0.0, np.pi / 2, xtol=1e-12)  # [rad] angle of attack
         return alpha
 
     @staticmethod
-    def get_thrust(m_uav, V, RoC, alpha, S_front, S_top, C_D, C_L0, rho_air):
+    def get_angle_of_attack_partials(alpha, m_uav, V, RoC, S_front, S_top, C_D, C_L0, rho_air):
         """
-        Computes thrust to maintain flight path
+        Computes the partial derivatives of the angle of attack solving the equilibrium equation,
+        with respect to m_uav, V, RoC, S_front, S_top, C_D, C_L0 and rho_air.
+        They are obtained from the implicit function theorem applied to the equilibrium residual,
+        and are zero if the angle of attack is on the bounds [0, pi/2].
         """
-        # flight path angle [rad]
-        if V != 0.0 and V >= RoC:
-            theta = np.arcsin(RoC / V)
-        else:
-            theta = np.pi / 2
+        theta = MultirotorFlightModel.get_flight_path_angle(V, RoC)  # [rad] flight path angle
+        theta_partials = MultirotorFlightModel.get_flight_path_angle_partials(V, RoC)
+        thrust_x, thrust_z = MultirotorFlightModel.get_thrust_components(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+        thrust_x_partials, thrust_z_partials = MultirotorFlightModel.get_thrust_components_partials(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+
+        # partials of the residual alpha - theta - atan2(thrust_x, thrust_z)
+        def res_partial(key):
+            return -(thrust_z * thrust_x_partials[key] - thrust_x * thrust_z_partials[key]) / (
+                thrust_x**2 + thrust_z**2
+            )
 
+        res_alpha = 1.0 + res_partial("alpha")
+        res_theta = -1.0 + res_partial("theta")
+        interior = (alpha > 0.0) & (alpha < np.pi / 2)
+
+        partials = {}
+        for key in ("m_uav", "V", "RoC", "S_front", "S_top", "C_D", "C_L0", "rho_air"):
+            res_key = res_theta * theta_partials.get(key, 0.0)
+            if key in thrust_x_partials:
+                res_key = res_key + res_partial(key)
+            partials[key] = np.where(interior, -res_key / res_alpha, 0.0)
+        return partials
+
+    @staticmethod
+    def get_flight_path_angle(V, RoC):
+        """
+        Computes flight path angle from airspeed and rate of climb.
+        Flight is considered vertical if the airspeed is zero or lower than the rate of climb.
+        Inputs can be scalars or arrays.
+        """
+        V, RoC = np.broadcast_arrays(V, RoC)
+        forward = (V != 0.0) & (V >= RoC)
+        theta = np.arcsin(
+            np.divide(RoC, V, out=np.ones(V.shape), where=forward)
+        )  # [rad] flight path angle
+        return theta
+
+    @staticmethod
+    def get_thrust_components(m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air):
+        """
+        Computes the horizontal (first output) and vertical (second output) components
+        of the thrust required to maintain flight path.
+        """
         weight = m_uav * g  # [N] weight
         lift = MultirotorFlightModel.get_lift(V, alpha, S_top, C_L0, rho_air)  # [N] lift
         drag = MultirotorFlightModel.get_drag(V, alpha, S_front, S_top, C_D, rho_air)  # [N] drag
-        thrust = (
-            (weight + drag * np.sin(theta) - lift * np.cos(theta)) ** 2
-            + (drag * np.cos(theta) + lift * np.sin(theta)) ** 2
-        ) ** (1 / 2)  # [N] total thrust requirement
+        thrust_x = drag * np.cos(theta) + lift * np.sin(theta)  # [N] horizontal component
+        thrust_z = weight + drag * np.sin(theta) - lift * np.cos(theta)  # [N] vertical component
+        return thrust_x, thrust_z
+
+    @staticmethod
+    def get_flight_path_angle_partials(V, RoC):
+        """
+        Computes the partial derivatives of the flight path angle with respect to V and RoC.
+        """
+        V, RoC = np.broadcast_arrays(V, RoC)
+        forward = (V != 0.0) & (V > RoC)
+        V_cos_theta = np.sqrt(np.abs(V**2 - RoC**2))  # [m/s] horizontal speed
+        return {
+            "V": -np.divide(RoC, V * V_cos_theta, out=np.zeros(V.shape), where=forward),
+            "RoC": np.divide(1.0, V_cos_theta, out=np.zeros(V.shape), where=forward),
+        }
+
+    @staticmethod
+    def get_equilibrium_residual(alpha, m_uav, V, theta, S_front, S_top, C_D, C_L0, rho_air):
+        """
+        Computes the residual of the equilibrium equation that defines the angle of attack,
+        i.e. the difference between the angle of attack and the angle of the thrust vector
+        with respect to the flight path. Inputs can be scalars or arrays.
+        """
+        thrust_x, thrust_z = MultirotorFlightModel.get_thrust_components(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+        res = alpha - theta - np.arctan2(thrust_x, thrust_z)  # [rad] equilibrium residual
+        return res
+
+    @staticmethod
+    def get_thrust_components_partials(m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air):
+        """
+        Computes the partial derivatives of the thrust components (see get_thrust_components)
+        with respect to alpha, theta, m_uav, V, S_front, S_top, C_D, C_L0 and rho_air.
+        """
+        q = 0.5 * rho_air * V**2  # [Pa] dynamic pressure
+        S_ref_drag = S_top * np.sin(alpha) + S_front * np.cos(alpha)  # [m2] reference area
+        S_ref_lift = S_top * np.sin(alpha)  # [m2] reference area
+        C_L = C_L0 * np.sin(-2 * alpha)  # [-] lift coefficient
+        drag = q * C_D * S_ref_drag  # [N] drag
+        lift = q * C_L * S_ref_lift  # [N] lift
+
+        drag_partials = {
+            "alpha": q * C_D * (S_top * np.cos(alpha) - S_front * np.sin(alpha)),
+            "V": rho_air * V * C_D * S_ref_drag,
+            "S_front": q * C_D * np.cos(alpha),
+            "S_top": q * C_D * np.sin(alpha),
+            "C_D": q * S_ref_drag,
+            "rho_air": 0.5 * V**2 * C_D * S_ref_drag,
+        }
+        lift_partials = {
+            "alpha": -q
+            * C_L0
+            * S_top
+            * (2 * np.cos(2 * alpha) * np.sin(alpha) + np.sin(2 * alpha) * np.cos(alpha)),
+            "V": rho_air * V * C_L * S_ref_lift,
+            "S_top": q * C_L * np.sin(alpha),
+            "C_L0": q * np.sin(-2 * alpha) * S_ref_lift,
+            "rho_air": 0.5 * V**2 * C_L * S_ref_lift,
+        }
+
+        thrust_x_partials = {}
+        thrust_z_partials = {}
+        for key in ("alpha", "m_uav", "V", "S_front", "S_top", "C_D", "C_L0", "rho_air"):
+            drag_partial = drag_partials.get(key, 0.0)
+            lift_partial = lift_partials.get(key, 0.0)
+            thrust_x_partials[key] = drag_partial * np.cos(theta) + lift_partial * np.sin(theta)
+            thrust_z_partials[key] = drag_partial * np.sin(theta) - lift_partial * np.cos(theta)
+        thrust_x_partials["theta"] = -drag * np.sin(theta) + lift * np.cos(theta)
+        thrust_z_partials["theta"] = drag * np.cos(theta) + lift * np.sin(theta)
+        thrust_z_partials["m_uav"] = thrust_z_partials["m_uav"] + g
+        return thrust_x_partials, thrust_z_partials
+
+    @staticmethod
+    def get_thrust(m_uav, V, RoC, alpha, S_front, S_top, C_D, C_L0, rho_air):
+        """
+        Computes thrust to maintain flight path
+        """
+        theta = MultirotorFlightModel.get_flight_path_angle(V, RoC)  # [rad] flight path angle
+        thrust_x, thrust_z = MultirotorFlightModel.get_thrust_components(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+        thrust = (thrust_z**2 + thrust_x**2) ** (1 / 2)  # [N] total thrust requirement
         return thrust
 
+    @staticmethod
+    def get_thrust_partials(m_uav, V, RoC, alpha, S_front, S_top, C_D, C_L0, rho_air):
+        """
+        Computes the partial derivatives of the thrust (see get_thrust) with respect to
+        alpha, m_uav, V, RoC, S_front, S_top, C_D, C_L0 and rho_air.
+        """
+        theta = MultirotorFlightModel.get_flight_path_angle(V, RoC)  # [rad] flight path angle
+        theta_partials = MultirotorFlightModel.get_flight_path_angle_partials(V, RoC)
+        thrust_x, thrust_z = MultirotorFlightModel.get_thrust_components(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+        thrust_x_partials, thrust_z_partials = MultirotorFlightModel.get_thrust_components_partials(
+            m_uav, V, theta, alpha, S_front, S_top, C_D, C_L0, rho_air
+        )
+        thrust = (thrust_z**2 + thrust_x**2) ** (1 / 2)  # [N] total thrust requirement
+
+        def thrust_partial(key):
+            return (thrust_x * thrust_x_partials[key] + thrust_z * thrust_z_partials[key]) / thrust
+
+        partials = {"alpha": thrust_partial("alpha")}
+        for key in ("m_uav", "V", "RoC", "S_front", "S_top", "C_D", "C_L0", "rho_air"):
+            partials[key] = thrust_partial("theta") * theta_partials.get(key, 0.0)
+            if key in thrust_x_partials:
+                partials[key] = partials[key] + thrust_partial(key)
+        return partials
+
 
 class FixedwingFlightModel:
     """
@@ -0,0 +1,75 @@
+"""
+Tests of the multirotor trim (angle of attack) solver and of its analytic derivatives.
+
+``test_angle_of_attack`` compares the bracketed root solver with the former implementation,
+that minimized the squared equilibrium residual with SLSQP. Both are timed by the benchmark
+fastuav.utils.trim_time.
+"""
+
+import numpy as np
+import openmdao.api as om
+import pytest
+from openmdao.utils.assert_utils import assert_check_partials
+
+from fastuav.models.scenarios.thrust.climb import MultirotorClimbThrust
+from fastuav.models.scenarios.thrust.cruise import MultirotorCruiseThrust
+from fastuav.models.scenarios.thrust.flight_models import MultirotorFlightModel
+from fastuav.utils.trim_time import (
+    CD0,
+    MTOW,
+    RHO_AIR,
+    SPEEDS,
+    S_FRONT,
+    S_TOP,
+    angle_of_attack_slsqp,
+    angles_of_attack,
+)
+
+
+def test_angle_of_attack():
+    alpha_ref = angles_of_attack(SPEEDS, angle_of_attack_slsqp)
+    alpha = angles_of_attack(SPEEDS, MultirotorFlightModel.get_angle_of_attack)
+
+    theta = np.zeros_like(SPEEDS)
+    residual = MultirotorFlightModel.get_equilibrium_residual(
+        alpha, MTOW, SPEEDS, theta, S_FRONT, S_TOP, CD0, 0.0, RHO_AIR
+    )
+    assert np.abs(residual).max() < 1e-10
+    assert alpha == pytest.approx(alpha_ref, abs=1e-3)
+
+
+@pytest.mark.parametrize("speed", [3.0, 12.0])
+def test_cruise_thrust_partials(speed):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("cruise", MultirotorCruiseThrust(), promotes=["*"])
+    prob.setup()
+    prob["optimization:variables:weight:mtow:guess"] = MTOW
+    prob["data:propulsion:multirotor:propeller:number"] = 6.0
+    prob["data:aerodynamics:multirotor:CD0"] = CD0
+    prob["data:geometry:projected_area:top"] = S_TOP
+    prob["data:geometry:projected_area:front"] = S_FRONT
+    prob["mission:sizing:main_route:cruise:speed:multirotor"] = speed
+    prob["mission:sizing:dISA"] = 5.0
+    prob.run_model()
+
+    data = prob.check_partials(out_stream=None, method="fd", form="central", step=1e-7)
+    assert_check_partials(data, atol=1e-6, rtol=1e-4)
+
+
+@pytest.mark.parametrize("speed, rate", [(3.0, 2.0), (12.0, 2.0), (1.0, 3.0)])
+def test_climb_thrust_partials(speed, rate):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("climb", MultirotorClimbThrust(), promotes=["*"])
+    prob.setup()
+    prob["optimization:variables:weight:mtow:guess"] = MTOW
+    prob["data:propulsion:multirotor:propeller:number"] = 6.0
+    prob["data:aerodynamics:multirotor:CD0"] = CD0
+    prob["data:geometry:projected_area:top"] = S_TOP
+    prob["data:geometry:projected_area:front"] = S_FRONT
+    prob["mission:sizing:main_route:climb:speed:multirotor"] = speed
+    prob["mission:sizing:main_route:climb:rate:multirotor"] = rate
+    prob["mission:sizing:dISA"] = 5.0
+    prob.run_model()
+
+    data = prob.check_partials(out_stream=None, method="fd", form="central", step=1e-7)
+    assert_check_partials(data, atol=1e-6, rtol=1e-4)
@@ -85,8 +85,8 @@ class CoG_UAV(om.ExplicitComponent):
         self.add_output("data:stability:CoG:z", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # The CoG is on the x-axis (y and z are zero)
+        self.declare_partials("data:stability:CoG:x", "*", method="exact")
 
     def compute(self, inputs, outputs):
         propulsion_id_list = self.options["propulsion_id_list"]
@@ -130,3 +130,31 @@ class CoG_UAV(om.ExplicitComponent):
         outputs["data:stability:CoG:x"] = x_cg_uav
         outputs["data:stability:CoG:y"] = 0
         outputs["data:stability:CoG:z"] = 0
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id_list = self.options["propulsion_id_list"]
+
+        # The UAV CoG is the mass-weighted mean of the airframe, propulsion systems and loads CoGs
+        parts = [("data:stability:CoG:airframe", "data:weight:airframe")]
+        for propulsion_id in propulsion_id_list:
+            parts.append(
+                (
+                    "data:stability:CoG:propulsion:%s" % propulsion_id,
+                    "data:weight:propulsion:%s" % propulsion_id,
+                )
+            )
+            parts.append(
+                (
+                    "data:stability:CoG:load:%s" % propulsion_id,
+                    "data:weight:load:%s" % propulsion_id,
+                )
+            )
+
+        m_uav = sum(inputs[mass_name] for _, mass_name in parts)
+        x_cg_uav = (
+            sum(inputs[cog_name] * inputs[mass_name] for cog_name, mass_name in parts) / m_uav
+        )
+
+        for cog_name, mass_name in parts:
+            partials["data:stability:CoG:x", cog_name] = inputs[mass_name] / m_uav
+            partials["data:stability:CoG:x", mass_name] = (inputs[cog_name] - x_cg_uav) / m_uav
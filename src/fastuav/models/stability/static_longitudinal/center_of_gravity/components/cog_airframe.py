@@ -69,8 +69,9 @@ class CoG_airframe_component(om.ExplicitComponent):
         self.add_output("data:stability:CoG:airframe", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # Airframe mass is a plain sum of the parts masses
+        self.declare_partials("data:weight:airframe", "data:weight:*", val=1.0)
+        self.declare_partials("data:stability:CoG:airframe", "*", method="exact")
 
     def compute(self, inputs, outputs):
         propulsion_id_list = self.options["propulsion_id_list"]
@@ -103,6 +104,35 @@ class CoG_airframe_component(om.ExplicitComponent):
         outputs["data:weight:airframe"] = m_airframe
         outputs["data:stability:CoG:airframe"] = x_cg_airframe
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id_list = self.options["propulsion_id_list"]
+
+        parts = [
+            ("data:stability:CoG:airframe:fuselage", "data:weight:airframe:fuselage:mass"),
+            ("data:stability:CoG:airframe:wing", "data:weight:airframe:wing:mass"),
+            (
+                "data:stability:CoG:airframe:tail:horizontal",
+                "data:weight:airframe:tail:horizontal:mass",
+            ),
+            (
+                "data:stability:CoG:airframe:tail:vertical",
+                "data:weight:airframe:tail:vertical:mass",
+            ),
+        ]
+        if MR_PROPULSION in propulsion_id_list:
+            parts.append(("data:stability:CoG:arms", "data:weight:airframe:arms:mass"))
+
+        m_airframe = sum(inputs[mass_name] for _, mass_name in parts)
+        x_cg_airframe = (
+            sum(inputs[cog_name] * inputs[mass_name] for cog_name, mass_name in parts) / m_airframe
+        )
+
+        for cog_name, mass_name in parts:
+            partials["data:stability:CoG:airframe", cog_name] = inputs[mass_name] / m_airframe
+            partials["data:stability:CoG:airframe", mass_name] = (
+                inputs[cog_name] - x_cg_airframe
+            ) / m_airframe
+
 
 class CoG_fuselage(om.ExplicitComponent):
     """
@@ -121,8 +151,7 @@ class CoG_fuselage(om.ExplicitComponent):
         self.add_output("data:stability:CoG:airframe:fuselage", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         l_nose = inputs["data:geometry:fuselage:length:nose"]
@@ -152,6 +181,55 @@ class CoG_fuselage(om.ExplicitComponent):
 
         outputs["data:stability:CoG:airframe:fuselage"] = x_cg_fus
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        l_nose = inputs["data:geometry:fuselage:length:nose"]
+        l_mid = inputs["data:geometry:fuselage:length:mid"]
+        l_rear = inputs["data:geometry:fuselage:length:rear"]
+        r_fus_mid = inputs["data:geometry:fuselage:diameter:mid"] / 2
+        r_fus_tip = inputs["data:geometry:fuselage:diameter:tip"] / 2
+        m_nose = inputs["data:weight:airframe:fuselage:mass:nose"]
+        m_mid = inputs["data:weight:airframe:fuselage:mass:mid"]
+        m_rear = inputs["data:weight:airframe:fuselage:mass:rear"]
+
+        # centroid of the truncated cone, as a fraction of the rear length
+        num = r_fus_mid**2 + 2 * r_fus_tip * r_fus_mid + 3 * r_fus_tip**2
+        den = r_fus_mid**2 + r_fus_tip * r_fus_mid + r_fus_tip**2
+        k_rear = num / den / 4
+        dk_rear_dr_mid = (
+            (2 * r_fus_mid + 2 * r_fus_tip) * den - num * (2 * r_fus_mid + r_fus_tip)
+        ) / (4 * den**2)
+        dk_rear_dr_tip = (
+            (2 * r_fus_mid + 6 * r_fus_tip) * den - num * (r_fus_mid + 2 * r_fus_tip)
+        ) / (4 * den**2)
+
+        x_cg_nose = l_nose * 0.55  # [m]
+        x_cg_mid = l_nose + l_mid / 2  # [m]
+        x_cg_rear = l_nose + l_mid + l_rear * k_rear  # [m]
+        m_fus = m_nose + m_mid + m_rear
+        x_cg_fus = (m_nose * x_cg_nose + m_mid * x_cg_mid + m_rear * x_cg_rear) / m_fus
+
+        partials["data:stability:CoG:airframe:fuselage", "data:geometry:fuselage:length:nose"] = (
+            0.55 * m_nose + m_mid + m_rear
+        ) / m_fus
+        partials["data:stability:CoG:airframe:fuselage", "data:geometry:fuselage:length:mid"] = (
+            0.5 * m_mid + m_rear
+        ) / m_fus
+        partials["data:stability:CoG:airframe:fuselage", "data:geometry:fuselage:length:rear"] = (
+            m_rear * k_rear / m_fus
+        )
+        partials["data:stability:CoG:airframe:fuselage", "data:geometry:fuselage:diameter:mid"] = (
+            m_rear * l_rear * dk_rear_dr_mid / 2 / m_fus
+        )
+        partials["data:stability:CoG:airframe:fuselage", "data:geometry:fuselage:diameter:tip"] = (
+            m_rear * l_rear * dk_rear_dr_tip / 2 / m_fus
+        )
+        for mass_name, x_cg in (
+            ("data:weight:airframe:fuselage:mass:nose", x_cg_nose),
+            ("data:weight:airframe:fuselage:mass:mid", x_cg_mid),
+            ("data:weight:airframe:fuselage:mass:rear", x_cg_rear),
+        ):
+            partials["data:stability:CoG:airframe:fuselage", mass_name] = (x_cg - x_cg_fus) / m_fus
+
 
 class CoG_wing(om.ExplicitComponent):
     """
@@ -164,8 +242,13 @@ class CoG_wing(om.ExplicitComponent):
         self.add_output("data:stability:CoG:airframe:wing", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # CoG of the wing is a linear function of the MAC location and length
+        self.declare_partials(
+            "data:stability:CoG:airframe:wing", "data:geometry:wing:MAC:LE:x", val=1.0
+        )
+        self.declare_partials(
+            "data:stability:CoG:airframe:wing", "data:geometry:wing:MAC:length", val=0.4
+        )
 
     def compute(self, inputs, outputs):
         c_MAC = inputs["data:geometry:wing:MAC:length"]
@@ -191,8 +274,19 @@ class CoG_tail(om.ExplicitComponent):
         self.add_output("data:stability:CoG:airframe:tail:%s" % tail, units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        tail = self.options["tail"]
+
+        # CoG of the tail is a linear function of the MAC location and length
+        self.declare_partials(
+            "data:stability:CoG:airframe:tail:%s" % tail,
+            "data:geometry:tail:%s:MAC:LE:x" % tail,
+            val=1.0,
+        )
+        self.declare_partials(
+            "data:stability:CoG:airframe:tail:%s" % tail,
+            "data:geometry:tail:%s:MAC:length" % tail,
+            val=0.4,
+        )
 
     def compute(self, inputs, outputs):
         tail = self.options["tail"]
@@ -219,8 +313,8 @@ class CoG_arms_VTOL(om.ExplicitComponent):
         self.add_output("data:stability:CoG:arms", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # CoG of the arms is the mean of the front and rear propellers locations
+        self.declare_partials("data:stability:CoG:arms", "*", val=0.5)
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -55,7 +55,17 @@ class CoG_propulsion_FW(om.ExplicitComponent):
         self.add_output("data:stability:CoG:propulsion:%s" % propulsion_id, units="m")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+
+        # Propulsion mass is a plain sum of the components masses
+        self.declare_partials(
+            "data:weight:propulsion:%s" % propulsion_id,
+            "data:weight:propulsion:%s:*" % propulsion_id,
+            val=1.0,
+        )
+        self.declare_partials(
+            "data:stability:CoG:propulsion:%s" % propulsion_id, "*", method="exact"
+        )
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -88,6 +98,51 @@ class CoG_propulsion_FW(om.ExplicitComponent):
         outputs["data:weight:propulsion:%s" % propulsion_id] = m_propulsion
         outputs["data:stability:CoG:propulsion:%s" % propulsion_id] = x_cg_propulsion
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id = self.options["propulsion_id"]
+        propulsion_conf = self.options["propulsion_conf"]
+        x_root_LE_w = inputs["data:geometry:wing:root:LE:x"]
+        x_root_TE_w = inputs["data:geometry:wing:root:TE:x"]
+        m_gearbox = inputs["data:weight:propulsion:%s:gearbox:mass" % propulsion_id]
+        m_pro = inputs["data:weight:propulsion:%s:propeller:mass" % propulsion_id]
+        l_mot = inputs["data:propulsion:%s:motor:length:estimated" % propulsion_id]
+        m_mot = inputs["data:weight:propulsion:%s:motor:mass" % propulsion_id]
+        m_bat = inputs["data:weight:propulsion:%s:battery:mass" % propulsion_id]
+
+        cog_name = "data:stability:CoG:propulsion:%s" % propulsion_id
+        if propulsion_conf == "pusher":
+            l_fus = inputs["data:geometry:fuselage:length"]
+            x_cg_pro = l_fus  # [m]
+            x_cg_mot = l_fus - l_mot / 2  # [m]
+            dx_cg_mot = -0.5
+        else:
+            x_cg_pro = 0  # [m]
+            x_cg_mot = l_mot / 2  # [m]
+            dx_cg_mot = 0.5
+        x_cg_bat = (x_root_LE_w + x_root_TE_w) / 2  # [m]
+
+        m_propulsion = m_pro + m_mot + m_bat + m_gearbox
+        x_cg_propulsion = (
+            x_cg_pro * m_pro + x_cg_mot * (m_mot + m_gearbox) + x_cg_bat * m_bat
+        ) / m_propulsion
+
+        if propulsion_conf == "pusher":
+            partials[cog_name, "data:geometry:fuselage:length"] = (
+                m_pro + m_mot + m_gearbox
+            ) / m_propulsion
+        partials[cog_name, "data:propulsion:%s:motor:length:estimated" % propulsion_id] = (
+            dx_cg_mot * (m_mot + m_gearbox) / m_propulsion
+        )
+        partials[cog_name, "data:geometry:wing:root:LE:x"] = m_bat / 2 / m_propulsion
+        partials[cog_name, "data:geometry:wing:root:TE:x"] = m_bat / 2 / m_propulsion
+        for mass_name, x_cg in (
+            ("data:weight:propulsion:%s:propeller:mass" % propulsion_id, x_cg_pro),
+            ("data:weight:propulsion:%s:motor:mass" % propulsion_id, x_cg_mot),
+            ("data:weight:propulsion:%s:gearbox:mass" % propulsion_id, x_cg_mot),
+            ("data:weight:propulsion:%s:battery:mass" % propulsion_id, x_cg_bat),
+        ):
+            partials[cog_name, mass_name] = (x_cg - x_cg_propulsion) / m_propulsion
+
 
 class CoG_propulsion_MR(om.ExplicitComponent):
     """
@@ -129,7 +184,25 @@ class CoG_propulsion_MR(om.ExplicitComponent):
         self.add_output("data:stability:CoG:propulsion:%s" % propulsion_id, units="m")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        propulsion_id = self.options["propulsion_id"]
+
+        self.declare_partials(
+            "data:weight:propulsion:%s" % propulsion_id,
+            [
+                "data:weight:propulsion:%s:propeller:mass" % propulsion_id,
+                "data:weight:propulsion:%s:motor:mass" % propulsion_id,
+                "data:propulsion:%s:propeller:number" % propulsion_id,
+            ],
+            method="exact",
+        )
+        self.declare_partials(
+            "data:weight:propulsion:%s" % propulsion_id,
+            "data:weight:propulsion:%s:battery:mass" % propulsion_id,
+            val=1.0,
+        )
+        self.declare_partials(
+            "data:stability:CoG:propulsion:%s" % propulsion_id, "*", method="exact"
+        )
 
     def compute(self, inputs, outputs):
         propulsion_id = self.options["propulsion_id"]
@@ -153,3 +226,47 @@ class CoG_propulsion_MR(om.ExplicitComponent):
 
         outputs["data:weight:propulsion:%s" % propulsion_id] = m_propulsion
         outputs["data:stability:CoG:propulsion:%s" % propulsion_id] = x_cg_propulsion
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        propulsion_id = self.options["propulsion_id"]
+        x_pro_front = inputs["data:geometry:%s:propeller:x:front" % propulsion_id]
+        x_pro_rear = inputs["data:geometry:%s:propeller:x:rear" % propulsion_id]
+        x_root_LE_w = inputs["data:geometry:wing:root:LE:x"]
+        x_root_TE_w = inputs["data:geometry:wing:root:TE:x"]
+        m_pro = inputs["data:weight:propulsion:%s:propeller:mass" % propulsion_id]
+        m_mot = inputs["data:weight:propulsion:%s:motor:mass" % propulsion_id]
+        m_bat = inputs["data:weight:propulsion:%s:battery:mass" % propulsion_id]
+        N_pro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+
+        x_cg_bat = (x_root_LE_w + x_root_TE_w) / 2  # [m]
+        m_propulsion = N_pro * m_pro + N_pro * m_mot + m_bat
+        x_cg_propulsion = (
+            2 * x_pro_front * (m_pro + m_mot) + 2 * x_pro_rear * (m_pro + m_mot) + x_cg_bat * m_bat
+        ) / m_propulsion
+
+        mass_name = "data:weight:propulsion:%s" % propulsion_id
+        cog_name = "data:stability:CoG:propulsion:%s" % propulsion_id
+        partials[mass_name, "data:weight:propulsion:%s:propeller:mass" % propulsion_id] = N_pro
+        partials[mass_name, "data:weight:propulsion:%s:motor:mass" % propulsion_id] = N_pro
+        partials[mass_name, "data:propulsion:%s:propeller:number" % propulsion_id] = m_pro + m_mot
+
+        partials[cog_name, "data:geometry:%s:propeller:x:front" % propulsion_id] = (
+            2 * (m_pro + m_mot) / m_propulsion
+        )
+        partials[cog_name, "data:geometry:%s:propeller:x:rear" % propulsion_id] = (
+            2 * (m_pro + m_mot) / m_propulsion
+        )
+        partials[cog_name, "data:geometry:wing:root:LE:x"] = m_bat / 2 / m_propulsion
+        partials[cog_name, "data:geometry:wing:root:TE:x"] = m_bat / 2 / m_propulsion
+        partials[cog_name, "data:weight:propulsion:%s:propeller:mass" % propulsion_id] = (
+            2 * (x_pro_front + x_pro_rear) - N_pro * x_cg_propulsion
+        ) / m_propulsion
+        partials[cog_name, "data:weight:propulsion:%s:motor:mass" % propulsion_id] = (
+            2 * (x_pro_front + x_pro_rear) - N_pro * x_cg_propulsion
+        ) / m_propulsion
+        partials[cog_name, "data:weight:propulsion:%s:battery:mass" % propulsion_id] = (
+            x_cg_bat - x_cg_propulsion
+        ) / m_propulsion
+        partials[cog_name, "data:propulsion:%s:propeller:number" % propulsion_id] = (
+            -x_cg_propulsion * (m_pro + m_mot) / m_propulsion
+        )
@@ -24,8 +24,7 @@ class NeutralPoint(om.ExplicitComponent):
         self.add_output("data:stability:neutral_point", units="m")
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         AR_w = inputs["optimization:variables:geometry:wing:AR"]
@@ -43,3 +42,39 @@ class NeutralPoint(om.ExplicitComponent):
         x_np = x_ac_w + l_np  # distance from neutral point to nose tip [m]
 
         outputs["data:stability:neutral_point"] = x_np
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        AR_w = inputs["optimization:variables:geometry:wing:AR"]
+        c_MAC = inputs["data:geometry:wing:MAC:length"]
+        V_ht = inputs["data:geometry:tail:horizontal:coefficient"]
+        AR_ht = inputs["optimization:variables:geometry:tail:horizontal:AR"]
+        e = inputs["data:aerodynamics:CDi:e"]
+
+        f_w = (1 - 4 / (2 + e * AR_w)) * (1 + 2 / e / AR_w)  # wing contribution [-]
+        f_ht = 1 / (1 + 2 / AR_ht)  # horizontal tail contribution [-]
+        df_w_dAR_w = (
+            4 * e / (2 + e * AR_w) ** 2 * (1 + 2 / e / AR_w)
+            - (1 - 4 / (2 + e * AR_w)) * 2 / e / AR_w**2
+        )
+        df_w_de = (
+            4 * AR_w / (2 + e * AR_w) ** 2 * (1 + 2 / e / AR_w)
+            - (1 - 4 / (2 + e * AR_w)) * 2 / e**2 / AR_w
+        )
+        df_ht_dAR_ht = 2 / AR_ht**2 * f_ht**2
+
+        partials["data:stability:neutral_point", "optimization:variables:geometry:wing:AR"] = (
+            c_MAC * V_ht * df_w_dAR_w * f_ht
+        )
+        partials["data:stability:neutral_point", "data:geometry:wing:MAC:length"] = (
+            V_ht * f_w * f_ht
+        )
+        partials["data:stability:neutral_point", "data:geometry:tail:horizontal:coefficient"] = (
+            c_MAC * f_w * f_ht
+        )
+        partials[
+            "data:stability:neutral_point", "optimization:variables:geometry:tail:horizontal:AR"
+        ] = c_MAC * V_ht * f_w * df_ht_dAR_ht
+        partials["data:stability:neutral_point", "data:aerodynamics:CDi:e"] = (
+            c_MAC * V_ht * df_w_de * f_ht
+        )
+        partials["data:stability:neutral_point", "data:geometry:wing:MAC:C4:x"] = 1.0
@@ -0,0 +1,69 @@
+"""
+Tests of the partial derivatives of the center of gravity and static margin calculations.
+"""
+
+import pytest
+
+from fastuav.models.stability.static_longitudinal.center_of_gravity.components.cog_propulsion import (
+    CoG_propulsion_FW,
+)
+from fastuav.tests.partials import check_partials
+
+INPUTS = {
+    # geometry
+    "data:geometry:wing:MAC:length": 0.3,
+    "data:geometry:wing:MAC:LE:x": 0.55,
+    "data:geometry:wing:MAC:C4:x": 0.63,
+    "data:geometry:wing:root:LE:x": 0.5,
+    "data:geometry:wing:root:TE:x": 0.85,
+    "data:geometry:tail:horizontal:MAC:length": 0.15,
+    "data:geometry:tail:horizontal:MAC:LE:x": 1.6,
+    "data:geometry:tail:horizontal:coefficient": 0.5,
+    "data:geometry:tail:vertical:MAC:length": 0.18,
+    "data:geometry:tail:vertical:MAC:LE:x": 1.55,
+    "data:geometry:fuselage:length": 1.8,
+    "data:geometry:fuselage:length:nose": 0.1,
+    "data:geometry:fuselage:length:mid": 0.75,
+    "data:geometry:fuselage:length:rear": 0.95,
+    "data:geometry:fuselage:diameter:mid": 0.2,
+    "data:geometry:fuselage:diameter:tip": 0.05,
+    "data:geometry:multirotor:propeller:x:front": 0.2,
+    "data:geometry:multirotor:propeller:x:rear": 1.2,
+    "optimization:variables:geometry:wing:AR": 10.0,
+    "optimization:variables:geometry:tail:horizontal:AR": 4.0,
+    "data:aerodynamics:CDi:e": 0.85,
+    # masses
+    "data:weight:airframe:fuselage:mass": 0.6,
+    "data:weight:airframe:fuselage:mass:nose": 0.05,
+    "data:weight:airframe:fuselage:mass:mid": 0.3,
+    "data:weight:airframe:fuselage:mass:rear": 0.25,
+    "data:weight:airframe:wing:mass": 1.2,
+    "data:weight:airframe:tail:horizontal:mass": 0.15,
+    "data:weight:airframe:tail:vertical:mass": 0.1,
+    "data:weight:airframe:arms:mass": 0.4,
+    "mission:sizing:payload:mass": 1.5,
+    "data:weight:misc:mass": 0.3,
+    # propulsion
+    "data:propulsion:fixedwing:motor:length:estimated": 0.06,
+    "data:propulsion:multirotor:propeller:number": 4.0,
+    "data:weight:propulsion:fixedwing:gearbox:mass": 0.05,
+    "data:weight:propulsion:fixedwing:propeller:mass": 0.04,
+    "data:weight:propulsion:fixedwing:motor:mass": 0.2,
+    "data:weight:propulsion:fixedwing:battery:mass": 1.1,
+    "data:weight:propulsion:fixedwing:esc:mass": 0.06,
+    "data:weight:propulsion:fixedwing:wires:mass": 0.03,
+    "data:weight:propulsion:multirotor:propeller:mass": 0.03,
+    "data:weight:propulsion:multirotor:motor:mass": 0.15,
+    "data:weight:propulsion:multirotor:battery:mass": 0.8,
+    "data:weight:propulsion:multirotor:esc:mass": 0.04,
+    "data:weight:propulsion:multirotor:wires:mass": 0.05,
+}
+
+
+@pytest.mark.parametrize("system_id", ["fastuav.stability.fixedwing", "fastuav.stability.hybrid"])
+def test_stability_partials(system_id):
+    check_partials(system_id, INPUTS)
+
+
+def test_cog_propulsion_pusher_partials():
+    check_partials(CoG_propulsion_FW(propulsion_conf="pusher"), INPUTS)
@@ -23,8 +23,16 @@ class FuselageStructures(om.ExplicitComponent):
         self.add_output("data:weight:airframe:fuselage:mass:rear", units="kg", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # Each mass is the product of the corresponding surface and of the area density
+        for part in ["", ":nose", ":mid", ":rear"]:
+            self.declare_partials(
+                "data:weight:airframe:fuselage:mass%s" % part,
+                [
+                    "data:geometry:fuselage:surface%s" % part,
+                    "data:weight:airframe:fuselage:mass:density",
+                ],
+                method="exact",
+            )
 
     def compute(self, inputs, outputs):
         S_fus = inputs["data:geometry:fuselage:surface"]
@@ -42,3 +50,16 @@ class FuselageStructures(om.ExplicitComponent):
         outputs["data:weight:airframe:fuselage:mass:nose"] = m_nose
         outputs["data:weight:airframe:fuselage:mass:mid"] = m_mid
         outputs["data:weight:airframe:fuselage:mass:rear"] = m_rear
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        rho_fus = inputs["data:weight:airframe:fuselage:mass:density"]
+
+        for part in ["", ":nose", ":mid", ":rear"]:
+            partials[
+                "data:weight:airframe:fuselage:mass%s" % part,
+                "data:geometry:fuselage:surface%s" % part,
+            ] = rho_fus
+            partials[
+                "data:weight:airframe:fuselage:mass%s" % part,
+                "data:weight:airframe:fuselage:mass:density",
+            ] = inputs["data:geometry:fuselage:surface%s" % part]
@@ -21,8 +21,7 @@ class HorizontalTailStructures(om.ExplicitComponent):
         self.add_output("data:weight:airframe:tail:horizontal:mass", units="kg", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         S_ht = inputs["data:geometry:tail:horizontal:surface"]
@@ -33,6 +32,18 @@ class HorizontalTailStructures(om.ExplicitComponent):
 
         outputs["data:weight:airframe:tail:horizontal:mass"] = m_wing
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        S_ht = inputs["data:geometry:tail:horizontal:surface"]
+        rho_skin = inputs["data:weight:airframe:tail:density"]
+
+        # the skin surface is two times the planform area
+        partials[
+            "data:weight:airframe:tail:horizontal:mass", "data:geometry:tail:horizontal:surface"
+        ] = 2 * rho_skin
+        partials[
+            "data:weight:airframe:tail:horizontal:mass", "data:weight:airframe:tail:density"
+        ] = 2 * S_ht
+
 
 class VerticalTailStructures(om.ExplicitComponent):
     """
@@ -45,8 +56,7 @@ class VerticalTailStructures(om.ExplicitComponent):
         self.add_output("data:weight:airframe:tail:vertical:mass", units="kg", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         S_vt = inputs["data:geometry:tail:vertical:surface"]
@@ -56,3 +66,15 @@ class VerticalTailStructures(om.ExplicitComponent):
         m_wing = m_skin  # total mass (both sides) [kg]
 
         outputs["data:weight:airframe:tail:vertical:mass"] = m_wing
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        S_vt = inputs["data:geometry:tail:vertical:surface"]
+        rho_skin = inputs["data:weight:airframe:tail:density"]
+
+        # the skin surface is two times the planform area
+        partials[
+            "data:weight:airframe:tail:vertical:mass", "data:geometry:tail:vertical:surface"
+        ] = 2 * rho_skin
+        partials["data:weight:airframe:tail:vertical:mass", "data:weight:airframe:tail:density"] = (
+            2 * S_vt
+        )
@@ -0,0 +1,64 @@
+"""
+Tests of the partial derivatives of the wing, tails and fuselage structures.
+"""
+
+import pytest
+
+from fastuav.tests.partials import check_partials
+
+INPUTS = {
+    # wing
+    "mission:sizing:load_factor:ultimate": 3.0,
+    "optimization:variables:weight:mtow:guess": 15.0,
+    "data:geometry:wing:span": 3.1,
+    "data:geometry:wing:surface": 1.2,
+    "data:geometry:wing:MAC:length": 0.4,
+    "data:geometry:wing:MAC:y": 0.7,
+    "data:geometry:wing:root:chord": 0.5,
+    "data:geometry:wing:tip:chord": 0.3,
+    "data:geometry:wing:root:thickness": 0.075,
+    "data:geometry:wing:tip:thickness": 0.045,
+    "data:structures:wing:spar:stress:max": 7.0e8,
+    "data:structures:wing:ribs:thickness": 0.003,
+    "data:weight:airframe:wing:spar:density": 1600.0,
+    "data:weight:airframe:wing:ribs:density": 150.0,
+    "data:weight:airframe:wing:skin:density": 0.3,
+    "optimization:variables:structures:wing:spar:diameter:k": 0.9,
+    "optimization:variables:structures:wing:spar:diameter:outer:k": 0.8,
+    "optimization:variables:structures:wing:spar:depth:k": 0.1,
+    "optimization:variables:structures:wing:spar:web:depth:k": 1.5,
+    # VTOL loads
+    "data:propulsion:multirotor:propeller:thrust:takeoff": 40.0,
+    "data:propulsion:multirotor:propeller:number": 4.0,
+    "data:geometry:multirotor:propeller:y": 0.6,
+    # tails and fuselage
+    "data:geometry:tail:horizontal:surface": 0.15,
+    "data:geometry:tail:vertical:surface": 0.06,
+    "data:weight:airframe:tail:density": 0.4,
+    "data:geometry:fuselage:surface": 0.9,
+    "data:geometry:fuselage:surface:nose": 0.05,
+    "data:geometry:fuselage:surface:mid": 0.45,
+    "data:geometry:fuselage:surface:rear": 0.4,
+    "data:weight:airframe:fuselage:mass:density": 0.6,
+    # VTOL arms
+    "optimization:variables:structures:arms:diameter:k": 0.9,
+    "data:geometry:arms:number": 4.0,
+    "data:geometry:arms:prop_per_arm": 1.0,
+    "data:geometry:arms:length": 0.5,
+    "data:weight:arms:density": 1700.0,
+    "data:structures:arms:stress:max": 7.0e8,
+}
+
+
+@pytest.mark.parametrize("spar_model", ["pipe", "I_beam"])
+@pytest.mark.parametrize("system_id", ["fastuav.structures.fixedwing", "fastuav.structures.hybrid"])
+def test_structures_partials(system_id, spar_model):
+    # relative steps and tolerance, the stresses and the masses differ by orders of magnitude
+    check_partials(
+        system_id,
+        INPUTS,
+        atol=1e-15,
+        options={"spar_model": spar_model},
+        step_calc="rel",
+        excludes=["*vtol_arms"],  # VTOL arms are computed with finite differences
+    )
@@ -6,6 +6,8 @@ import numpy as np
 import openmdao.api as om
 from scipy.constants import g
 
+from fastuav.models.structures.wing.structural_analysis import WingStructuralAnalysisModels
+
 
 class WingStructuresEstimationModels:
     """
@@ -40,6 +42,27 @@ class WingStructuresEstimationModels:
 
         return m_spar, t_web, a_flange, b_flange
 
+    @staticmethod
+    def spar_i_beam_partials(h_web, k_spar, L, rho_spar, k_flange=0.1, k_web=30):
+        """
+        Computes the partial derivatives of the mass and dimensions of a I-shaped beam
+        (see spar_i_beam) with respect to h_web, k_spar, L and rho_spar.
+        """
+        m_spar = WingStructuresEstimationModels.spar_i_beam(
+            h_web, k_spar, L, rho_spar, k_flange=k_flange, k_web=k_web
+        )[0]
+        return {
+            "m_spar": {
+                "h_web": 2 * m_spar / h_web,
+                "k_spar": rho_spar * L * h_web**2 * (4 * k_spar / k_flange - 1 / k_web),
+                "L": m_spar / L,
+                "rho_spar": m_spar / rho_spar,
+            },
+            "t_web": {"h_web": 1 / k_web},
+            "a_flange": {"h_web": k_spar, "k_spar": h_web},
+            "b_flange": {"h_web": k_spar / k_flange, "k_spar": h_web / k_flange},
+        }
+
     @staticmethod
     def spar_pipe(d_out, k_spar, L, rho_spar):
         """
@@ -61,6 +84,23 @@ class WingStructuresEstimationModels:
 
         return m_spar, d_in
 
+    @staticmethod
+    def spar_pipe_partials(d_out, k_spar, L, rho_spar):
+        """
+        Computes the partial derivatives of the mass and inner diameter of a circular hollow beam
+        (see spar_pipe) with respect to d_out, k_spar, L and rho_spar.
+        """
+        m_spar = WingStructuresEstimationModels.spar_pipe(d_out, k_spar, L, rho_spar)[0]
+        return {
+            "m_spar": {
+                "d_out": 2 * m_spar / d_out,
+                "k_spar": -rho_spar * L * np.pi / 2 * d_out**2 * k_spar,
+                "L": m_spar / L,
+                "rho_spar": m_spar / rho_spar,
+            },
+            "d_in": {"d_out": k_spar, "k_spar": d_out},
+        }
+
     @staticmethod
     def ribs(L, c_MAC, c_root, c_tip, t_root, t_tip, t_rib, rho_rib):
         """
@@ -166,8 +206,19 @@ class Spars(om.ExplicitComponent):
             self.add_output("data:structures:wing:spar:depth", units="m", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # The spar dimensions do not depend on the spar length and density
+        self.declare_partials("data:weight:airframe:wing:spar:mass", "*", method="exact")
+        self.declare_partials(
+            "data:structures:*",
+            [
+                "mission:sizing:load_factor:ultimate",
+                "optimization:variables:weight:mtow:guess",
+                "data:geometry:wing:MAC:y",
+                "data:structures:wing:spar:stress:max",
+                "optimization:variables:structures:*",
+            ],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         spar_model = self.options["spar_model"]
@@ -219,6 +270,92 @@ class Spars(om.ExplicitComponent):
 
         outputs["data:weight:airframe:wing:spar:mass"] = 2 * m_spar
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        spar_model = self.options["spar_model"]
+        n_ult = inputs["mission:sizing:load_factor:ultimate"]
+        m_uav_guess = inputs["optimization:variables:weight:mtow:guess"]
+        b_w = inputs["data:geometry:wing:span"]
+        y_MAC = inputs["data:geometry:wing:MAC:y"]
+        sig_max = inputs["data:structures:wing:spar:stress:max"]
+        rho_spar = inputs["data:weight:airframe:wing:spar:density"]
+
+        # LOADS
+        F_max = n_ult * m_uav_guess * g / 2  # ultimate aerodynamic load [N]
+        M_root = F_max * y_MAC  # bending moment at root [N.m]
+        dM_root = {
+            "mission:sizing:load_factor:ultimate": M_root / n_ult,
+            "optimization:variables:weight:mtow:guess": M_root / m_uav_guess,
+            "data:geometry:wing:MAC:y": M_root / y_MAC,
+        }
+
+        if spar_model == "pipe":
+            dim = "d_out"  # sizing dimension of the spar
+            k_spar_name = "optimization:variables:structures:wing:spar:diameter:k"
+            k_dim_name = "optimization:variables:structures:wing:spar:diameter:outer:k"
+            k_spar = inputs[k_spar_name]
+            d_out_0 = ((32 * M_root) / (np.pi * (1 - k_spar**4) * sig_max)) ** (1 / 3)
+            dsig = WingStructuralAnalysisModels.pipe_stress_partials(M_root, d_out_0, k_spar)
+            d_out = inputs[k_dim_name] * d_out_0
+            dspar = WingStructuresEstimationModels.spar_pipe_partials(
+                d_out, k_spar, b_w / 2, rho_spar
+            )
+            local_partials = {
+                "data:structures:wing:spar:diameter:outer": {"d_out": 1.0},
+                "data:structures:wing:spar:diameter:inner": dspar["d_in"],
+            }
+        else:
+            dim = "h_web"  # sizing dimension of the spar
+            k_spar_name = "optimization:variables:structures:wing:spar:depth:k"
+            k_dim_name = "optimization:variables:structures:wing:spar:web:depth:k"
+            k_spar = inputs[k_spar_name]
+            k_flange = 0.1
+            h_web_0 = (
+                M_root * (1 + k_spar) / (sig_max * k_spar**2 * (1 + k_spar**2 / 3) / k_flange)
+            ) ** (1 / 3)
+            dsig = WingStructuralAnalysisModels.i_beam_stress_partials(
+                M_root, h_web_0, k_spar, k_flange=k_flange
+            )
+            h_web = inputs[k_dim_name] * h_web_0
+            dspar = WingStructuresEstimationModels.spar_i_beam_partials(
+                h_web, k_spar, b_w / 2, rho_spar, k_flange=k_flange
+            )
+            local_partials = {
+                "data:structures:wing:spar:web:depth": {"h_web": 1.0},
+                "data:structures:wing:spar:web:thickness": dspar["t_web"],
+                "data:structures:wing:spar:flange:depth": dspar["a_flange"],
+                "data:structures:wing:spar:flange:thickness": dspar["b_flange"],
+                "data:structures:wing:spar:depth": {"h_web": 1 + k_spar, "k_spar": h_web},
+            }
+        local_partials["data:weight:airframe:wing:spar:mass"] = {
+            key: 2 * value for key, value in dspar["m_spar"].items()
+        }
+
+        # The spar is sized for a stress at root equal to the max stress (before the under-sizing
+        # coefficient k_dim is applied): the partials of the sizing dimension are obtained
+        # from those of the stress.
+        k_dim = inputs[k_dim_name]
+        ddim = {
+            input_name: -k_dim * dsig["M_root"] / dsig[dim] * dM
+            for input_name, dM in dM_root.items()
+        }
+        ddim["data:structures:wing:spar:stress:max"] = k_dim / dsig[dim]
+        ddim[k_spar_name] = -k_dim * dsig["k_spar"] / dsig[dim]
+        ddim[k_dim_name] = d_out_0 if spar_model == "pipe" else h_web_0
+
+        # derivatives of the local variables w.r.t. the inputs
+        dlocal = {input_name: {dim: value} for input_name, value in ddim.items()}
+        dlocal[k_spar_name]["k_spar"] = 1.0
+        dlocal["data:geometry:wing:span"] = {"L": 0.5}
+        dlocal["data:weight:airframe:wing:spar:density"] = {"rho_spar": 1.0}
+
+        for output_name, local in local_partials.items():
+            # the spar dimensions do not depend on the spar length and density
+            input_names = dlocal if output_name.startswith("data:weight:") else ddim
+            for input_name in input_names:
+                partials[output_name, input_name] = sum(
+                    local.get(key, 0.0) * value for key, value in dlocal[input_name].items()
+                )
+
 
 class Ribs(om.ExplicitComponent):
     """
@@ -238,8 +375,12 @@ class Ribs(om.ExplicitComponent):
         self.add_output("data:structures:wing:ribs:number", units=None, lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("data:weight:airframe:wing:ribs:mass", "*", method="exact")
+        self.declare_partials(
+            "data:structures:wing:ribs:number",
+            ["data:geometry:wing:span", "data:geometry:wing:MAC:length"],
+            method="exact",
+        )
 
     def compute(self, inputs, outputs):
         b_w = inputs["data:geometry:wing:span"]
@@ -259,6 +400,48 @@ class Ribs(om.ExplicitComponent):
         outputs["data:weight:airframe:wing:ribs:mass"] = 2 * m_ribs
         outputs["data:structures:wing:ribs:number"] = 2 * N_ribs
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        b_w = inputs["data:geometry:wing:span"]
+        c_MAC = inputs["data:geometry:wing:MAC:length"]
+        c_root = inputs["data:geometry:wing:root:chord"]
+        c_tip = inputs["data:geometry:wing:tip:chord"]
+        t_root = inputs["data:geometry:wing:root:thickness"]
+        t_tip = inputs["data:geometry:wing:tip:thickness"]
+        t_rib = inputs["data:structures:wing:ribs:thickness"]
+        rho_rib = inputs["data:weight:airframe:wing:ribs:density"]
+
+        # RIBS (both sides)
+        N_ribs = 2 * b_w / c_MAC  # number of ribs [-]
+        m_rib = rho_rib * t_rib * (c_root * t_root + c_tip * t_tip) / 2  # mass of one rib [kg]
+        m_ribs = N_ribs * m_rib  # mass of ribs [kg]
+
+        partials["data:structures:wing:ribs:number", "data:geometry:wing:span"] = 2 / c_MAC
+        partials["data:structures:wing:ribs:number", "data:geometry:wing:MAC:length"] = (
+            -N_ribs / c_MAC
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:span"] = m_ribs / b_w
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:MAC:length"] = (
+            -m_ribs / c_MAC
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:root:chord"] = (
+            N_ribs * rho_rib * t_rib * t_root / 2
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:tip:chord"] = (
+            N_ribs * rho_rib * t_rib * t_tip / 2
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:root:thickness"] = (
+            N_ribs * rho_rib * t_rib * c_root / 2
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:geometry:wing:tip:thickness"] = (
+            N_ribs * rho_rib * t_rib * c_tip / 2
+        )
+        partials["data:weight:airframe:wing:ribs:mass", "data:structures:wing:ribs:thickness"] = (
+            m_ribs / t_rib
+        )
+        partials[
+            "data:weight:airframe:wing:ribs:mass", "data:weight:airframe:wing:ribs:density"
+        ] = m_ribs / rho_rib
+
 
 class Skin(om.ExplicitComponent):
     """
@@ -271,8 +454,7 @@ class Skin(om.ExplicitComponent):
         self.add_output("data:weight:airframe:wing:skin:mass", units="kg", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         S_w = inputs["data:geometry:wing:surface"]
@@ -283,6 +465,16 @@ class Skin(om.ExplicitComponent):
 
         outputs["data:weight:airframe:wing:skin:mass"] = 2 * m_skin
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        S_w = inputs["data:geometry:wing:surface"]
+        rho_skin = inputs["data:weight:airframe:wing:skin:density"]
+
+        # the skin surface is two times the planform area
+        partials["data:weight:airframe:wing:skin:mass", "data:geometry:wing:surface"] = 2 * rho_skin
+        partials[
+            "data:weight:airframe:wing:skin:mass", "data:weight:airframe:wing:skin:density"
+        ] = 2 * S_w
+
 
 class WingComponent(om.ExplicitComponent):
     """
@@ -296,8 +488,8 @@ class WingComponent(om.ExplicitComponent):
         self.add_output("data:weight:airframe:wing:mass", units="kg", lower=0.0)
 
     def setup_partials(self):
-        # Finite difference all partials.
-        self.declare_partials("*", "*", method="fd")
+        # Wing mass is a plain sum of the structural parts masses
+        self.declare_partials("*", "*", val=1.0)
 
     def compute(self, inputs, outputs):
         m_spar = inputs["data:weight:airframe:wing:spar:mass"]
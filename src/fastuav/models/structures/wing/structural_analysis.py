@@ -43,6 +43,33 @@ class WingStructuralAnalysisModels:
         sig_root = (32 * M_root) / (np.pi * (1 - k_spar**4) * d_out**3)
         return sig_root
 
+    @staticmethod
+    def i_beam_stress_partials(M_root, h_web, k_spar, k_flange=0.1):
+        """
+        Computes the partial derivatives of the stress at root of a cantilever I-shaped beam
+        (see i_beam_stress) with respect to M_root, h_web and k_spar.
+        """
+        sig_root = WingStructuralAnalysisModels.i_beam_stress(M_root, h_web, k_spar, k_flange)
+        return {
+            "M_root": sig_root / M_root,
+            "h_web": -3 * sig_root / h_web,
+            "k_spar": sig_root
+            * (1 / (1 + k_spar) - 2 / k_spar - 2 * k_spar / 3 / (1 + k_spar**2 / 3)),
+        }
+
+    @staticmethod
+    def pipe_stress_partials(M_root, d_out, k_spar):
+        """
+        Computes the partial derivatives of the stress at root of a cantilever pipe
+        (see pipe_stress) with respect to M_root, d_out and k_spar.
+        """
+        sig_root = WingStructuralAnalysisModels.pipe_stress(M_root, d_out, k_spar)
+        return {
+            "M_root": sig_root / M_root,
+            "d_out": -3 * sig_root / d_out,
+            "k_spar": sig_root * 4 * k_spar**3 / (1 - k_spar**4),
+        }
+
 
 class SparsStressVTOL(om.ExplicitComponent):
     """
@@ -85,7 +112,7 @@ class SparsStressVTOL(om.ExplicitComponent):
         self.add_output("data:structures:wing:spar:stress:VTOL", units="N/m**2")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="exact")
 
     def compute(self, inputs, outputs):
         spar_model = self.options["spar_model"]
@@ -113,3 +140,41 @@ class SparsStressVTOL(om.ExplicitComponent):
             sig_root = WingStructuralAnalysisModels.i_beam_stress(M_root, h_web, k_spar)
 
         outputs["data:structures:wing:spar:stress:VTOL"] = sig_root
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        spar_model = self.options["spar_model"]
+        propulsion_id = self.options["propulsion_id"]
+        F_pro_to = inputs["data:propulsion:%s:propeller:thrust:takeoff" % propulsion_id]
+        N_pro = inputs["data:propulsion:%s:propeller:number" % propulsion_id]
+        y_pro_MR = inputs["data:geometry:%s:propeller:y" % propulsion_id]
+
+        M_root = F_pro_to * N_pro / 2 * y_pro_MR  # bending moment at spar's root [N.m]
+
+        if spar_model == "pipe":
+            d_out_name = "data:structures:wing:spar:diameter:outer"
+            k_spar_name = "optimization:variables:structures:wing:spar:diameter:k"
+            dsig = WingStructuralAnalysisModels.pipe_stress_partials(
+                M_root, inputs[d_out_name], inputs[k_spar_name]
+            )
+            partials["data:structures:wing:spar:stress:VTOL", d_out_name] = dsig["d_out"]
+        else:
+            h_web_name = "data:structures:wing:spar:web:depth"
+            k_spar_name = "optimization:variables:structures:wing:spar:depth:k"
+            dsig = WingStructuralAnalysisModels.i_beam_stress_partials(
+                M_root, inputs[h_web_name], inputs[k_spar_name]
+            )
+            partials["data:structures:wing:spar:stress:VTOL", h_web_name] = dsig["h_web"]
+        partials["data:structures:wing:spar:stress:VTOL", k_spar_name] = dsig["k_spar"]
+
+        partials[
+            "data:structures:wing:spar:stress:VTOL",
+            "data:propulsion:%s:propeller:thrust:takeoff" % propulsion_id,
+        ] = dsig["M_root"] * N_pro / 2 * y_pro_MR
+        partials[
+            "data:structures:wing:spar:stress:VTOL",
+            "data:propulsion:%s:propeller:number" % propulsion_id,
+        ] = dsig["M_root"] * F_pro_to / 2 * y_pro_MR
+        partials[
+            "data:structures:wing:spar:stress:VTOL",
+            "data:geometry:%s:propeller:y" % propulsion_id,
+        ] = dsig["M_root"] * F_pro_to * N_pro / 2
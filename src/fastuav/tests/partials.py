@@ -0,0 +1,36 @@
+"""
+Check of the partial derivatives of the components, shared by the tests of the models.
+"""
+
+import fastoad.api as oad
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials
+
+
+def check_partials(system, inputs: dict, atol=1e-7, rtol=1e-6, options=None, **check_options):
+    """
+    Compares the partial derivatives of a system with central finite differences.
+
+    :param system: system to check, or identifier of a registered system
+    :param inputs: values of the inputs of the system (those that are not provided keep their
+                   default values)
+    :param atol: absolute tolerance on the partial derivatives
+    :param rtol: relative tolerance on the partial derivatives
+    :param options: options of the registered system
+    :param check_options: options of Problem.check_partials, in addition to the default ones
+    """
+    if isinstance(system, str):
+        # the registered modules are loaded by FAST-OAD, importing them directly breaks the registry
+        system = oad.RegisterOpenMDAOSystem.get_system(system, options=options)
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("system", system, promotes=["*"])
+    prob.setup()
+    for _, meta in prob.model.list_inputs(prom_name=True, out_stream=None):
+        if meta["prom_name"] in inputs:
+            prob[meta["prom_name"]] = inputs[meta["prom_name"]]
+    prob.run_model()
+
+    check_options = dict(dict(method="fd", form="central", step=1e-7), **check_options)
+    data = prob.check_partials(out_stream=None, **check_options)
+    assert_check_partials(data, atol=atol, rtol=rtol)
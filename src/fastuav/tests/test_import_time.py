@@ -0,0 +1,26 @@
+"""
+Import-time budget of the FAST-UAV plugin (see fastuav.utils.import_time).
+"""
+
+import os
+
+from fastuav.utils.import_time import (
+    import_time_report,
+    imported_heavy_modules,
+    plugin_modules,
+)
+
+# Import time budget [s] of the fastuav modules themselves (FAST-OAD and OpenMDAO excluded).
+# It can be relaxed on slow machines with the FASTUAV_IMPORT_TIME_BUDGET environment variable.
+IMPORT_TIME_BUDGET = float(os.environ.get("FASTUAV_IMPORT_TIME_BUDGET", 2.0))
+
+
+def test_plugin_import_time():
+    report = import_time_report(plugin_modules("fastuav.models"))
+    assert "fastuav.models" in report
+
+    # catalogue estimators, drivers and post-processing libraries are imported at first use
+    assert imported_heavy_modules(report) == []
+
+    own_time = sum(t for name, (t, _) in report.items() if name.split(".")[0] == "fastuav")
+    assert own_time < IMPORT_TIME_BUDGET
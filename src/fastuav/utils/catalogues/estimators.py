@@ -2,11 +2,16 @@
 Decision Tree for discrete optimization from catalogues
 """
 
+import hashlib
+import os
+import os.path as pth
+import pickle
+
 import numpy as np
 import pandas as pd
-from sklearn.neighbors import NearestNeighbors
-from sklearn.preprocessing import StandardScaler
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+# scikit-learn and scipy.spatial are imported at first use, as catalogues are only used for
+# off-the-shelf components selection.
 
 
 class DecisionTreeRgr:
@@ -34,116 +39,61 @@ class DecisionTreeRgr:
         # Outputs
         self._regressor = None
 
-    def train(self, dist=1000):
-        """
-        Decision tree training
+    def train(self, dist=1000, cache_dir=None):
         """
+        Decision tree training.
 
-        # we call the x values of the dataframe
-        self._df_X = pd.DataFrame(self._df_X)
-        self._df_y = pd.DataFrame(self._df_y)
-        xy = pd.concat([self._df_X, self._df_y], axis=1)  # concatenate columns x and y
-        sorted_xy = xy.drop_duplicates(subset=self._df_X.columns)
-        sorted_xy.columns = range(len(xy.columns))
-
-        df1 = pd.DataFrame([])  # save new extra points for criteria of next or previous
-
-        for i in range(len(self._df_X.columns)):
-            if self._crits[i] == "next":  # if argument is next
-                # x axis
-                sorted_xy = sorted_xy.sort_values(sorted_xy.columns[i], ascending=True)
-                C = np.vstack(
-                    (
-                        sorted_xy.iloc[:, i] - sorted_xy.iloc[:, i].min() / dist,
-                        sorted_xy.iloc[:, i] + sorted_xy.iloc[:, i].min() / dist,
-                    )
-                ).ravel("F")  # create a sequence of supplementary points
-                D = np.repeat(C, 2)  # repeat each element of the column twice
-                df_X_Next = np.column_stack(D[:-2]).reshape(-1, 1)  # convert an array in column
-
-                # axis y
-                t = len(sorted_xy.columns) - len(self._df_y.columns)
-                df_y1 = sorted_xy.iloc[:, t:]
-                df_y1_C1 = df_y1 - df_y1.min() / dist
-                df_y1_C2 = df_y1 + df_y1.min() / dist
-                A = df_y1_C1.loc[df_y1_C1.index.repeat(2)].reset_index(drop=True)
-                B = df_y1_C2.loc[df_y1_C2.index.repeat(2)].reset_index(drop=True)
-                C = pd.concat([A, B]).sort_index(kind="merge")
-                C = C.drop(C.index[[2, 3]])
-                df_y_Next = C
-                df_y_Next = df_y_Next.reset_index(drop=True)
-
-                # rest of independent axis
-                df_X_rest = sorted_xy.iloc[:, : len(self._df_X.columns)]  # select the columns of X
-                df_X_rest = df_X_rest.iloc[
-                    :, df_X_rest.columns != df_X_rest.columns[i]
-                ]  # skip selected column
-                df_X_rest = (
-                    pd.concat([df_X_rest] * 4).sort_index().iloc[2:]
-                )  # repeat the rows 4 times and delete the first two ones
-                df_X_rest = df_X_rest.reset_index(drop=True)
-                df_X_rest.insert(
-                    i, sorted_xy.columns[i], df_X_Next
-                )  # insert the column of dataframe in df_X_rest
-
-                # Concatenate the new supplementary points together into a dataframe
-                extra_pts = pd.concat([df_X_rest, df_y_Next], axis=1)
-                df1 = df1.append(extra_pts)
-
-            if self._crits[i] == "previous":  # if argument is previous
-                # x axis
-                sorted_xy = sorted_xy.sort_values(sorted_xy.columns[i], ascending=True)
-                C = np.vstack(
-                    (
-                        sorted_xy.iloc[:, i] - sorted_xy.iloc[:, i].min() / dist,
-                        sorted_xy.iloc[:, i] + sorted_xy.iloc[:, i].min() / dist,
-                    )
-                ).ravel("F")
-                D = np.repeat(C, 2)
-                df_X_Prev = np.column_stack(np.delete(np.delete(D, 2), 2)).reshape(
-                    -1, 1
-                )  # convert an array in column
-
-                # axis y
-                t = len(sorted_xy.columns) - len(self._df_y.columns)
-                df_y1 = sorted_xy.iloc[:, t:]
-                df_y1_C1 = df_y1 - df_y1.min() / dist
-                df_y1_C2 = df_y1 + df_y1.min() / dist
-                A = df_y1_C1.loc[df_y1_C1.index.repeat(2)].reset_index(drop=True)
-                B = df_y1_C2.loc[df_y1_C2.index.repeat(2)].reset_index(drop=True)
-                C = pd.concat([A, B]).sort_index(kind="merge")
-                df_yPrev = C[:-2]
-                df_yPrev = df_yPrev.reset_index(drop=True)
-
-                # rest of independent axis
-                df_X_rest = sorted_xy.iloc[:, : len(self._df_X.columns)]  # select the columns of X
-                df_X_rest = df_X_rest.iloc[
-                    :, df_X_rest.columns != df_X_rest.columns[i]
-                ]  # skip selected column
-                df_X_rest = (
-                    pd.concat([df_X_rest] * 4).sort_index().iloc[:-2]
-                )  # repeat the rows 4 times and delete the first two ones
-                df_X_rest = df_X_rest.reset_index(drop=True)
-                df_X_rest.insert(
-                    i, sorted_xy.columns[i], df_X_Prev
-                )  # insert the column of dataframe in df_X_rest
-
-                # Concatenate the new supplementary points together into a dataframe
-                extra_pts = pd.concat([df_X_rest, df_yPrev], axis=1)
-                df1 = df1.append(extra_pts)
-
-            # sorted_xy = df1.append(sorted_xy) # TEST 29/07/2021
-
-        #     sorted_xy.columns = df1.columns
-        sorted_xy = df1.append(sorted_xy)
-        self._df_X = sorted_xy.iloc[:, : len(self._df_X.columns)]
-        self._df_y = sorted_xy.iloc[:, len(self._df_X.columns) :]
+        Supplementary points are added on both sides of each catalogue value of the features
+        with 'next' or 'previous' criteria, so that the tree predicts a staircase function
+        selecting the next or previous product.
+
+        :param dist: inverse of the relative offset of the supplementary points
+        :param cache_dir: if provided, directory where the fitted trees are cached, keyed by
+                          a hash of the catalogue data and of the selection criteria
+        :return: fitted regressor
+        """
+        X = np.asarray(self._df_X, dtype=float)
+        X = X.reshape(len(X), -1)
+        y = np.asarray(self._df_y, dtype=float)
+        y = y.reshape(len(y), -1)
+
+        import sklearn
+        from sklearn.tree import DecisionTreeRegressor
+
+        cache_path = None
+        if cache_dir is not None:
+            key = hashlib.sha1()
+            for data in (X, y, np.asarray(self._crits[: X.shape[1]], dtype=str), dist):
+                key.update(np.ascontiguousarray(data).tobytes())
+            key.update(sklearn.__version__.encode())
+            cache_path = pth.join(cache_dir, "decision_tree-%s.pkl" % key.hexdigest()[:16])
+            try:
+                with open(cache_path, "rb") as file:
+                    self._df_X, self._df_y, self._regressor = pickle.load(file)
+                return self._regressor
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                pass  # no cached tree
+
+        # remove duplicated points
+        _, first_indices = np.unique(X, axis=0, return_index=True)
+        first_indices = np.sort(first_indices)
+        X, y = X[first_indices], y[first_indices]
+
+        # supplementary points for criteria of next or previous
+        extra_X, extra_y = [], []
+        for i in range(X.shape[1]):
+            if self._crits[i] in ["next", "previous"]:
+                X_i, y_i = _staircase_points(X, y, i, self._crits[i], dist)
+                extra_X.append(X_i)
+                extra_y.append(y_i)
+        self._df_X = np.concatenate(extra_X + [X])
+        self._df_y = np.concatenate(extra_y + [y])
 
         # create a regressor object (https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html)
         self._regressor = DecisionTreeRegressor(
             criterion="squared_error",
             max_depth=None,
-            max_features=len(self._df_X.columns),
+            max_features=self._df_X.shape[1],
             max_leaf_nodes=len(self._df_X),
             min_impurity_decrease=0.0,
             min_samples_leaf=1,
@@ -154,7 +104,55 @@ class DecisionTreeRgr:
         )
 
         # fit the regressor with X and Y data
-        return self._regressor.fit(self._df_X, self._df_y)
+        self._regressor.fit(self._df_X, self._df_y)
+
+        if cache_path is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = cache_path + ".%i.tmp" % os.getpid()
+                with open(tmp_path, "wb") as file:
+                    pickle.dump((self._df_X, self._df_y, self._regressor), file)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # tree is not cached
+
+        return self._regressor
+
+
+def _staircase_points(X, y, i, crit, dist):
+    """
+    Supplementary points of the decision tree regressor for a feature with 'next' or 'previous'
+    criterion. The products are sorted by increasing values x_j of the feature i, and each product
+    j gets points just above the previous value x_(j-1) and just below its own value x_j ('next'),
+    or just above its own value x_j and just below the next value x_(j+1) ('previous').
+    The outputs of the points are offset from the product outputs y_j on both sides.
+
+    :param X: (n, n_features) array of the features of the products
+    :param y: (n, n_outputs) array of the outputs of the products
+    :param i: index of the feature
+    :param crit: 'next' or 'previous'
+    :param dist: inverse of the relative offset of the points
+    :return: features and outputs of the supplementary points
+    """
+    order = np.argsort(X[:, i], kind="stable")
+    X, y = X[order], y[order]
+    eps_x = X[:, i].min() / dist
+    eps_y = y.min(axis=0) / dist
+
+    # x_0-, x_0-, x_0+, x_0+, x_1-, x_1-, ...
+    x_steps = np.repeat(np.column_stack((X[:, i] - eps_x, X[:, i] + eps_x)).ravel(), 2)
+    # y_0-, y_0+, y_0-, y_0+, y_1-, y_1+, ...
+    y_pairs = np.stack((y - eps_y, y + eps_y), axis=1)
+    y_steps = np.concatenate((y_pairs, y_pairs), axis=1).reshape(-1, y.shape[1])
+    X_steps = np.repeat(X, 4, axis=0)  # each product repeated 4 times
+
+    if crit == "next":
+        X_steps, y_steps = X_steps[2:], y_steps[2:]
+        X_steps[:, i] = x_steps[:-2]
+    else:
+        X_steps, y_steps = X_steps[:-2], y_steps[:-2]
+        X_steps[:, i] = np.delete(x_steps, [2, 3])
+    return X_steps, y_steps
 
 
 class DecisionTreeClf:
@@ -182,6 +180,8 @@ class DecisionTreeClf:
         self._clf = None  # classifier
 
     def train(self):
+        from sklearn.tree import DecisionTreeClassifier
+
         df_X = self._df[
             self._X_names
         ]  # training input samples (here the values of the definition parameters)
@@ -263,91 +263,171 @@ class NearestNeighbor:
         self._df = df  # dataframe
         self._X_names = X_names  # features names
         self._crits = crits  # criteria for selection
-        self._clf = None  # classifier
-        self._scaler = None  # scaler for data scaling
+        self._X_train = None  # features of the products
+        self._X_scaled = None  # scaled features of the products
+        self._tree = None  # KD-tree of the scaled features
+        self._mean = None  # mean of the features, for data scaling
+        self._scale = None  # standard deviation of the features, for data scaling
+        self._sorted_values = None  # sorted unique values of each feature
 
     def train(self):
-        df_X = self._df[
-            self._X_names
-        ]  # training input samples (here the values of the definition parameters)
+        """
+        Builds the catalogue index: the sorted values of each feature, used to snap the inputs
+        to the next or previous catalogue values, and a KD-tree of the scaled features.
+        """
+        X_train = self._df[self._X_names].to_numpy(
+            dtype=float
+        )  # training input samples (here the values of the definition parameters)
+
+        from scipy.spatial import cKDTree
 
-        # scaling
-        self._scaler = scaler = StandardScaler()
-        scaler.fit(df_X)
-        df_X = scaler.transform(df_X)
+        # scaling (standardization, with unit scale for constant features)
+        self._mean = np.nanmean(X_train, axis=0)
+        self._scale = np.nanstd(X_train, axis=0)
+        self._scale[self._scale == 0.0] = 1.0
 
         # training
-        clf = NearestNeighbors(n_neighbors=1, algorithm="ball_tree")
-        self._clf = clf.fit(df_X)
+        self._X_train = X_train
+        self._X_scaled = (X_train - self._mean) / self._scale
+        self._tree = cKDTree(self._X_scaled)
+        self._sorted_values = [np.unique(x[~np.isnan(x)]) for x in X_train.T]
 
-    def predict(self, X):
-        df = self._df
-        X_names = self._X_names
-        crits = self._crits
-        clf = self._clf
-        scaler = self._scaler
+    def predict_index(self, X):
+        """
+        :param X: values of the features
+        :return: position in the dataframe of the closest product
+        """
+        x = np.array([np.asarray(x_i, dtype=float).flat[0] for x_i in X])
+        return self.predict_many(x[np.newaxis, :])[0]
 
-        # select upper values of parameters in database if asked by user
-        for i, x_name in enumerate(X_names):
-            if crits[i] == "next":
-                x = X[i][0]
-                upperneighbours_df = df[df[x_name] >= x][
-                    x_name
-                ]  # select subset of upper neighbours
-                if not upperneighbours_df.empty:
-                    upperneighbour_ind = upperneighbours_df.idxmin()
-                    X[i] = df[x_name][
-                        upperneighbour_ind
-                    ]  # assign closest upper value to input parameter
+    def predict_many(self, X):
+        """
+        Vectorized selection of the closest products for many sets of features at once
+        (e.g. to post-process the designs of a DoE or of a Pareto front).
 
-            elif crits[i] == "previous":
-                x = X[i][0]
-                lowerneighbour_df = df[df[x_name] <= x][x_name]  # select subset of lower neighbours
-                if not lowerneighbour_df.empty:
-                    lowerneighbour_ind = lowerneighbour_df.idxmax()
-                    X[i] = df[x_name][
-                        lowerneighbour_ind
-                    ]  # assign closest lower value to input parameter
+        :param X: (N, n_features) array of the values of the features
+        :return: (N,) array of the positions in the dataframe of the closest products
+        """
+        X = np.array(X, dtype=float, ndmin=2)
+
+        # select upper or lower values of parameters in database if asked by user
+        for i, crit in enumerate(self._crits):
+            X[:, i] = _snap(self._sorted_values[i], X[:, i], crit)
 
         # predict output
-        df_X = pd.DataFrame({x_name: [np.asarray(x).flat[0]] for x_name, x in zip(X_names, X)})
-        df_X = scaler.transform(df_X)
-        distances, indices = clf.kneighbors(df_X)
-        df_y = df.iloc[[indices[0][0]]]  # get corresponding product data
+        _, indices = self._tree.query((X - self._mean) / self._scale)
+        return indices
 
-        return df_y
+    def predict(self, X):
+        """
+        :param X: values of the features
+        :return: dataframe with the data of the closest product
+        """
+        return self._df.iloc[[self.predict_index(X)]]  # get corresponding product data
 
     def predict2(self, X):
-        df = self._df
-        X_names = self._X_names
-        crits = self._crits
-        clf = self._clf
-        scaler = self._scaler
+        """
+        :param X: values of the features
+        :return: dataframe with the data of the closest product that meets the selection criteria
+        """
+        return self._df.iloc[[self.predict2_index(X)]]  # get nearest neighbor
 
-        # predict output
-        k = df.shape[0]  # number of neighbors to select
-        df_X = pd.DataFrame({x_name: x for x_name, x in zip(X_names, X)})
-        df_X = scaler.transform(df_X)
-        distances, indices = clf.kneighbors(df_X, k)
-
-        # enforce upper or lower values if asked by user
-        closest_feasible_id = indices[0][0]
-        for j in range(
-            0, len(indices[0]) - 1
-        ):  # iterate from nearest neighbor to farthest until criteria are met
-            is_feasible = True
-            idx = indices[0][j]
-            neigh = df.iloc[idx]
-            for i, x_name in enumerate(X_names):
-                if crits[i] == "next" and neigh[x_name] < X[i][0]:  # criterion not met
-                    is_feasible = False
-                    break  # continue to next neighbor
-                elif crits[i] == "previous" and neigh[x_name] > X[i][0]:  # criterion not met
-                    is_feasible = False
-                    break  # continue to next neighbor
-            if is_feasible:  # "next" or "previous" criteria are met
-                closest_feasible_id = idx  # return nearest neighbor that meets criteria
-                break
-
-        df_y = df.iloc[[closest_feasible_id]]  # get nearest neighbor
-        return df_y
+    def predict2_index(self, X):
+        """
+        :param X: values of the features
+        :return: position in the dataframe of the closest product that meets the selection criteria
+        """
+        x = np.array([np.asarray(x_i, dtype=float).flat[0] for x_i in X])
+        return self.predict2_many(x[np.newaxis, :])[0]
+
+    def predict2_many(self, X, k=8, chunk_size=2**16):
+        """
+        Vectorized selection of the closest products that meet the 'next' and 'previous' criteria,
+        for many sets of features at once. If no product meets the criteria, the closest product
+        is selected.
+
+        Only the k nearest neighbors are searched first, and k is doubled for the sets of features
+        without feasible neighbor until the whole catalogue is searched (early exit for large
+        catalogues). The sets of features are processed by chunks, so that memory stays bounded.
+
+        :param X: (N, n_features) array of the values of the features
+        :param k: number of nearest neighbors searched first. If None, the whole catalogue is
+                  searched at once.
+        :param chunk_size: maximum number of candidate products checked at once
+        :return: (N,) array of the positions in the dataframe of the closest feasible products
+        """
+        X = np.array(X, dtype=float, ndmin=2)
+        X_scaled = (X - self._mean) / self._scale
+        n = len(self._X_train)
+
+        indices = np.empty(len(X), dtype=int)
+        remaining = np.arange(len(X))  # sets of features without feasible neighbor yet
+        k = n if k is None else min(k, n)
+        while len(remaining) > 0:
+            n_rows = max(1, chunk_size // k)  # sets of features per chunk
+            is_found = np.concatenate(
+                [
+                    self._predict2_chunk(X, X_scaled, chunk, k, indices)
+                    for chunk in np.split(remaining, np.arange(n_rows, len(remaining), n_rows))
+                ]
+            )
+            remaining = remaining[~is_found]
+            k = min(2 * k, n)
+        return indices
+
+    def _predict2_chunk(self, X, X_scaled, rows, k, indices):
+        """
+        Searches the closest feasible products among the k nearest neighbors of some sets of
+        features.
+
+        :param X: (N, n_features) array of the values of the features
+        :param X_scaled: (N, n_features) array of the scaled values of the features
+        :param rows: positions of the sets of features to process
+        :param k: number of nearest neighbors
+        :param indices: (N,) array of the positions of the selected products, updated in place
+        :return: boolean array, True for the sets of features whose selection is done
+        """
+        _, neighbors = self._tree.query(X_scaled[rows], k=k)
+        neighbors = neighbors.reshape(len(rows), k)  # sorted from nearest to farthest
+        is_feasible = self._is_feasible(X[rows], self._X_train[neighbors])
+        is_found = is_feasible.any(axis=1)
+        if k == len(self._X_train):
+            is_found[:] = True  # whole catalogue searched
+        nearest_feasible = np.argmax(
+            is_feasible, axis=1
+        )  # nearest neighbor (0) if no neighbor is feasible
+        indices[rows[is_found]] = neighbors[is_found, nearest_feasible[is_found]]
+        return is_found
+
+    def _is_feasible(self, X, neighbors):
+        """
+        :param X: (N, n_features) array of the values of the features
+        :param neighbors: (N, k, n_features) array of the features of the candidate products
+        :return: (N, k) boolean array, True for the candidates that meet the selection criteria
+        """
+        is_next = np.array([crit == "next" for crit in self._crits])
+        is_previous = np.array([crit == "previous" for crit in self._crits])
+        X = X[:, np.newaxis, :]
+        return np.all((~is_next | (neighbors >= X)) & (~is_previous | (neighbors <= X)), axis=-1)
+
+
+def _snap(sorted_values, x, crit):
+    """
+    Snaps values to the closest upper ('next') or lower ('previous') values of a sorted array.
+    The values are left unchanged for the 'average' criterion, or if there is no such value.
+
+    :param sorted_values: sorted array of the catalogue values of a feature
+    :param x: array of values to snap
+    :param crit: selection criterion
+    :return: snapped values
+    """
+    n = len(sorted_values)
+    if crit == "next":
+        i = np.searchsorted(sorted_values, x, side="left")
+        return np.where(i < n, sorted_values[np.minimum(i, n - 1)], x)  # closest upper value
+    if crit == "previous":
+        i = np.searchsorted(sorted_values, x, side="right") - 1
+        return np.where(
+            (i >= 0) & ~np.isnan(x), sorted_values[np.maximum(i, 0)], x
+        )  # closest lower value
+    return x
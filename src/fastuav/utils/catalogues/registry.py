@@ -0,0 +1,159 @@
+"""
+Registry of the components catalogues.
+
+Catalogues are loaded on first use and kept in memory, so that importing the models does not
+parse any CSV file. A binary copy of each catalogue is stored in a cache directory
+(FASTUAV_CATALOGUES_CACHE environment variable, or ~/.cache/fastuav/catalogues by default):
+the next processes, e.g. the workers of a DoE or of the CMA-ES driver, read it from a
+memory-mapped .npy file instead of parsing the CSV file again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import os.path as pth
+
+import numpy as np
+import pandas as pd
+
+from fastuav.utils.catalogues.estimators import DecisionTreeRgr, NearestNeighbor
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
+
+CACHE_DIR = os.environ.get(
+    "FASTUAV_CATALOGUES_CACHE",
+    pth.join(pth.expanduser("~"), ".cache", "fastuav", "catalogues"),
+)
+
+_catalogues = {}  # loaded catalogues, by path
+_estimators = {}  # trained estimators, by path, features names and selection criteria
+_regressors = {}  # fitted decision trees, by path, features and outputs names and selection criteria
+
+
+def load_catalogue(path, sep=";") -> pd.DataFrame:
+    """
+    Loads a catalogue, from memory if it has already been loaded by the current process,
+    else from the binary cache if it is up to date, else from the CSV file.
+
+    :param path: path to the CSV file of the catalogue
+    :param sep: separator of the CSV file
+    :return: dataframe of the catalogue
+    """
+    path = pth.abspath(path)
+    if path not in _catalogues:
+        _catalogues[path] = _read_catalogue(path, sep)
+    return _catalogues[path]
+
+
+def catalogue_estimator(path, X_names, crits) -> NearestNeighbor:
+    """
+    Provides a trained nearest neighbor estimator for a catalogue. Estimators are shared by all
+    the components that select products from the same catalogue with the same criteria.
+
+    :param path: path to the CSV file of the catalogue
+    :param X_names: array of features names
+    :param crits: array of selection criteria (see NearestNeighbor)
+    :return: trained estimator
+    """
+    key = (pth.abspath(path), tuple(X_names), tuple(crits))
+    if key not in _estimators:
+        clf = NearestNeighbor(df=load_catalogue(path), X_names=list(X_names), crits=list(crits))
+        clf.train()
+        _estimators[key] = clf
+    return _estimators[key]
+
+
+def catalogue_regressor(path, X_names, y_names, crits):
+    """
+    Provides a fitted decision tree regressor for a catalogue (see DecisionTreeRgr).
+    The fitted trees are also cached on disk, next to the binary copies of the catalogues.
+
+    :param path: path to the CSV file of the catalogue
+    :param X_names: array of features names
+    :param y_names: array of outputs names
+    :param crits: array of selection criteria (see DecisionTreeRgr)
+    :return: fitted regressor
+    """
+    key = (pth.abspath(path), tuple(X_names), tuple(y_names), tuple(crits))
+    if key not in _regressors:
+        df = load_catalogue(path)
+        _regressors[key] = DecisionTreeRgr(df[list(X_names)], df[list(y_names)], list(crits)).train(
+            cache_dir=CACHE_DIR
+        )
+    return _regressors[key]
+
+
+def clear_catalogues():
+    """
+    Forgets the catalogues and estimators loaded by the current process.
+    The binary cache on disk is kept.
+    """
+    _catalogues.clear()
+    _estimators.clear()
+    _regressors.clear()
+
+
+def _read_catalogue(path, sep):
+    """
+    Reads a catalogue from the binary cache, or parses the CSV file and updates the cache.
+    The cache entry is keyed by the path, the modification time and the size of the CSV file.
+    """
+    stat = os.stat(path)
+    key = hashlib.sha1(
+        ("%s|%s|%i|%i" % (path, sep, stat.st_mtime_ns, stat.st_size)).encode()
+    ).hexdigest()[:16]
+    cache_path = pth.join(CACHE_DIR, "%s-%s" % (pth.splitext(pth.basename(path))[0], key))
+
+    try:
+        return _read_cache(cache_path)
+    except (OSError, ValueError, KeyError):
+        pass  # no up-to-date cache entry
+
+    df = pd.read_csv(path, sep=sep)
+    try:
+        _write_cache(cache_path, df)
+    except OSError as e:
+        _LOGGER.debug("Catalogue %s could not be cached: %s", path, e)
+    return df
+
+
+def _read_cache(cache_path):
+    """
+    Reads a catalogue from the binary cache: numeric columns are memory-mapped from a .npy file,
+    the other columns and the column names and types are read from a .json file.
+    """
+    with open(cache_path + ".json") as file:
+        meta = json.load(file)
+    values = np.load(cache_path + ".npy", mmap_mode="r")
+    df = pd.DataFrame(values, columns=meta["numeric_columns"], copy=False)
+    for name, column in meta["other_columns"].items():
+        df[name] = column
+    return df[meta["columns"]].astype(meta["dtypes"], copy=False)
+
+
+def _write_cache(cache_path, df):
+    """
+    Writes a catalogue to the binary cache (see _read_cache).
+    The files are written to temporary files first, so that concurrent processes never read
+    an incomplete cache entry.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    numeric_columns = list(df.select_dtypes(include="number").columns)
+    other_columns = [name for name in df.columns if name not in numeric_columns]
+    meta = {
+        "columns": list(df.columns),
+        "dtypes": {name: str(dtype) for name, dtype in df.dtypes.items()},
+        "numeric_columns": numeric_columns,
+        "other_columns": {
+            name: df[name].astype(object).where(df[name].notna(), None).tolist()
+            for name in other_columns
+        },
+    }
+    tmp_suffix = ".%i.tmp" % os.getpid()
+    with open(cache_path + ".npy" + tmp_suffix, "wb") as file:
+        np.save(file, df[numeric_columns].to_numpy(dtype=float))
+    with open(cache_path + ".json" + tmp_suffix, "w") as file:
+        json.dump(meta, file)
+    os.replace(cache_path + ".npy" + tmp_suffix, cache_path + ".npy")
+    os.replace(cache_path + ".json" + tmp_suffix, cache_path + ".json")
@@ -0,0 +1,107 @@
+"""
+Tests of the catalogue estimators.
+
+The nearest neighbor selection is compared with a brute-force search over the catalogue.
+"""
+
+import os.path as pth
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fastuav.utils.catalogues.estimators import DecisionTreeRgr, NearestNeighbor
+
+PATH = pth.join(
+    pth.dirname(pth.abspath(__file__)),
+    "..",
+    "..",
+    "..",
+    "data",
+    "catalogues",
+    "Propeller",
+    "APC_propellers_MR.csv",
+)
+DF = pd.read_csv(PATH, sep=";")
+X_NAMES = ["Pitch (-)", "Diameter (METERS)"]
+
+
+def _predict_brute_force(x, crits):
+    """Closest product after snapping the features to the next or previous catalogue values."""
+    X_train = DF[X_NAMES].to_numpy(dtype=float)
+    x = np.array(x, dtype=float)
+    for i, crit in enumerate(crits):
+        if crit == "next" and np.any(X_train[:, i] >= x[i]):
+            x[i] = X_train[X_train[:, i] >= x[i], i].min()
+        elif crit == "previous" and np.any(X_train[:, i] <= x[i]):
+            x[i] = X_train[X_train[:, i] <= x[i], i].max()
+    std = X_train.std(axis=0)
+    distances = np.linalg.norm((X_train - x) / std, axis=1)
+    return distances.min(), distances
+
+
+@pytest.mark.parametrize(
+    "crits", [["average", "next"], ["previous", "average"], ["next", "previous"]]
+)
+def test_nearest_neighbor_predict(crits):
+    clf = NearestNeighbor(df=DF, X_names=X_NAMES, crits=crits)
+    clf.train()
+
+    rng = np.random.default_rng(0)
+    X_train = DF[X_NAMES].to_numpy(dtype=float)
+    low, high = X_train.min(axis=0), X_train.max(axis=0)
+    for x in rng.uniform(low - 0.1 * (high - low), high + 0.1 * (high - low), size=(50, 2)):
+        df_y = clf.predict([np.array([x[0]]), np.array([x[1]])])
+        min_distance, distances = _predict_brute_force(x, crits)
+        assert distances[DF.index.get_loc(df_y.index[0])] == pytest.approx(min_distance)
+
+
+def test_nearest_neighbor_predict_many():
+    clf = NearestNeighbor(df=DF, X_names=X_NAMES, crits=["average", "next"])
+    clf.train()
+
+    rng = np.random.default_rng(1)
+    X_train = DF[X_NAMES].to_numpy(dtype=float)
+    X = rng.uniform(X_train.min(axis=0), X_train.max(axis=0), size=(100, 2))
+    indices = clf.predict_many(X)
+    assert indices.shape == (100,)
+    assert list(indices) == [clf.predict_index([x[0], x[1]]) for x in X]
+
+
+@pytest.mark.parametrize("k, chunk_size", [(None, 2**16), (1, 2**16), (4, 2**16), (4, 10)])
+def test_nearest_neighbor_predict2_many(k, chunk_size):
+    crits = ["next", "previous"]
+    clf = NearestNeighbor(df=DF, X_names=X_NAMES, crits=crits)
+    clf.train()
+
+    rng = np.random.default_rng(2)
+    X_train = DF[X_NAMES].to_numpy(dtype=float)
+    X = rng.uniform(X_train.min(axis=0), X_train.max(axis=0), size=(50, 2))
+    indices = clf.predict2_many(X, k=k, chunk_size=chunk_size)
+
+    std = X_train.std(axis=0)
+    for x, index in zip(X, indices):
+        distances = np.linalg.norm((X_train - x) / std, axis=1)
+        is_feasible = (X_train[:, 0] >= x[0]) & (X_train[:, 1] <= x[1])
+        if is_feasible.any():
+            assert is_feasible[index]
+            assert distances[index] == pytest.approx(distances[is_feasible].min())
+        else:
+            assert distances[index] == pytest.approx(distances.min())
+
+
+@pytest.mark.parametrize(
+    "crit, y_expected", [("next", [10.0, 20.0, 30.0, 30.0]), ("previous", [10.0, 10.0, 20.0, 30.0])]
+)
+def test_decision_tree_regressor(crit, y_expected, tmp_path):
+    X = pd.DataFrame({"x": [2.0, 1.0, 3.0, 2.0]})
+    y = pd.DataFrame({"y": [20.0, 10.0, 30.0, 20.0]})
+    X_test = np.array([[0.5], [1.5], [2.5], [3.5]])
+
+    regressor = DecisionTreeRgr(X, y, [crit]).train(cache_dir=str(tmp_path))
+    assert regressor.predict(X_test) == pytest.approx(y_expected, rel=1e-2)
+
+    # fitted tree is retrieved from the cache
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    regressor = DecisionTreeRgr(X, y, [crit]).train(cache_dir=str(tmp_path))
+    assert regressor.predict(X_test) == pytest.approx(y_expected, rel=1e-2)
@@ -0,0 +1,52 @@
+"""
+Tests of the catalogues registry and of its binary cache.
+"""
+
+import os.path as pth
+
+import pandas as pd
+import pytest
+
+from fastuav.utils.catalogues import registry
+
+PATH = pth.join(
+    pth.dirname(pth.abspath(__file__)),
+    "..",
+    "..",
+    "..",
+    "data",
+    "catalogues",
+    "Batteries",
+    "Non-Dominated-Augmented-Batteries.csv",
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "CACHE_DIR", str(tmp_path))
+    registry.clear_catalogues()
+    yield tmp_path
+    registry.clear_catalogues()
+
+
+def test_load_catalogue(cache_dir):
+    df_ref = pd.read_csv(PATH, sep=";")
+
+    # first load: CSV file is parsed and cached
+    df = registry.load_catalogue(PATH)
+    pd.testing.assert_frame_equal(df, df_ref)
+    assert len(list(cache_dir.glob("*.npy"))) == 1
+    assert registry.load_catalogue(PATH) is df
+
+    # next processes: catalogue is read from the binary cache
+    registry.clear_catalogues()
+    pd.testing.assert_frame_equal(registry.load_catalogue(PATH), df_ref)
+
+
+def test_catalogue_estimator(cache_dir):
+    clf = registry.catalogue_estimator(PATH, ["Voltage_V", "Capacity_As"], ["next", "next"])
+    assert registry.catalogue_estimator(PATH, ["Voltage_V", "Capacity_As"], ["next", "next"]) is clf
+    assert (
+        registry.catalogue_estimator(PATH, ["Voltage_V", "Capacity_As"], ["next", "average"])
+        is not clf
+    )
@@ -4,7 +4,8 @@ Methods to ensure the OpenMDAO components' versatility for both fixed wing and m
 
 import re
 import warnings
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import openmdao.api as om
 
@@ -51,39 +52,59 @@ def promote_and_rename(
     # Get input and output variables names from subsystem
     # TODO: list only promoted variables from subsubsystems \
     #  (here '*uncertainty:*:mean' are non-promoted variables but still visible so have to be excluded by hand)
-    var_in_names = [
-        var[0].split(".")[-1]
-        for var in subsys.list_inputs(val=False, out_stream=None, excludes=["*uncertainty:*:mean"])
-    ]
-    var_out_names = [
-        var[0].split(".")[-1]
-        for var in subsys.list_outputs(val=False, out_stream=None, excludes=["*uncertainty:*:mean"])
-    ]
-
-    # Keep only unique values
-    var_in_names = list(set(var_in_names))
-    var_out_names = list(set(var_out_names))
-
-    # Create lists of new names
-    var_in_names_new = var_in_names
-    var_out_names_new = var_out_names
-    for old_pattern, new_pattern in zip(old_patterns_list, new_patterns_list):
-        var_in_names_new = [re.sub(old_pattern, new_pattern, name) for name in var_in_names_new]
-        var_out_names_new = [re.sub(old_pattern, new_pattern, name) for name in var_out_names_new]
+    var_in_names, var_out_names = (
+        {
+            name.split(".")[-1]
+            for name in subsys.get_io_metadata(
+                iotypes=iotype, metadata_keys=(), excludes=["*uncertainty:*:mean"], get_remote=True
+            )
+        }
+        for iotype in ("input", "output")
+    )
 
     # Promote variables with new name
+    rename_map = _rename_map(
+        type(subsys),
+        frozenset(var_in_names | var_out_names),
+        tuple(old_patterns_list),
+        tuple(new_patterns_list),
+    )
     inputs = (
-        [(old_name, new_name) for old_name, new_name in zip(var_in_names, var_in_names_new)]
-        if rename_inputs
-        else var_in_names
+        [(name, rename_map[name]) for name in var_in_names] if rename_inputs else list(var_in_names)
     )
     outputs = (
-        [(old_name, new_name) for old_name, new_name in zip(var_out_names, var_out_names_new)]
+        [(name, rename_map[name]) for name in var_out_names]
         if rename_outputs
-        else var_out_names
+        else list(var_out_names)
     )
     group.promotes(subsys.name, inputs=inputs, outputs=outputs)
 
-    # Turn off warnings (calling list_inputs and list_outputs before final_setup will issue a warning
-    # as only the default values of the variables will be displayed. This behaviour is not impacting the results here)
+    # Turn off warnings (listing the variables before final_setup issues warnings
+    # as only the default values of the variables are available. This behaviour is not impacting the results here)
     warnings.filterwarnings("ignore", category=om.OpenMDAOWarning)
+
+
+@lru_cache(maxsize=None)
+def _rename_map(
+    subsys_class: type,
+    var_names: frozenset,
+    old_patterns: Tuple[str, ...],
+    new_patterns: Tuple[str, ...],
+) -> Dict[str, str]:
+    """
+    New names of the variables of a subsystem, cached by subsystem class, variables names and
+    patterns, so that they are computed once for all the problem setups.
+
+    The old patterns (regular expressions) are combined into a single regular expression, so that
+    each name is scanned once, and the matches are replaced by the new patterns (plain strings).
+    The patterns are applied in a single pass: a part of a name that has been renamed is not
+    renamed again by the following patterns.
+    """
+    combined = re.compile(
+        "|".join("(?P<p%i>%s)" % (i, pattern) for i, pattern in enumerate(old_patterns))
+    )
+
+    def replace(match):
+        return new_patterns[int(match.lastgroup[1:])]
+
+    return {name: combined.sub(replace, name) for name in var_names}
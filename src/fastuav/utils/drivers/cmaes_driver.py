@@ -5,9 +5,15 @@ Adapted from  OpenMDAO / RevHack2020 (https://github.com/OpenMDAO/RevHack2020/)
 New in this version: use of the fmin_con method from pycma for handling constraints with an Augmented Lagrangian.
 """
 
+import hashlib
 import importlib.util
+import multiprocessing
 import os
 import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import numpy as np
 import openmdao
@@ -20,9 +26,14 @@ elif importlib.util.find_spec("openmdao.utils.concurrent") is not None:
     from openmdao.utils.concurrent import concurrent_eval  # older OpenMDAO (<3.10)
 else:
     concurrent_eval = None
-import cma
 from openmdao.core.analysis_error import AnalysisError
 
+# cma is imported by the methods that use it, so that the worker processes of the local process
+# pool, which only evaluate the problem, do not import it.
+
+# Problem held by each worker process of the local process pool (see option "n_workers")
+_WORKER_PROBLEM = None
+
 
 class CMAESDriver(Driver):
     """
@@ -42,6 +53,15 @@ class CMAESDriver(Driver):
         CMAES object.
     _randomstate : np.random.RandomState, int
         Random state (or seed-number) which controls the seed.
+    _eval_cache : OrderedDict
+        Least-recently-used cache of the model evaluations, keyed by a hash of the design vector.
+        It is shared by the objective and constraints callbacks.
+    cache_hits : int
+        Number of callbacks served from the evaluation cache.
+    cache_misses : int
+        Number of callbacks that required a model evaluation.
+    _pool : ProcessPoolExecutor or None
+        Local process pool used to evaluate the candidates of a generation (see option "n_workers").
     """
 
     def __init__(self, **kwargs):
@@ -70,6 +90,8 @@ class CMAESDriver(Driver):
 
         self._desvar_idx = {}
 
+        import cma
+
         self.CMAOptions = cma.CMAOptions()
 
         # random state can be set for predictability during testing
@@ -80,6 +102,14 @@ class CMAESDriver(Driver):
         self._concurrent_pop_size = 0
         self._concurrent_color = 0
 
+        # Evaluation cache shared by the objective and constraints callbacks
+        self._eval_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Support for local process pool
+        self._pool = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -160,6 +190,33 @@ class CMAESDriver(Driver):
             "or irregularly arranged local optima (the latter by frequently"
             "restarting with small populations).",
         )
+        self.options.declare(
+            "eval_cache_size",
+            types=int,
+            default=128,
+            lower=0,
+            desc="Maximum number of model evaluations stored in the evaluation cache. "
+            "The objective and constraints callbacks requested for a same design vector "
+            "are then served from a single model evaluation. Set to 0 to disable the cache.",
+        )
+        self.options.declare(
+            "n_workers",
+            types=int,
+            default=1,
+            lower=1,
+            desc="Number of local worker processes used to evaluate the candidates of each "
+            "generation (does not require MPI). Each worker holds its own copy of the problem. "
+            "Evaluations run in the workers are not recorded by the driver recorders.",
+        )
+        self.options.declare(
+            "problem_factory",
+            default=None,
+            allow_none=True,
+            desc="Picklable callable with no argument that returns a set-up problem, used to "
+            "build the copy of the problem held by each worker process when n_workers > 1. "
+            "If None, the workers inherit the problem of the current process by forking it "
+            "(not available on Windows).",
+        )
 
     def _setup_driver(self, problem):
         """
@@ -176,13 +233,14 @@ class CMAESDriver(Driver):
         comm = problem.comm
         if self._concurrent_pop_size > 0:
             model_mpi = (self._concurrent_pop_size, self._concurrent_color)
-        elif not self.options["run_parallel"]:
+        elif not self.options["run_parallel"] or self.options["n_workers"] > 1:
             comm = None
 
         aug_lagrangian = self.options["augmented_lagrangian"]
         restarts = self.options["restarts"]
         restart_from_best = self.options["restart_from_best"]
         bipop = self.options["bipop"]
+        population_eval = self._evaluate_population if self.options["n_workers"] > 1 else None
 
         if aug_lagrangian:
             self._cmaes = CMAES(
@@ -195,6 +253,7 @@ class CMAESDriver(Driver):
                 bipop=bipop,
                 comm=comm,
                 model_mpi=model_mpi,
+                population_eval=population_eval,
             )
         else:
             self._cmaes = CMAES(
@@ -204,6 +263,7 @@ class CMAESDriver(Driver):
                 bipop=bipop,
                 comm=comm,
                 model_mpi=model_mpi,
+                population_eval=population_eval,
             )
 
     def _setup_comm(self, comm):
@@ -287,7 +347,19 @@ class CMAESDriver(Driver):
 
         self.CMAOptions["bounds"] = [lower_bound, upper_bound]
 
-        desvar_new, obj = self._cmaes.execute(x0, self.options["sigma0"], self.CMAOptions)
+        # Model may have changed since last run: start from a clean evaluation cache
+        self._eval_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        if self.options["n_workers"] > 1:
+            self._pool = self._create_pool()
+        try:
+            desvar_new, obj = self._cmaes.execute(x0, self.options["sigma0"], self.CMAOptions)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
         # desvar_new, obj = self._cmaes.execute(lambda: np.random.uniform(lower_bound, upper_bound), self.options['sigma0'], self.CMAOptions)
 
         # Pull optimal parameters back into framework and re-run, so that
@@ -345,8 +417,6 @@ class CMAESDriver(Driver):
         float
             Objective value
         """
-        model = self._problem().model
-
         objs = self.get_objective_values()
         nr_objectives = len(objs)
 
@@ -366,73 +436,57 @@ class CMAESDriver(Driver):
             obj_weights = {name: 1.0 for name in objs.keys()}
         sum_weights = sum(obj_weights.values())
 
-        for name in self._designvars:
-            i, j = self._desvar_idx[name]
-            self.set_design_var(name, x[i:j])
-
         # a very large number, but smaller than the result of nan_to_num in Numpy
         almost_inf = openmdao.INF_BOUND
 
-        # Execute the model
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-            self.iter_count += 1
-            try:
-                model.run_solve_nonlinear()
+        # Execute the model (or retrieve the results of a previous execution at the same point)
+        values = self._evaluate(x)
+
+        obj_values = values["objectives"]
+        if is_single_objective:  # Single objective optimization
+            for i in obj_values.values():
+                obj = i  # First and only key in the dict
+        else:  # Multi-objective optimization with weighted sums
+            weighted_objectives = np.array([])
+            for name, val in obj_values.items():
+                # element-wise multiplication with scalar
+                # takes the average, if an objective is a vector
+                try:
+                    weighted_obj = val * obj_weights[name] / val.size
+                except KeyError:
+                    msg = (
+                        'Name "{}" in "multi_obj_weights" option '
+                        "is not an absolute name of an objective."
+                    )
+                    raise KeyError(msg.format(name))
+                weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
 
-            # Tell the optimizer that this is a bad point.
-            except AnalysisError:
-                model._clear_iprint()
+            obj = sum(weighted_objectives / sum_weights) ** obj_exponent
 
-            obj_values = self.get_objective_values()
-            if is_single_objective:  # Single objective optimization
-                for i in obj_values.values():
-                    obj = i  # First and only key in the dict
-            else:  # Multi-objective optimization with weighted sums
-                weighted_objectives = np.array([])
-                for name, val in obj_values.items():
-                    # element-wise multiplication with scalar
-                    # takes the average, if an objective is a vector
-                    try:
-                        weighted_obj = val * obj_weights[name] / val.size
-                    except KeyError:
-                        msg = (
-                            'Name "{}" in "multi_obj_weights" option '
-                            "is not an absolute name of an objective."
-                        )
-                        raise KeyError(msg.format(name))
-                    weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
-
-                obj = sum(weighted_objectives / sum_weights) ** obj_exponent
-
-            # Parameters of the penalty method
-            penalty = self.options["penalty_parameter"]
-            exponent = self.options["penalty_exponent"]
-
-            if penalty == 0:
-                fun = obj
-            else:
-                constraint_violations = np.array([])
-                for name, val in self.get_constraint_values().items():
-                    con = self._cons[name]
-                    # The not used fields will either None or a very large number
-                    if (con["lower"] is not None) and np.any(con["lower"] > -almost_inf):
-                        diff = val - con["lower"]
-                        violation = np.array([0.0 if d >= 0 else abs(d) for d in diff])
-                        constraint_violations = np.hstack((constraint_violations, violation))
-                    if (con["upper"] is not None) and np.any(con["upper"] < almost_inf):
-                        diff = val - con["upper"]
-                        violation = np.array([0.0 if d <= 0 else abs(d) for d in diff])
-                        constraint_violations = np.hstack((constraint_violations, violation))
-                    if (con["equals"] is not None) and np.any(np.abs(con["equals"]) < almost_inf):
-                        diff = val - con["equals"]
-                        violation = np.absolute(diff)
-                        constraint_violations = np.hstack((constraint_violations, violation))
-                fun = obj + penalty * sum(np.power(constraint_violations, exponent))
+        # Parameters of the penalty method
+        penalty = self.options["penalty_parameter"]
+        exponent = self.options["penalty_exponent"]
 
-            # Record after getting obj to assure they have
-            # been gathered in MPI.
-            rec.abs = 0.0
-            rec.rel = 0.0
+        if penalty == 0:
+            fun = obj
+        else:
+            constraint_violations = np.array([])
+            for name, val in values["constraints"].items():
+                con = self._cons[name]
+                # The not used fields will either None or a very large number
+                if (con["lower"] is not None) and np.any(con["lower"] > -almost_inf):
+                    diff = val - con["lower"]
+                    violation = np.array([0.0 if d >= 0 else abs(d) for d in diff])
+                    constraint_violations = np.hstack((constraint_violations, violation))
+                if (con["upper"] is not None) and np.any(con["upper"] < almost_inf):
+                    diff = val - con["upper"]
+                    violation = np.array([0.0 if d <= 0 else abs(d) for d in diff])
+                    constraint_violations = np.hstack((constraint_violations, violation))
+                if (con["equals"] is not None) and np.any(np.abs(con["equals"]) < almost_inf):
+                    diff = val - con["equals"]
+                    violation = np.absolute(diff)
+                    constraint_violations = np.hstack((constraint_violations, violation))
+            fun = obj + penalty * sum(np.power(constraint_violations, exponent))
 
         return fun
 
@@ -459,8 +513,6 @@ class CMAESDriver(Driver):
         float
             Objective value
         """
-        model = self._problem().model
-
         objs = self.get_objective_values()
         nr_objectives = len(objs)
 
@@ -480,45 +532,29 @@ class CMAESDriver(Driver):
             obj_weights = {name: 1.0 for name in objs.keys()}
         sum_weights = sum(obj_weights.values())
 
-        for name in self._designvars:
-            i, j = self._desvar_idx[name]
-            self.set_design_var(name, x[i:j])
-
-        # Execute the model
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-            self.iter_count += 1
-            try:
-                model.run_solve_nonlinear()
-
-            # Tell the optimizer that this is a bad point.
-            except AnalysisError:
-                model._clear_iprint()
-
-            obj_values = self.get_objective_values()
-            if is_single_objective:  # Single objective optimization
-                for i in obj_values.values():
-                    obj = i  # First and only key in the dict
-            else:  # Multi-objective optimization with weighted sums
-                weighted_objectives = np.array([])
-                for name, val in obj_values.items():
-                    # element-wise multiplication with scalar
-                    # takes the average, if an objective is a vector
-                    try:
-                        weighted_obj = val * obj_weights[name] / val.size
-                    except KeyError:
-                        msg = (
-                            'Name "{}" in "multi_obj_weights" option '
-                            "is not an absolute name of an objective."
-                        )
-                        raise KeyError(msg.format(name))
-                    weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
-
-                obj = sum(weighted_objectives / sum_weights) ** obj_exponent
+        # Execute the model (or retrieve the results of a previous execution at the same point)
+        values = self._evaluate(x)
+
+        obj_values = values["objectives"]
+        if is_single_objective:  # Single objective optimization
+            for i in obj_values.values():
+                obj = i  # First and only key in the dict
+        else:  # Multi-objective optimization with weighted sums
+            weighted_objectives = np.array([])
+            for name, val in obj_values.items():
+                # element-wise multiplication with scalar
+                # takes the average, if an objective is a vector
+                try:
+                    weighted_obj = val * obj_weights[name] / val.size
+                except KeyError:
+                    msg = (
+                        'Name "{}" in "multi_obj_weights" option '
+                        "is not an absolute name of an objective."
+                    )
+                    raise KeyError(msg.format(name))
+                weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
 
-            # Record after getting obj to assure they have
-            # been gathered in MPI.
-            rec.abs = 0.0
-            rec.rel = 0.0
+            obj = sum(weighted_objectives / sum_weights) ** obj_exponent
 
         return obj
 
@@ -533,39 +569,21 @@ class CMAESDriver(Driver):
         ndarray
             Equality constraints values
         """
-        model = self._problem().model
-
-        for name in self._designvars:
-            i, j = self._desvar_idx[name]
-            self.set_design_var(name, x[i:j])
-
         # a very large number, but smaller than the result of nan_to_num in Numpy
         almost_inf = openmdao.INF_BOUND
 
-        # Execute the model
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as _:
-            self.iter_count += 1
-            try:
-                model.run_solve_nonlinear()
-
-            # Tell the optimizer that this is a bad point.
-            except AnalysisError:
-                model._clear_iprint()
-
-            gfun = np.array([])
-            for name, val in self.get_constraint_values().items():
-                con = self._cons[name]
-                if (con["lower"] is not None) and np.any(con["lower"] > -almost_inf):
-                    diff = -(val - con["lower"])
-                    gfun = np.hstack((gfun, diff))
-                if (con["upper"] is not None) and np.any(con["upper"] < almost_inf):
-                    diff = val - con["upper"]
-                    gfun = np.hstack((gfun, diff))
+        # Execute the model (or retrieve the results of a previous execution at the same point)
+        values = self._evaluate(x)
 
-            # Record after getting obj to assure they have
-            # been gathered in MPI.
-        # rec.abs = 0.0
-        # rec.rel = 0.0
+        gfun = np.array([])
+        for name, val in values["constraints"].items():
+            con = self._cons[name]
+            if (con["lower"] is not None) and np.any(con["lower"] > -almost_inf):
+                diff = -(val - con["lower"])
+                gfun = np.hstack((gfun, diff))
+            if (con["upper"] is not None) and np.any(con["upper"] < almost_inf):
+                diff = val - con["upper"]
+                gfun = np.hstack((gfun, diff))
 
         return gfun
 
@@ -580,17 +598,52 @@ class CMAESDriver(Driver):
         ndarray
             Equality constraints values
         """
+        # a very large number, but smaller than the result of nan_to_num in Numpy
+        almost_inf = openmdao.INF_BOUND
+
+        # Execute the model (or retrieve the results of a previous execution at the same point)
+        values = self._evaluate(x)
+
+        hfun = np.array([])
+        for name, val in values["constraints"].items():
+            con = self._cons[name]
+            if (con["equals"] is not None) and np.any(np.abs(con["equals"]) < almost_inf):
+                diff = val - con["equals"]
+                hfun = np.hstack((hfun, diff))
+
+        return hfun
+
+    def _evaluate(self, x):
+        """
+        Execute the model at the requested point and return the objectives and constraints values.
+        The results are stored in a least-recently-used cache keyed by a hash of the design vector,
+        so that the objective and constraints callbacks requested by the optimizer for a same
+        candidate only trigger one model execution.
+        Parameters
+        ----------
+        x : ndarray
+            Value of design variables.
+        Returns
+        -------
+        dict
+            Objectives values (key "objectives") and constraints values (key "constraints").
+        """
+        key = self._cache_key(x)
+        cache = self._eval_cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return cache[key]
+        self.cache_misses += 1
+
         model = self._problem().model
 
         for name in self._designvars:
             i, j = self._desvar_idx[name]
             self.set_design_var(name, x[i:j])
 
-        # a very large number, but smaller than the result of nan_to_num in Numpy
-        almost_inf = openmdao.INF_BOUND
-
         # Execute the model
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as _:
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             self.iter_count += 1
             try:
                 model.run_solve_nonlinear()
@@ -599,19 +652,150 @@ class CMAESDriver(Driver):
             except AnalysisError:
                 model._clear_iprint()
 
-            hfun = np.array([])
-            for name, val in self.get_constraint_values().items():
-                con = self._cons[name]
-                if (con["equals"] is not None) and np.any(np.abs(con["equals"]) < almost_inf):
-                    diff = val - con["equals"]
-                    hfun = np.hstack((hfun, diff))
+            # Copy the values, as the model will be executed at other points before cache hits
+            values = {
+                "objectives": {
+                    name: np.copy(val) for name, val in self.get_objective_values().items()
+                },
+                "constraints": {
+                    name: np.copy(val) for name, val in self.get_constraint_values().items()
+                },
+            }
 
             # Record after getting obj to assure they have
             # been gathered in MPI.
-        # rec.abs = 0.0
-        # rec.rel = 0.0
+            rec.abs = 0.0
+            rec.rel = 0.0
 
-        return hfun
+        self._store(key, values, self.options["eval_cache_size"])
+
+        return values
+
+    def _evaluate_population(self, X):
+        """
+        Execute the model at all the candidates of a generation on the local process pool.
+        The results are stored in the evaluation cache, from which the objective and constraints
+        callbacks are then served.
+        Parameters
+        ----------
+        X : list of ndarray
+            Values of design variables for each candidate.
+        """
+        cache = self._eval_cache
+        candidates = {}
+        for x in X:
+            key = self._cache_key(x)
+            if key not in cache:
+                candidates.setdefault(key, x)
+        if not candidates:
+            return
+
+        results = self._pool.map(
+            partial(_evaluate_in_worker, desvar_idx=self._desvar_idx), candidates.values()
+        )
+        # The cache must be large enough to hold the whole generation
+        cache_size = max(self.options["eval_cache_size"], len(X))
+        for key, values in zip(candidates.keys(), results):
+            self.iter_count += 1
+            self.cache_misses += 1
+            self._store(key, values, cache_size)
+
+    def _create_pool(self):
+        """
+        Create the local process pool used to evaluate the candidates of each generation.
+        Returns
+        -------
+        ProcessPoolExecutor
+            Process pool whose workers hold a set-up copy of the problem.
+        """
+        global _WORKER_PROBLEM
+
+        problem_factory = self.options["problem_factory"]
+        if problem_factory is None:
+            # Workers inherit a copy of the current problem
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise RuntimeError(
+                    "Option 'problem_factory' must be provided to use n_workers > 1 "
+                    "on a platform that does not support forking processes."
+                )
+            _WORKER_PROBLEM = self._problem()
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            mp_context = multiprocessing.get_context()
+
+        return ProcessPoolExecutor(
+            max_workers=self.options["n_workers"],
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(problem_factory,),
+        )
+
+    @staticmethod
+    def _cache_key(x):
+        """
+        Key of a design vector in the evaluation cache.
+        """
+        return hashlib.sha1(np.ascontiguousarray(x, dtype=float).tobytes()).hexdigest()
+
+    def _store(self, key, values, cache_size):
+        """
+        Store a model evaluation in the evaluation cache, discarding the least recently used
+        evaluations if the cache exceeds the provided size.
+        """
+        if cache_size > 0:
+            cache = self._eval_cache
+            cache[key] = values
+            while len(cache) > cache_size:
+                cache.popitem(last=False)  # discard least recently used evaluation
+
+
+def _init_worker(problem_factory):
+    """
+    Initialize a worker process of the CMAESDriver local process pool.
+    Parameters
+    ----------
+    problem_factory : callable or None
+        Callable returning a set-up problem. If None, the problem inherited from the parent
+        process is used.
+    """
+    global _WORKER_PROBLEM
+
+    if problem_factory is not None:
+        _WORKER_PROBLEM = problem_factory()
+    _WORKER_PROBLEM.final_setup()
+
+
+def _evaluate_in_worker(x, desvar_idx):
+    """
+    Execute the model of the worker process at the requested point.
+    Parameters
+    ----------
+    x : ndarray
+        Value of design variables.
+    desvar_idx : dict
+        Indices of each design variable in x.
+    Returns
+    -------
+    dict
+        Objectives values (key "objectives") and constraints values (key "constraints").
+    """
+    problem = _WORKER_PROBLEM
+    driver = problem.driver
+
+    for name, (i, j) in desvar_idx.items():
+        driver.set_design_var(name, x[i:j])
+
+    try:
+        problem.model.run_solve_nonlinear()
+
+    # Tell the optimizer that this is a bad point.
+    except AnalysisError:
+        problem.model._clear_iprint()
+
+    return {
+        "objectives": {name: np.copy(val) for name, val in driver.get_objective_values().items()},
+        "constraints": {name: np.copy(val) for name, val in driver.get_constraint_values().items()},
+    }
 
 
 class CMAES(object):
@@ -627,6 +811,9 @@ class CMAES(object):
         to evaluate on this rank.
     objfun : function
         Objective function callback.
+    population_eval : function or None
+        Callback evaluating all the candidates of a generation at once (e.g. on a local process
+        pool) before the objective and constraints callbacks are called for each candidate.
     """
 
     def __init__(
@@ -640,6 +827,7 @@ class CMAES(object):
         bipop="False",
         comm=None,
         model_mpi=None,
+        population_eval=None,
     ):
         """
         Initialize CMA Evolution Strategy object.
@@ -657,6 +845,9 @@ class CMAES(object):
             If the model in objfun is also parallel, then this will contain a tuple with the the
             total number of population points to evaluate concurrently, and the color of the point
             to evaluate on this rank.
+        population_eval : function or None
+            Callback evaluating all the candidates of a generation at once. If provided, the
+            ask-and-tell interface of pycma is used instead of the functional interface.
         """
         self.comm = comm
         self.model_mpi = model_mpi
@@ -667,6 +858,7 @@ class CMAES(object):
         self.restarts = restarts
         self.restart_from_best = restart_from_best
         self.bipop = bipop
+        self.population_eval = population_eval
 
     def execute(self, x0, sigma0, CMAOptions):
         """
@@ -690,11 +882,17 @@ class CMAES(object):
         float
             Objective value at best design point.
         """
+        import cma
+
         comm = self.comm
         restarts = self.restarts
         restart_from_best = self.restart_from_best
         bipop = self.bipop
 
+        if self.population_eval is not None:
+            # Running on a local process pool, use OO interface
+            return self._execute_ask_tell(x0, sigma0, CMAOptions)
+
         if comm is None:
             # Running non-parallel, use functional interface
 
@@ -754,7 +952,9 @@ class CMAES(object):
                 if concurrent_eval is None:
                     raise RuntimeError(
                         "Parallel execution requires 'openmdao.utils.concurrent', "
-                        "which was removed in newer versions of OpenMDAO."
+                        "which was removed in newer versions of OpenMDAO. "
+                        "Use the 'n_workers' option to evaluate the generations on a local "
+                        "process pool instead."
                     )
                 results = concurrent_eval(
                     self.objfun, cases, comm, allgather=True, model_mpi=self.model_mpi
@@ -790,3 +990,85 @@ class CMAES(object):
             # optim.logger.plot()  # if matplotlib is available
 
             return optim.result[0], optim.result[1]
+
+    def _execute_ask_tell(self, x0, sigma0, CMAOptions):
+        """
+        Execute the CMA Evolution Strategy with the ask-and-tell interface, each generation being
+        evaluated at once by the population_eval callback.
+        Restarts are done with increasing population size (IPOP).
+        Parameters
+        ----------
+        x0 : ndarray
+            Initial design values
+        sigma0 : float
+            Initial standard deviation in each coordinate.
+        CMAOptions : CMAOptions
+            Options for CMAES execution.
+        Returns
+        -------
+        ndarray
+            Best design point
+        float
+            Objective value at best design point.
+        """
+        import cma
+
+        if self.bipop:
+            warnings.warn(
+                "BIPOP restarts are not available with a local process pool, "
+                "IPOP restarts are used instead."
+            )
+
+        options = dict(CMAOptions)
+        if self.aug_lagrangian:
+            # The smallest observed f-values may be below the limit value f(x^*_feas)
+            # because f-values depend on the adaptive multipliers (same as cma.fmin_con)
+            options.setdefault("tolstagnation", 0)
+
+        xopt, fopt, f_best = x0, None, np.inf
+        x_start = x0
+        for _ in range(self.restarts + 1):
+            es = cma.CMAEvolutionStrategy(x_start, sigma0, options)
+            if self.aug_lagrangian:
+                fitness = cma.ConstrainedFitnessAL(self.objfun, self._al_constraints)
+            else:
+                fitness = self.objfun
+
+            while not es.stop():
+                X = es.ask()
+                self.population_eval(X)  # objective and constraints are then retrieved from cache
+                es.tell(X, [fitness(x) for x in X])
+                if self.aug_lagrangian:
+                    fitness.update(es)
+                es.disp(20)  # display info every 20th iteration
+                es.logger.add()
+
+            if self.aug_lagrangian:
+                x, f = es.result.xfavorite, fitness.best_feas
+                f_run = np.inf if f.f is None else f.f
+            else:
+                x, f = es.result[0], es.result[1]
+                if es.opts["eval_final_mean"]:
+                    # Evaluate the final mean of the distribution, as cma.fmin does
+                    x_mean = es.result.xfavorite
+                    self.population_eval([x_mean])
+                    f_mean = fitness(x_mean)
+                    if f_mean < f:
+                        x, f = x_mean, f_mean
+                f_run = f
+            if fopt is None or f_run < f_best:
+                xopt, fopt, f_best = x, f, f_run
+
+            # Restart with twice the population size
+            options["popsize"] = 2 * es.popsize
+            x_start = es.result.xbest if self.restart_from_best else x0
+
+        return xopt, fopt
+
+    def _al_constraints(self, x):
+        """
+        Constraints for the augmented lagrangian, where feasibility means <= 0.
+        Equality constraints h(x) = 0 are expressed as two inequality constraints [h(x), -h(x)].
+        """
+        hvals = np.asarray(self.hfun(x))
+        return np.hstack((self.gfun(x), hvals, -hvals))
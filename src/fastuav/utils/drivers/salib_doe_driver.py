@@ -79,8 +79,8 @@ class SalibDOEGenerator(DOEGenerator):
 
         self._compute_cases()
         self.called = True
-        sample = []
         for i in range(self._cases.shape[0]):
+            sample = []
             j = 0
             for name, meta in design_vars.items():
                 size = meta["size"]
@@ -103,15 +103,17 @@ class SalibDOEGenerator(DOEGenerator):
 
 
 class SalibMorrisDOEGenerator(SalibDOEGenerator):
-    def __init__(self, n_trajs=2, n_levels=4, dist=None):
+    def __init__(self, n_trajs=2, n_levels=4, dist=None, seed=None):
         super(SalibMorrisDOEGenerator, self).__init__(dist)
         # number of trajectories to apply morris method
         self.n_trajs = n_trajs
         # number of grid levels
         self.n_levels = n_levels
+        # seed of the random generation of the trajectories
+        self.seed = seed
 
     def _compute_cases(self):
-        self._cases = ms.sample(self._pb, self.n_trajs, self.n_levels)
+        self._cases = ms.sample(self._pb, self.n_trajs, self.n_levels, seed=self.seed)
 
 
 class SalibSobolDOEGenerator(SalibDOEGenerator):
@@ -169,14 +171,22 @@ class SalibDOEDriver(DOEDriver):
                 desc="number of trajectories to apply morris method",
             )
             self.sa_settings.declare("n_levels", types=int, default=4, desc="number of grid levels")
+            self.sa_settings.declare(
+                "seed",
+                types=int,
+                default=None,
+                allow_none=True,
+                desc="seed of the random generation of the trajectories",
+            )
             self.sa_settings.update(self.options["sa_doe_options"])
             n_trajs = self.sa_settings["n_trajs"]
             n_levels = self.sa_settings["n_levels"]
+            seed = self.sa_settings["seed"]
             dist = self.options[
                 "distributions"
             ]  # TODO: follow up SALib update for non-uniform distributions (https://github.com/SALib/SALib/issues/515)
             self.options["generator"] = SalibMorrisDOEGenerator(
-                n_trajs=n_trajs, n_levels=n_levels, dist=dist
+                n_trajs=n_trajs, n_levels=n_levels, dist=dist, seed=seed
             )
         elif self.options["sa_method_name"] == "Sobol":
             self.sa_settings.declare(
@@ -0,0 +1,147 @@
+"""
+Tests of the evaluation cache and of the local process pool of the CMA-ES driver.
+"""
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fastuav.utils.drivers.cmaes_driver import CMAESDriver
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # pycma writes its log files in the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+class _Paraboloid(om.ExplicitComponent):
+    """
+    Paraboloid that counts its executions.
+    """
+
+    def initialize(self):
+        self.n_executions = 0
+
+    def setup(self):
+        self.add_input("x", val=1.0)
+        self.add_input("y", val=1.0)
+        self.add_output("f", val=0.0)
+        self.add_output("c", val=0.0)
+        self.declare_partials("*", "*", method="fd")
+
+    def compute(self, inputs, outputs):
+        self.n_executions += 1
+        x, y = inputs["x"], inputs["y"]
+        outputs["f"] = (x - 3.0) ** 2 + x * y + (y + 4.0) ** 2 - 3.0
+        outputs["c"] = x + y
+
+
+def _problem(**options):
+    """
+    :return: set-up problem of the constrained paraboloid, with a seeded CMA-ES driver
+    """
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("paraboloid", _Paraboloid(), promotes=["*"])
+    prob.model.add_design_var("x", lower=-50.0, upper=50.0)
+    prob.model.add_design_var("y", lower=-50.0, upper=50.0)
+    prob.model.add_objective("f")
+    prob.model.add_constraint("c", upper=-1.0)
+    prob.driver = CMAESDriver(**options)
+    prob.driver.CMAOptions["seed"] = 1
+    prob.driver.CMAOptions["maxiter"] = 30
+    prob.driver.CMAOptions["verbose"] = -9
+    prob.setup()
+    return prob
+
+
+def _paraboloid_problem():
+    """
+    Factory of the problems of the worker processes.
+    """
+    return _problem()
+
+
+def _run_history(prob) -> list:
+    """
+    :return: design vectors requested by the optimizer during the run of the driver
+    """
+    history = []
+    evaluate = prob.driver._evaluate
+
+    def _evaluate(x):
+        history.append(np.copy(x))
+        return evaluate(x)
+
+    prob.driver._evaluate = _evaluate
+    prob.run_driver()
+    return history
+
+
+def test_evaluation_cache():
+    # the objective and constraints callbacks of the augmented lagrangian share the evaluations
+    prob = _problem(augmented_lagrangian=True)
+    prob.run_driver()
+    driver = prob.driver
+    n_executions = prob.model.paraboloid.n_executions - 1  # final execution at the optimum
+    assert driver.cache_misses == n_executions
+    assert driver.cache_hits >= 2 * n_executions
+
+    # without cache, each callback executes the model
+    prob_ref = _problem(augmented_lagrangian=True, eval_cache_size=0)
+    prob_ref.run_driver()
+    assert prob_ref.model.paraboloid.n_executions - 1 == driver.cache_hits + driver.cache_misses
+    assert prob_ref.driver.cache_hits == 0
+    assert prob.get_val("f") == prob_ref.get_val("f")
+    assert prob.get_val("x") == prob_ref.get_val("x")
+
+
+def test_evaluation_cache_eviction():
+    prob = _problem(eval_cache_size=2)
+    prob.run_driver()
+    driver = prob.driver
+    driver._eval_cache.clear()
+    driver.cache_hits = driver.cache_misses = 0
+
+    x1, x2, x3 = np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0, 6.0])
+    f1 = driver._evaluate(x1)["objectives"]["f"]
+    driver._evaluate(x2)
+    assert driver._evaluate(x1)["objectives"]["f"] == f1  # most recently used
+    driver._evaluate(x3)  # discards x2, least recently used
+    assert len(driver._eval_cache) == 2
+    assert (driver.cache_hits, driver.cache_misses) == (1, 3)
+
+    driver._evaluate(x1)
+    driver._evaluate(x3)
+    assert (driver.cache_hits, driver.cache_misses) == (3, 3)
+    driver._evaluate(x2)
+    assert (driver.cache_hits, driver.cache_misses) == (3, 4)
+
+
+@pytest.mark.parametrize("problem_factory", [_paraboloid_problem, None])
+def test_process_pool(problem_factory):
+    prob_ref = _problem()
+    history_ref = _run_history(prob_ref)
+
+    # candidates are evaluated by the workers, the driver process only runs the final point
+    prob = _problem(n_workers=2, problem_factory=problem_factory)
+    history = _run_history(prob)
+    assert prob.model.paraboloid.n_executions == 1
+    assert prob.driver.cache_misses == prob_ref.driver.cache_misses
+    assert prob.driver.cache_hits == len(history)
+
+    # same candidates and optimum as the serial run
+    np.testing.assert_array_equal(history, history_ref)
+    assert prob.get_val("f") == prob_ref.get_val("f")
+    assert prob.get_val("x") == prob_ref.get_val("x")
+    assert prob.get_val("y") == prob_ref.get_val("y")
+
+
+def test_process_pool_augmented_lagrangian():
+    prob = _problem(augmented_lagrangian=True, n_workers=2, problem_factory=_paraboloid_problem)
+    prob.run_driver()
+    assert prob.model.paraboloid.n_executions == 1
+    assert prob.driver.cache_misses > 0
+    # constrained optimum of the paraboloid is at x = 7, y = -8, where f = -27
+    assert prob.get_val("c") == pytest.approx(-1.0, abs=0.1)
+    assert prob.get_val("f") == pytest.approx(-27.0, abs=0.5)
@@ -0,0 +1,114 @@
+"""
+Import-time profiling of the FAST-UAV plugin.
+
+FAST-OAD imports all the modules of the plugin models when the plugin is loaded, and so does
+every worker process of a DoE (see utils.postprocessing.sensitivity_analysis) or of the CMA-ES
+driver. The import time of these modules is measured with ``python -X importtime``, in a fresh
+interpreter, after the import of FAST-OAD and OpenMDAO themselves.
+
+usage:
+    python -m fastuav.utils.import_time [--top 20]
+"""
+
+import argparse
+import importlib
+import pkgutil
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Libraries that are only needed for catalogues, drivers or post-processing, and that the models
+# must not import when the plugin is loaded.
+HEAVY_OPTIONAL_MODULES = [
+    "sklearn",
+    "cma",
+    "SALib",
+    "plotly",
+    "ipywidgets",
+    "seaborn",
+    "matplotlib",
+]
+
+# Modules imported before the plugin modules, whose import time is not reported.
+BASELINE_MODULES = ["numpy", "pandas", "openmdao.api", "fastoad.api"]
+
+_MARKER = "--- fastuav import time ---"
+
+
+def plugin_modules(package: str = "fastuav.models") -> List[str]:
+    """
+    :param package: name of the package
+    :return: names of the modules of the package, test modules excluded
+    """
+    modules = [package]
+    path = importlib.import_module(package).__path__
+    for module_info in pkgutil.walk_packages(path, package + "."):
+        if "tests" not in module_info.name.split("."):
+            modules.append(module_info.name)
+    return modules
+
+
+def import_time_report(modules: List[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Imports modules in a fresh interpreter and reports the import time of each module they import,
+    the baseline modules (and their dependencies) being imported beforehand.
+
+    :param modules: names of the modules to import
+    :return: dict of the (self, cumulative) import times [s], by module name, in import order
+    """
+    code = "\n".join(
+        ["import sys"]
+        + ["import %s" % name for name in BASELINE_MODULES]
+        + ["sys.stderr.write(%r)" % (_MARKER + "\n"), "sys.stderr.flush()"]
+        + ["import %s" % name for name in modules]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = result.stderr.split(_MARKER, 1)[-1].splitlines()
+
+    report = {}
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        report[name.strip()] = (int(self_us) * 1e-6, int(cumulative_us) * 1e-6)
+    return report
+
+
+def imported_heavy_modules(report: Dict[str, Tuple[float, float]]) -> List[str]:
+    """
+    :param report: import time report (see import_time_report)
+    :return: heavy optional modules (see HEAVY_OPTIONAL_MODULES) found in the report
+    """
+    return [
+        name
+        for name in HEAVY_OPTIONAL_MODULES
+        if any(module == name or module.startswith(name + ".") for module in report)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import time of the FAST-UAV plugin modules.")
+    parser.add_argument("--package", default="fastuav.models", help="package to import")
+    parser.add_argument("--top", type=int, default=20, help="number of modules to display")
+    args = parser.parse_args(argv)
+
+    report = import_time_report(plugin_modules(args.package))
+    total = sum(self_time for self_time, _ in report.values())
+    own = sum(t for name, (t, _) in report.items() if name.split(".")[0] == "fastuav")
+
+    print("%-70s %10s %10s" % ("module", "self [ms]", "cumul [ms]"))
+    for name, (self_time, cumulative_time) in sorted(
+        report.items(), key=lambda item: item[1][0], reverse=True
+    )[: args.top]:
+        print("%-70s %10.1f %10.1f" % (name, self_time * 1e3, cumulative_time * 1e3))
+    print("\nTotal import time: %.0f ms (fastuav modules: %.0f ms)" % (total * 1e3, own * 1e3))
+    print("Heavy optional modules imported: %s" % (imported_heavy_modules(report) or "none"))
+
+
+if __name__ == "__main__":
+    main()
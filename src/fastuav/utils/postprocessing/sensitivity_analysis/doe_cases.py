@@ -0,0 +1,400 @@
+"""
+Collection of the results of design of experiments cases.
+The values of the recorded variables are written in a preallocated array as cases complete,
+and can be appended by batches to a CSV file.
+Results are also saved in a persistent case store, so that an interrupted study can be resumed,
+and in a session-level cache, so that a study is not run again when its settings have not changed.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Dict, List
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+from openmdao.recorders.case_recorder import CaseRecorder
+
+
+class DoECaseCollector:
+    """
+    Collects the values of a list of scalar variables for each case of a design of experiments.
+
+    Values are stored in a preallocated array, whose size is doubled when more cases than expected
+    are collected. If a CSV file is provided, rows are also appended to it by batches.
+    """
+
+    def __init__(
+        self, columns: List[str], n_cases: int = 0, csv_path: str = None, batch_size: int = 100
+    ):
+        """
+        :param columns: names of the variables to collect
+        :param n_cases: expected number of cases, used to preallocate the array of values
+        :param csv_path: CSV file to which the rows are appended by batches (optional)
+        :param batch_size: number of rows in each batch written to the CSV file
+        """
+        self.columns = list(columns)
+        self.csv_path = csv_path
+        self.batch_size = batch_size
+        self.n_cases = 0
+        self._values = np.full((max(n_cases, 1), len(self.columns)), np.nan)
+        self._n_written = 0  # number of rows written in CSV file
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Array of the collected values, with one row per case.
+        """
+        return self._values[: self.n_cases]
+
+    def collect(self, problem: om.Problem):
+        """
+        Collect the values of the variables in the current state of the problem.
+
+        :param problem: problem from which the values are read
+        """
+        self.add_rows([[problem.get_val(name)[0] for name in self.columns]])
+
+    def add_rows(self, rows):
+        """
+        Add the values of several cases.
+
+        :param rows: array of values, with one row per case
+        """
+        rows = np.atleast_2d(rows)
+        n_new = self.n_cases + rows.shape[0]
+        if n_new > self._values.shape[0]:
+            capacity = max(n_new, 2 * self._values.shape[0])
+            values = np.full((capacity, len(self.columns)), np.nan)
+            values[: self.n_cases] = self.values
+            self._values = values
+        self._values[self.n_cases : n_new] = rows
+        self.n_cases = n_new
+
+        if self.csv_path is not None and self.n_cases - self._n_written >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Append the rows that have not been written yet to the CSV file.
+        """
+        if self.csv_path is None or self._n_written == self.n_cases:
+            return
+        batch = pd.DataFrame(
+            self._values[self._n_written : self.n_cases],
+            columns=self.columns,
+            index=range(self._n_written, self.n_cases),
+        )
+        batch.to_csv(
+            self.csv_path, mode="w" if self._n_written == 0 else "a", header=self._n_written == 0
+        )
+        self._n_written = self.n_cases
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        :return: dataframe of the collected values, with one row per case
+        """
+        self.flush()
+        return pd.DataFrame(self.values, columns=self.columns)
+
+
+class DoECaseStore:
+    """
+    Persistent store of the results of design of experiments cases, in a SQLite database.
+
+    Cases are keyed by their index in the DoE and by a hash of their input values, so that the
+    results of a previous run of the same study can be retrieved. Each result is committed to disk
+    as soon as it is added.
+    The store also holds the configuration of the problem and the recorded variables of the study,
+    and the seed used to draw its cases at random: the cases of another study (e.g. after the input
+    file or the mission definition file has been modified) are discarded when the store is opened.
+    """
+
+    def __init__(
+        self, path: str, x_columns: List[str], y_columns: List[str], configuration_hash: str = ""
+    ):
+        """
+        :param path: path of the SQLite database file
+        :param x_columns: names of the inputs of the cases
+        :param y_columns: names of the recorded outputs of the cases
+        :param configuration_hash: hash of the configuration of the problem (see doe_fast)
+        """
+        self.path = path
+        self.x_columns = list(x_columns)
+        self.y_columns = list(y_columns)
+        self._connection = sqlite3.connect(path)
+        study = (configuration_hash, json.dumps(self.x_columns), json.dumps(self.y_columns))
+        with self._connection as c:
+            c.execute(
+                "CREATE TABLE IF NOT EXISTS cases "
+                "(idx INTEGER PRIMARY KEY, input_hash TEXT NOT NULL, outputs TEXT NOT NULL)"
+            )
+            c.execute(
+                "CREATE TABLE IF NOT EXISTS study (configuration_hash TEXT NOT NULL, "
+                "x_columns TEXT NOT NULL, y_columns TEXT NOT NULL, seed INTEGER)"
+            )
+            record = c.execute(
+                "SELECT configuration_hash, x_columns, y_columns FROM study"
+            ).fetchone()
+            if record != study:
+                # cases of another study
+                c.execute("DELETE FROM cases")
+                c.execute("DELETE FROM study")
+                c.execute("INSERT INTO study VALUES (?, ?, ?, NULL)", study)
+
+    @property
+    def seed(self) -> int:
+        """
+        Seed used to draw the cases of the study at random, or None if it has not been saved.
+        """
+        return self._connection.execute("SELECT seed FROM study").fetchone()[0]
+
+    @seed.setter
+    def seed(self, value: int):
+        with self._connection as c:
+            c.execute("UPDATE study SET seed = ?", (None if value is None else int(value),))
+
+    @staticmethod
+    def input_hash(x_values) -> str:
+        """
+        :param x_values: input values of a case
+        :return: hash of the input values
+        """
+        return hashlib.sha1(np.asarray(x_values, dtype=float).ravel().tobytes()).hexdigest()
+
+    def add(self, indices, rows):
+        """
+        Save the results of several cases.
+
+        :param indices: indices of the cases in the DoE
+        :param rows: array of values (inputs then outputs), with one row per case
+        """
+        n_x = len(self.x_columns)
+        records = [
+            (
+                int(idx),
+                self.input_hash(row[:n_x]),
+                json.dumps(dict(zip(self.y_columns, map(float, row[n_x:])))),
+            )
+            for idx, row in zip(indices, np.atleast_2d(rows))
+        ]
+        with self._connection as c:
+            c.executemany("INSERT OR REPLACE INTO cases VALUES (?, ?, ?)", records)
+
+    def lookup(self, index: int, x_values):
+        """
+        Retrieve the results of a case evaluated in a previous run.
+
+        :param index: index of the case in the DoE
+        :param x_values: input values of the case
+        :return: array of values (inputs then outputs) of the case, or None if the case has not
+                 been evaluated with the same inputs or if some outputs were not recorded
+        """
+        record = self._connection.execute(
+            "SELECT input_hash, outputs FROM cases WHERE idx = ?", (int(index),)
+        ).fetchone()
+        if record is None or record[0] != self.input_hash(x_values):
+            return None
+        outputs = json.loads(record[1])
+        if not all(y in outputs for y in self.y_columns):
+            return None
+        return np.concatenate(
+            (np.asarray(x_values, dtype=float).ravel(), [outputs[y] for y in self.y_columns])
+        )
+
+    def clear(self):
+        """
+        Remove all the cases from the store, and the seed used to draw them.
+        """
+        with self._connection as c:
+            c.execute("DELETE FROM cases")
+            c.execute("UPDATE study SET seed = NULL")
+
+    def close(self):
+        self._connection.close()
+
+
+class DoEResultsCache:
+    """
+    Session-level (in-memory) cache of the results of design of experiments.
+
+    The results of complete studies are stored by study key (see study_key), so that running the
+    same study again only returns a copy of its results.
+    The results of each case are also stored by configuration and input values, so that the cases
+    shared by several studies (e.g. when the number of samples is increased) are evaluated once.
+    The inputs set to their nominal value are left out of the case keys: a case in which an input
+    is not part of the DoE and a case in which it is set to its nominal value are the same case.
+    """
+
+    def __init__(self):
+        self._studies = {}  # {study key: dataframe}
+        self._cases = {}  # {configuration hash: {case key: {output name: value}}}
+
+    @staticmethod
+    def study_key(
+        configuration_hash: str,
+        method_name: str,
+        x_dict: dict,
+        y_list: List[str],
+        ns: int,
+        calc_second_order: bool,
+        seed: int = None,
+    ) -> tuple:
+        """
+        :param configuration_hash: hash of the configuration of the problem (see doe_fast)
+        :param method_name: DoE method name (see doe_fast)
+        :param x_dict: inputs dictionary (see doe_fast)
+        :param y_list: list of problem outputs to record
+        :param ns: number of samples or trajectories
+        :param calc_second_order: calculate second order indices (Sobol)
+        :param seed: seed of the random generation of the cases (see doe_fast)
+        :return: key of the study
+        """
+        x_key = tuple(
+            (x_name, tuple(np.ravel(np.asarray(x_value, dtype=object)).tolist()))
+            for x_name, x_value in x_dict.items()
+        )
+        return (
+            configuration_hash,
+            method_name,
+            x_key,
+            tuple(y_list),
+            int(ns),
+            bool(calc_second_order),
+            seed,
+        )
+
+    def get(self, key: tuple) -> pd.DataFrame:
+        """
+        :param key: key of the study
+        :return: copy of the results of the study, or None if the study is not in the cache
+        """
+        df = self._studies.get(key)
+        return None if df is None else df.copy()
+
+    def put(self, key: tuple, df: pd.DataFrame):
+        """
+        :param key: key of the study
+        :param df: results of the study
+        """
+        self._studies[key] = df.copy()
+
+    @staticmethod
+    def _case_key(x_columns: List[str], x_values, nominal_values: Dict[str, float]) -> tuple:
+        return tuple(
+            sorted(
+                (x_name, float(x_value))
+                for x_name, x_value in zip(x_columns, np.asarray(x_values, dtype=float).ravel())
+                if nominal_values.get(x_name) != x_value
+            )
+        )
+
+    def add_cases(
+        self,
+        configuration_hash: str,
+        x_columns: List[str],
+        y_columns: List[str],
+        rows,
+        nominal_values: Dict[str, float] = None,
+    ):
+        """
+        Save the results of several cases.
+
+        :param configuration_hash: hash of the configuration of the problem (see doe_fast)
+        :param x_columns: names of the inputs of the cases
+        :param y_columns: names of the recorded outputs of the cases
+        :param rows: array of values (inputs then outputs), with one row per case
+        :param nominal_values: nominal values of the inputs, by name
+        """
+        cases = self._cases.setdefault(configuration_hash, {})
+        n_x = len(x_columns)
+        for row in np.atleast_2d(rows):
+            outputs = cases.setdefault(
+                self._case_key(x_columns, row[:n_x], nominal_values or {}), {}
+            )
+            outputs.update(zip(y_columns, map(float, row[n_x:])))
+
+    def lookup_case(
+        self,
+        configuration_hash: str,
+        x_columns: List[str],
+        y_columns: List[str],
+        x_values,
+        nominal_values: Dict[str, float] = None,
+    ):
+        """
+        Retrieve the results of a case evaluated in a previous study.
+
+        :param configuration_hash: hash of the configuration of the problem (see doe_fast)
+        :param x_columns: names of the inputs of the case
+        :param y_columns: names of the outputs to retrieve
+        :param x_values: input values of the case
+        :param nominal_values: nominal values of the inputs, by name
+        :return: array of values (inputs then outputs) of the case, or None if the case has not
+                 been evaluated or if some outputs were not recorded
+        """
+        outputs = self._cases.get(configuration_hash, {}).get(
+            self._case_key(x_columns, x_values, nominal_values or {})
+        )
+        if outputs is None or not all(y in outputs for y in y_columns):
+            return None
+        return np.concatenate(
+            (np.asarray(x_values, dtype=float).ravel(), [outputs[y] for y in y_columns])
+        )
+
+    def clear(self):
+        """
+        Remove all the studies and cases from the cache.
+        """
+        self._studies.clear()
+        self._cases.clear()
+
+
+class DoECaseRecorder(CaseRecorder):
+    """
+    Recorder to be attached to a driver, that feeds a DoECaseCollector (and optionally a
+    DoECaseStore) each time a case completes.
+    """
+
+    def __init__(
+        self, collector: DoECaseCollector, problem: om.Problem, store: DoECaseStore = None
+    ):
+        """
+        :param collector: collector of the values of the cases
+        :param problem: problem from which the values are read
+        :param store: persistent store in which the values of the cases are saved (optional)
+        """
+        super().__init__(record_viewer_data=False)
+        self.collector = collector
+        self.store = store
+        self._problem = problem
+
+    def record_iteration_driver(self, recording_requester, data, metadata):
+        self.collector.collect(self._problem)
+        if self.store is not None:
+            self.store.add([self.collector.n_cases - 1], self.collector.values[-1:])
+
+    def record_iteration_system(self, recording_requester, data, metadata):
+        pass
+
+    def record_iteration_solver(self, recording_requester, data, metadata):
+        pass
+
+    def record_iteration_problem(self, recording_requester, data, metadata):
+        pass
+
+    def record_metadata_system(self, system, run_number=None):
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        pass
+
+    def shutdown(self):
+        self.collector.flush()
@@ -9,23 +9,29 @@ For the Sobol' SA, the uncertain inputs are generated using Saltelli's sampling.
 """
 
 import contextlib
+import hashlib
 import itertools
 import os
 import os.path as pth
-import tempfile
 import warnings
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List
 
 import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 import pandas as pd
-import plotly.graph_objects as go
-from SALib.analyze import morris, sobol
 from fastoad.io.variable_io import DataFile
-from ipywidgets import Layout, widgets
+from openmdao.core.analysis_error import AnalysisError
+from ruamel.yaml import YAML
 
 from fastuav.utils.drivers.salib_doe_driver import SalibDOEDriver
+from fastuav.utils.postprocessing.sensitivity_analysis.doe_cases import (
+    DoECaseCollector,
+    DoECaseRecorder,
+    DoECaseStore,
+    DoEResultsCache,
+)
 
 # from openmdao_drivers.cmaes_driver import CMAESDriver
 
@@ -39,6 +45,76 @@ SA_PATH = pth.join(
     "sensitivity_analysis",
 )
 
+# Results of the studies run by the interactive interfaces (sobol_analysis, morris_analysis)
+# during the session
+DOE_SESSION_CACHE = DoEResultsCache()
+
+
+class SubProbComp(om.ExplicitComponent):
+    """
+    Sub-problem component for nested optimization.
+    """
+
+    def initialize(self):
+        self.options.declare("conf")
+        self.options.declare("x_list")
+        self.options.declare("y_list")
+
+    def setup(self):
+        # create a sub-problem to use later in the compute
+        # sub_conf = oad.FASTOADProblemConfigurator(conf_file)
+        conf = self.options["conf"]
+        prob = conf.get_problem(
+            read_inputs=True
+        )  # get conf file (design variables, objective, driver...)
+
+        # UNCOMMENT THESE LINES IF USING CMA-ES Driver for solving sub-problem
+        # TODO: automatically detect use of CMA-ES driver
+        # driver = prob.driver = CMAESDriver()
+        # driver.CMAOptions['tolfunhist'] = 1e-4
+        # driver.CMAOptions['popsize'] = 100
+
+        # prob.driver.options['disp'] = False
+        p = self._prob = prob
+        p.setup()
+
+        # define the i/o of the component
+        x_list = self._x_list = self.options["x_list"]
+        y_list = self._y_list = self.options["y_list"]
+
+        for x in x_list:
+            self.add_input(x)
+
+        for y in y_list:
+            self.add_output(y)
+
+        # set counter and output variable for recording optimization failure or success
+        self._fail_count = 0
+        self.add_output("optim_failed")
+
+        self.declare_partials("*", "*", method="fd")
+
+    def compute(self, inputs, outputs):
+        p = self._prob
+        x_list = self._x_list
+        y_list = self._y_list
+
+        for x in x_list:
+            p[x] = inputs[x]
+
+        with (
+            open(os.devnull, "w") as f,
+            contextlib.redirect_stdout(f),
+        ):  # turn off all convergence messages (including failures)
+            fail = not p.run_driver().success
+
+        for y in y_list:
+            outputs[y] = p[y]
+
+        if fail:
+            self._fail_count += 1
+        outputs["optim_failed"] = float(fail)
+
 
 def doe_fast(
     method_name: str,
@@ -48,6 +124,10 @@ def doe_fast(
     ns: int = 100,
     custom_driver=None,
     calc_second_order: bool = True,
+    n_workers: int = 1,
+    resume: bool = False,
+    cache: DoEResultsCache = None,
+    seed: int = None,
 ) -> pd.DataFrame:
     """
     DoE function for FAST-UAV problems.
@@ -60,6 +140,23 @@ def doe_fast(
     If an optimization problem is declared in the configuration file,
     a nested optimization (sub-problem) is run (e.g. to ensure system optimality and/or consistency at each simulation).
 
+    With n_workers > 1, the cases are generated beforehand, split into chunks and evaluated
+    by a pool of worker processes, each of them holding its own copy of the problem.
+    The results are collected as cases complete, and appended by batches to a CSV file.
+    They are also saved in a persistent case store (doe_<method_name>_cases.db) as soon as
+    they are available. If resume is True, the cases already evaluated with the same inputs in a
+    previous (e.g. interrupted) run of the study are retrieved from this store instead of being
+    evaluated again. The cases drawn at random (uniform, lhs and Morris methods) are drawn again
+    with the seed of the previous run, unless another seed is provided. The store is emptied when
+    the configuration of the problem or the recorded outputs differ from those of the previous run.
+
+    If a session cache is provided, a study that has already been run with the same configuration
+    and settings is not run again: a copy of its results is returned. The cases of the study that
+    have already been evaluated in other studies of the session (e.g. with fewer samples) are
+    retrieved from the cache, and only the missing ones are evaluated. The configuration is
+    identified by the contents of the configuration file, of the input file and of the files
+    referenced in the model options (e.g. mission definition files, catalogues).
+
     :param method_name: 'uniform', 'lhs', 'fullfactorial', 'Sobol' or 'Morris'
     :param x_dict: inputs dictionary {input_name: [dist_parameter_1, dist_parameter_2, distribution_type]}
     :param y_list: list of problem outputs to record
@@ -67,6 +164,10 @@ def doe_fast(
     :param ns: number of samples (for Uniform, LHS and Sobol) or trajectories (for Morris)
     :param custom_driver: user-defined OpenMDAO driver if method_name is set to "custom"
     :param calc_second_order: calculate second order indices (Sobol)
+    :param n_workers: number of worker processes used to evaluate the cases
+    :param resume: retrieve the cases already evaluated in a previous run of the same study
+    :param cache: session cache of the results of the studies (optional)
+    :param seed: seed of the random generation of the cases (uniform, lhs and Morris methods)
 
     :return: dataframe of the design of experiments results
     """
@@ -74,74 +175,103 @@ def doe_fast(
     # Suppress all-NaN slice warnings (unknown origin, linked to n2_viewer internally called by openmdao?)
     warnings.filterwarnings("ignore", message="All-NaN slice encountered")
 
-    class SubProbComp(om.ExplicitComponent):
-        """
-        Sub-problem component for nested optimization.
-        """
-
-        def initialize(self):
-            self.options.declare("conf")
-            self.options.declare("x_list")
-            self.options.declare("y_list")
-
-        def setup(self):
-            # create a sub-problem to use later in the compute
-            # sub_conf = oad.FASTOADProblemConfigurator(conf_file)
-            conf = self.options["conf"]
-            prob = conf.get_problem(
-                read_inputs=True
-            )  # get conf file (design variables, objective, driver...)
+    x_list = [x_name for x_name in x_dict.keys()]
 
-            # UNCOMMENT THESE LINES IF USING CMA-ES Driver for solving sub-problem
-            # TODO: automatically detect use of CMA-ES driver
-            # driver = prob.driver = CMAESDriver()
-            # driver.CMAOptions['tolfunhist'] = 1e-4
-            # driver.CMAOptions['popsize'] = 100
+    conf = oad.FASTOADProblemConfigurator(conf_file)
+    configuration_hash = _configuration_hash(
+        conf_file, conf.input_file_path, *_referenced_files(conf_file)
+    )
 
-            # prob.driver.options['disp'] = False
-            p = self._prob = prob
-            p.setup()
+    # Retrieve the results of the same study from the session cache
+    if cache is not None:
+        nominal_values = _nominal_values(conf.input_file_path, x_list)
+        study_key = cache.study_key(
+            configuration_hash, method_name, x_dict, y_list, ns, calc_second_order, seed
+        )
+        df = cache.get(study_key)
+        if df is not None:
+            return df
 
-            # define the i/o of the component
-            x_list = self._x_list = self.options["x_list"]
-            y_list = self._y_list = self.options["y_list"]
+    prob, nested_optimization = _get_doe_problem(conf_file, x_list, y_list)
 
-            for x in x_list:
-                self.add_input(x)
+    # If SA_PATH does not exist, create it
+    if not pth.exists(SA_PATH):
+        os.makedirs(SA_PATH)
 
-            for y in y_list:
-                self.add_output(y)
+    # Create figures subdirectory if it doesn't exist
+    figures_path = pth.join(SA_PATH, "figures")
+    if not pth.exists(figures_path):
+        os.makedirs(figures_path)
 
-            # set counter and output variable for recording optimization failure or success
-            self._fail_count = 0
-            self.add_output("optim_failed")
+    # Collect results as cases complete (and save them to .csv for future use)
+    columns = x_list + y_list
+    if nested_optimization:
+        columns.append("optim_failed")
+    collector = DoECaseCollector(columns, csv_path=pth.join(SA_PATH, "doe_" + method_name + ".csv"))
+
+    # Save results in persistent store as cases complete (to resume interrupted studies)
+    store = DoECaseStore(
+        pth.join(SA_PATH, "doe_" + method_name + "_cases.db"),
+        x_list,
+        columns[len(x_list) :],
+        configuration_hash,
+    )
+    if not resume:
+        store.clear()
+
+    # Cases drawn at random are drawn again with the same seed when the study is resumed
+    if seed is None:
+        seed = store.seed if store.seed is not None else int(np.random.randint(2**31 - 1))
+    store.seed = seed
+    _set_doe_driver(prob, method_name, x_dict, ns, custom_driver, calc_second_order, seed)
+
+    # Cases already evaluated in other studies of the session (requires a case generator)
+    lookup_case = None
+    if cache is not None and "generator" in prob.driver.options:
+
+        def lookup_case(x_values):
+            return cache.lookup_case(
+                configuration_hash, x_list, columns[len(x_list) :], x_values, nominal_values
+            )
 
-            self.declare_partials("*", "*", method="fd")
+    try:
+        if n_workers > 1 or resume or lookup_case is not None:
+            _run_doe_cases(
+                prob, conf_file, x_list, y_list, collector, store, n_workers, lookup_case
+            )
+        else:
+            _run_doe_serial(prob, collector, store)
+    finally:
+        store.close()
+    df = collector.to_dataframe()
+
+    # Save the results in the session cache
+    if cache is not None:
+        cache.add_cases(
+            configuration_hash, x_list, columns[len(x_list) :], collector.values, nominal_values
+        )
+        cache.put(study_key, df)
 
-        def compute(self, inputs, outputs):
-            p = self._prob
-            x_list = self._x_list
-            y_list = self._y_list
+    # Print number of optimization failures
+    fail_count = int(np.nansum(df["optim_failed"])) if nested_optimization else 0
+    if fail_count > 0:
+        print("%d out of %d optimizations failed." % (fail_count, collector.n_cases))
 
-            for x in x_list:
-                p[x] = inputs[x]
+    return df
 
-            with (
-                open(os.devnull, "w") as f,
-                contextlib.redirect_stdout(f),
-            ):  # turn off all convergence messages (including failures)
-                fail = not p.run_driver().success
 
-            for y in y_list:
-                outputs[y] = p[y]
+def _get_doe_problem(conf_file: str, x_list: List[str], y_list: List[str]):
+    """
+    Build the problem on which the DoE is run.
 
-            if fail:
-                self._fail_count += 1
-            outputs["optim_failed"] = float(fail)
+    :param conf_file: configuration file for the problem
+    :param x_list: list of problem inputs of the DoE
+    :param y_list: list of problem outputs to record
 
+    :return: the problem, and a boolean that indicates if a nested optimization is run for each case
+    """
     conf = oad.FASTOADProblemConfigurator(conf_file)
     prob_definition = conf.get_optimization_definition()
-    x_list = [x_name for x_name in x_dict.keys()]
 
     # CASE 1: nested optimization is declared (i.e. optimization problem is defined in configuration file)
     if "objective" in prob_definition.keys():
@@ -162,6 +292,78 @@ def doe_fast(
         nested_optimization = False
         prob = conf.get_problem(read_inputs=True)
 
+    return prob, nested_optimization
+
+
+def _configuration_hash(*file_paths: str) -> str:
+    """
+    :param file_paths: configuration file of the problem, and other files it depends on
+    :return: hash of the contents of the files (files that do not exist are ignored)
+    """
+    digest = hashlib.sha1()
+    for file_path in file_paths:
+        if pth.isfile(file_path):
+            with open(file_path, "rb") as file:
+                digest.update(file.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _referenced_files(conf_file: str) -> List[str]:
+    """
+    :param conf_file: configuration file of the problem
+    :return: paths of the files referenced in the model options of the configuration (e.g. mission
+             definition files, catalogues), relative paths being resolved from the configuration
+             folder as done by FAST-OAD
+    """
+    with open(conf_file) as file:
+        conf_data = YAML(typ="safe").load(file)
+
+    def _option_values(structure):
+        for value in structure.values():
+            if isinstance(value, dict):
+                yield from _option_values(value)
+            elif isinstance(value, str):
+                yield value
+
+    file_paths = []
+    for value in _option_values((conf_data or {}).get("model") or {}):
+        file_path = pth.join(pth.dirname(pth.abspath(conf_file)), value)
+        if pth.isfile(file_path):
+            file_paths.append(pth.normpath(file_path))
+    return sorted(set(file_paths))
+
+
+def _nominal_values(input_file: str, x_list: List[str]) -> Dict[str, float]:
+    """
+    :param input_file: input file of the problem
+    :param x_list: list of problem inputs of the DoE
+    :return: values of the problem inputs of the DoE in the input file, by name
+    """
+    if not pth.isfile(input_file):
+        return {}
+    variables = DataFile(input_file)
+    names = variables.names()
+    return {
+        x_name: float(np.ravel(variables[names.index(x_name)].value)[0])
+        for x_name in x_list
+        if x_name in names
+    }
+
+
+def _set_doe_driver(
+    prob: om.Problem,
+    method_name: str,
+    x_dict: dict,
+    ns: int,
+    custom_driver=None,
+    calc_second_order: bool = True,
+    seed: int = None,
+):
+    """
+    Add the DoE inputs as design variables of the problem and set up the DoE driver.
+    See doe_fast for the description of the parameters.
+    """
     # Setup driver
     if method_name == "list":
         # add input parameters for DoE
@@ -180,9 +382,9 @@ def doe_fast(
             prob.model.add_design_var(x_name, lower=x_value[0], upper=x_value[1])
         # setup driver
         if method_name == "uniform":
-            prob.driver = om.DOEDriver(om.UniformGenerator(num_samples=ns))
+            prob.driver = om.DOEDriver(om.UniformGenerator(num_samples=ns, seed=seed))
         elif method_name == "lhs":
-            prob.driver = om.DOEDriver(om.LatinHypercubeGenerator(samples=ns))
+            prob.driver = om.DOEDriver(om.LatinHypercubeGenerator(samples=ns, seed=seed))
         elif method_name == "fullfactorial":
             prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=ns))
     elif method_name in ("Sobol", "Morris"):
@@ -206,7 +408,7 @@ def doe_fast(
             # setup driver
             prob.driver = SalibDOEDriver(
                 sa_method_name="Morris",
-                sa_doe_options={"n_trajs": ns},
+                sa_doe_options={"n_trajs": ns, "seed": seed},
                 distributions=dists,
             )
     elif method_name == "custom":
@@ -216,52 +418,166 @@ def doe_fast(
         # setup driver
         prob.driver = custom_driver
 
-    # Attach recorder to the driver (use a temp file to avoid CWD dependency)
-    cases_sql_fd, cases_sql_path = tempfile.mkstemp(suffix=".sql")
-    os.close(cases_sql_fd)
-    prob.driver.add_recorder(om.SqliteRecorder(cases_sql_path))
-    recorded_variables = [f"*{x}" for x in x_list + y_list]
-    if nested_optimization:
-        recorded_variables.append("optim_failed")
-    prob.driver.recording_options["includes"] = recorded_variables
+
+def _run_doe_serial(prob: om.Problem, collector: DoECaseCollector, store: DoECaseStore):
+    """
+    Run the DoE driver of the problem and collect the results of the cases.
+
+    :param prob: problem with DoE driver
+    :param collector: collector of the results of the cases
+    :param store: persistent store in which the results of the cases are saved
+    """
+    # Attach recorder to the driver: it feeds the collector each time a case completes
+    prob.driver.add_recorder(DoECaseRecorder(collector, prob, store))
+    prob.driver.recording_options["includes"] = []  # values are read from the problem
 
     # Run problem
     prob.setup()
     prob.run_driver()
     prob.cleanup()
 
-    # Get results from recorded cases
-    df = pd.DataFrame()
-    cr = om.CaseReader(cases_sql_path)
-    cases = cr.list_cases("driver", out_stream=None)
-    for case in cases:
-        values = cr.get_case(case).outputs
-        df = pd.concat([df, pd.DataFrame(values)], ignore_index=True)
-    os.remove(cases_sql_path)  # clean up temp file
 
-    # for i in df.columns:
-    #     df[i] = df[i].apply(lambda x: x[0])
+# Problem held by each worker process of the parallel DoE execution (see doe_fast "n_workers")
+_WORKER_PROBLEM = None
 
-    # Print number of optimization failures
-    fail_count = (
-        prob.model.sub_prob._fail_count if nested_optimization else 0
-    )  # count number of failures for nested optimization
-    if fail_count > 0:
-        print("%d out of %d optimizations failed." % (fail_count, len(cases)))
+# Maximum number of cases in a chunk evaluated by a worker process (results are saved by chunks)
+DOE_CHUNK_SIZE = 20
 
-    # If SA_PATH does not exist, create it
-    if not pth.exists(SA_PATH):
-        os.makedirs(SA_PATH)
 
-    # Create figures subdirectory if it doesn't exist
-    figures_path = pth.join(SA_PATH, "figures")
-    if not pth.exists(figures_path):
-        os.makedirs(figures_path)
+def _run_doe_cases(
+    prob: om.Problem,
+    conf_file: str,
+    x_list: List[str],
+    y_list: List[str],
+    collector: DoECaseCollector,
+    store: DoECaseStore,
+    n_workers: int,
+    lookup_case: Callable = None,
+):
+    """
+    Generate the cases of the DoE driver of the problem, retrieve those already saved in the case
+    store (or evaluated in other studies) and evaluate the other ones, either in the current process
+    or by chunks on a pool of worker processes. Each worker builds its own copy of the problem from
+    the configuration file.
 
-    # Save to .csv for future use
-    df.to_csv(pth.join(SA_PATH, "doe_" + method_name + ".csv"))
+    :param prob: problem with DoE driver
+    :param conf_file: configuration file for the problem
+    :param x_list: list of problem inputs of the DoE
+    :param y_list: list of problem outputs to record
+    :param collector: collector of the results of the cases
+    :param store: persistent store in which the results of the cases are saved
+    :param n_workers: number of worker processes
+    :param lookup_case: function that returns the values (inputs then outputs) of a case evaluated
+                        in another study from its input values, or None (optional)
+    """
+    driver = prob.driver
+    if "generator" not in driver.options:
+        raise ValueError(
+            "Parallel or resumed DoE execution requires a DOEDriver with a case generator."
+        )
 
-    return df
+    # Generate the cases (generators need the design variables metadata from the setup)
+    prob.setup()
+    prob.final_setup()
+    cases = list(driver.options["generator"](prob.model.get_design_vars(), prob.model))
+    n_cases = len(cases)
+
+    # Retrieve the cases evaluated in a previous run, or in another study
+    values = np.full((n_cases, len(collector.columns)), np.nan)
+    done = np.zeros(n_cases, dtype=bool)
+    looked_up = []  # cases evaluated in another study, to be saved in the case store
+    for i, case in enumerate(cases):
+        case_dict = dict(case)
+        x_values = [case_dict[x] for x in x_list]
+        row = store.lookup(i, x_values)
+        if row is None and lookup_case is not None:
+            row = lookup_case(x_values)
+            if row is not None:
+                looked_up.append(i)
+        if row is not None:
+            values[i] = row
+            done[i] = True
+    pending = np.flatnonzero(~done)
+    if pending.size < n_cases:
+        print(
+            "%d out of %d cases retrieved from previous runs." % (n_cases - pending.size, n_cases)
+        )
+
+    def _add_results(indices, chunk_values):
+        # Save results, then collect all the cases completed so far (in the order of the DoE)
+        store.add(indices, chunk_values)
+        values[indices] = chunk_values
+        done[indices] = True
+        start = end = collector.n_cases
+        while end < n_cases and done[end]:
+            end += 1
+        collector.add_rows(values[start:end])
+
+    _add_results(looked_up, values[looked_up])  # collect first retrieved cases
+
+    if n_workers > 1 and pending.size > 0:
+        # Several chunks per worker to balance the load (nested optimizations have uneven durations)
+        n_chunks = max(min(pending.size, 4 * n_workers), -(-pending.size // DOE_CHUNK_SIZE))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_doe_worker,
+            initargs=(conf_file, x_list, y_list),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_doe_chunk, [cases[i] for i in chunk_idx], collector.columns
+                ): chunk_idx
+                for chunk_idx in np.array_split(pending, n_chunks)
+            }
+            for future in as_completed(futures):
+                _add_results(futures[future], future.result())
+    else:
+        for i in pending:
+            _add_results([i], _evaluate_doe_cases(prob, [cases[i]], collector.columns))
+
+    prob.cleanup()
+
+
+def _init_doe_worker(conf_file: str, x_list: List[str], y_list: List[str]):
+    """
+    Initialize a worker process of the parallel DoE execution with its own copy of the problem.
+    """
+    global _WORKER_PROBLEM
+
+    prob, _ = _get_doe_problem(conf_file, x_list, y_list)
+    prob.setup()
+    prob.final_setup()
+    _WORKER_PROBLEM = prob
+
+
+def _run_doe_chunk(cases: list, columns: List[str]):
+    """
+    Evaluate a chunk of DoE cases on the problem of the worker process.
+    """
+    return _evaluate_doe_cases(_WORKER_PROBLEM, cases, columns)
+
+
+def _evaluate_doe_cases(prob: om.Problem, cases: list, columns: List[str]):
+    """
+    Evaluate DoE cases on a problem.
+
+    :param prob: problem on which the cases are evaluated
+    :param cases: list of cases, each case being a list of (name, value) tuples
+    :param columns: list of the variables to collect
+
+    :return: array of the collected values, with one row per case
+    """
+    collector = DoECaseCollector(columns, n_cases=len(cases))
+    for case in cases:
+        for name, val in case:
+            prob.set_val(name, val)
+        try:
+            prob.run_model()
+        except AnalysisError:
+            pass  # failed case, values are collected anyway (same as DOEDriver)
+        collector.collect(prob)
+
+    return collector.values
 
 
 def sobol_analysis(conf_file, data_file):
@@ -272,6 +588,11 @@ def sobol_analysis(conf_file, data_file):
     :param conf_file: configuration file of the problem
     :param data_file: output file of the initial design problem, to set up initial values.
     """
+    # plotting and analysis libraries are only needed by the interactive interface,
+    # not by the DoE workers which import this module
+    import plotly.graph_objects as go
+    from SALib.analyze import sobol
+    from ipywidgets import Layout, widgets
 
     # DATA #
     # Get variables data from file
@@ -778,7 +1099,15 @@ def sobol_analysis(conf_file, data_file):
         # Monte Carlo with Saltelli's sampling
         ns = int(samples.value)  # number of samples to generate
         second_order = second_order_box.value  # boolean for second order Sobol' indices calculation
-        df = doe_fast("Sobol", x_dict, y_list, conf_file, ns, second_order)
+        df = doe_fast(
+            "Sobol",
+            x_dict,
+            y_list,
+            conf_file,
+            ns,
+            calc_second_order=second_order,
+            cache=DOE_SESSION_CACHE,
+        )  # cases already evaluated in the session are not run again
 
         # Perform Sobol' analysis and update charts
         outputbox.observe(update_sobol, names="value")  # enable to change the output to visualize
@@ -825,6 +1154,11 @@ def morris_analysis(conf_file, data_file):
     :param conf_file: configuration file of the problem
     :param data_file: output file of the initial design problem, to set up initial values.
     """
+    # plotting and analysis libraries are only needed by the interactive interface,
+    # not by the DoE workers which import this module
+    import plotly.graph_objects as go
+    from SALib.analyze import morris
+    from ipywidgets import Layout, widgets
 
     # Get variables data from file
     variables = DataFile(data_file)
@@ -1273,7 +1607,9 @@ def morris_analysis(conf_file, data_file):
 
         # Run DoEs
         nt = int(samples.value)  # number of trajectories for morris method
-        df = doe_fast("Morris", x_dict, y_list, conf_file, nt)
+        df = doe_fast(
+            "Morris", x_dict, y_list, conf_file, nt, cache=DOE_SESSION_CACHE
+        )  # cases already evaluated in the session are not run again
 
         # Perform method of Morris on results and update charts
         outputbox.observe(update_morris, names="value")  # enable to change the output to visualize
@@ -0,0 +1,217 @@
+"""
+Tests of the execution modes of the design of experiments.
+"""
+
+import os.path as pth
+
+import fastoad.api as oad
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from fastuav.utils.postprocessing.sensitivity_analysis import sensitivity_analysis
+from fastuav.utils.postprocessing.sensitivity_analysis.doe_cases import (
+    DoECaseCollector,
+    DoECaseStore,
+    DoEResultsCache,
+)
+from fastuav.utils.postprocessing.sensitivity_analysis.sensitivity_analysis import doe_fast
+
+DATA_FOLDER_PATH = pth.join(
+    pth.dirname(pth.abspath(__file__)), "..", "..", "..", "..", "notebooks", "data"
+)
+
+X_DICT = {
+    "mission:operational:main_route:payload:mass": [0.5, 4.0, "unif"],
+    "mission:operational:main_route:cruise:speed": [10.0, 20.0, "unif"],
+}
+Y_LIST = ["mission:operational:main_route:energy"]
+
+
+@pytest.fixture(scope="module")
+def conf_file(tmp_path_factory):
+    """
+    Configuration of the multirotor mission model of the DoE tutorial, with its own input file.
+    """
+    workdir = tmp_path_factory.mktemp("doe")
+    with open(pth.join(DATA_FOLDER_PATH, "configurations", "doe_simple_model.yaml")) as file:
+        conf = yaml.safe_load(file)
+    conf["input_file"] = str(workdir / "problem_inputs.xml")
+    conf["output_file"] = str(workdir / "problem_outputs.xml")
+    conf["model"]["missions"]["file_path"] = pth.abspath(
+        pth.join(DATA_FOLDER_PATH, "missions", "missions_multirotor_doe.yaml")
+    )
+    conf_path = str(workdir / "doe_simple_model.yaml")
+    with open(conf_path, "w") as file:
+        yaml.safe_dump(conf, file)
+    oad.generate_inputs(
+        conf_path,
+        pth.join(DATA_FOLDER_PATH, "source_files", "problem_inputs_doe.xml"),
+        overwrite=True,
+    )
+    return conf_path
+
+
+@pytest.fixture(autouse=True)
+def sa_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(sensitivity_analysis, "SA_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize("method_name, ns", [("Sobol", 4), ("Morris", 3)])
+def test_doe_parallel(conf_file, method_name, ns):
+    df_serial = doe_fast(method_name, X_DICT, Y_LIST, conf_file, ns, seed=1)
+    df_parallel = doe_fast(method_name, X_DICT, Y_LIST, conf_file, ns, n_workers=2, seed=1)
+
+    # each case is evaluated with its own inputs, and results are collected in the DoE order
+    assert len(df_serial.drop_duplicates()) > 1
+    pd.testing.assert_frame_equal(df_parallel, df_serial)
+
+
+class _Interruption(Exception):
+    pass
+
+
+def _interrupt_after(monkeypatch, n_cases: int):
+    """
+    Interrupt the studies run afterwards when n_cases cases have been collected.
+    """
+    collect = DoECaseCollector.collect
+
+    def _collect(self, problem):
+        if self.n_cases == n_cases:
+            raise _Interruption()
+        collect(self, problem)
+
+    monkeypatch.setattr(DoECaseCollector, "collect", _collect)
+
+
+def _count_evaluations(monkeypatch) -> list:
+    """
+    :return: list to which the number of cases is added each time cases are evaluated
+    """
+    evaluate_doe_cases = sensitivity_analysis._evaluate_doe_cases
+    counts = []
+
+    def _evaluate(prob, cases, columns):
+        counts.append(len(cases))
+        return evaluate_doe_cases(prob, cases, columns)
+
+    monkeypatch.setattr(sensitivity_analysis, "_evaluate_doe_cases", _evaluate)
+    return counts
+
+
+@pytest.mark.parametrize("method_name, ns, n_cases", [("Sobol", 4, 10), ("Morris", 4, 5)])
+def test_doe_resume(conf_file, sa_path, monkeypatch, method_name, ns, n_cases):
+    with monkeypatch.context() as m:
+        _interrupt_after(m, n_cases)
+        with pytest.raises(_Interruption):
+            doe_fast(method_name, X_DICT, Y_LIST, conf_file, ns)
+
+    counts = _count_evaluations(monkeypatch)
+    df = doe_fast(method_name, X_DICT, Y_LIST, conf_file, ns, resume=True)
+    assert sum(counts) == len(df) - n_cases  # only the cases that were not completed are evaluated
+    csv = pd.read_csv(sa_path / ("doe_%s.csv" % method_name), index_col=0)
+
+    # the resumed study is the one that was interrupted (Morris trajectories are drawn again)
+    configuration_hash = sensitivity_analysis._configuration_hash(
+        conf_file,
+        oad.FASTOADProblemConfigurator(conf_file).input_file_path,
+        *sensitivity_analysis._referenced_files(conf_file),
+    )
+    store = DoECaseStore(
+        sa_path / ("doe_%s_cases.db" % method_name), list(X_DICT), Y_LIST, configuration_hash
+    )
+    seed = store.seed
+    store.close()
+    df_ref = doe_fast(method_name, X_DICT, Y_LIST, conf_file, ns, seed=seed)
+    pd.testing.assert_frame_equal(df, df_ref)
+    csv_ref = pd.read_csv(sa_path / ("doe_%s.csv" % method_name), index_col=0)
+    pd.testing.assert_frame_equal(csv, csv_ref)
+
+
+def test_doe_resume_other_study(conf_file, tmp_path, monkeypatch):
+    with monkeypatch.context() as m:
+        _interrupt_after(m, 10)
+        with pytest.raises(_Interruption):
+            doe_fast("Sobol", X_DICT, Y_LIST, conf_file, 4)
+
+    # other input file: the cases of the interrupted study are evaluated again
+    with open(conf_file) as file:
+        conf = yaml.safe_load(file)
+    conf["input_file"] = str(tmp_path / "problem_inputs.xml")
+    other_conf_file = str(tmp_path / "doe_simple_model.yaml")
+    with open(other_conf_file, "w") as file:
+        yaml.safe_dump(conf, file)
+    inputs = oad.DataFile(oad.FASTOADProblemConfigurator(conf_file).input_file_path)
+    for variable in inputs:
+        if variable.name == "mission:operational:main_route:cruise:distance":
+            variable.value = [20000.0]
+    inputs.save_as(conf["input_file"])
+
+    counts = _count_evaluations(monkeypatch)
+    df = doe_fast("Sobol", X_DICT, Y_LIST, other_conf_file, 4, resume=True)
+    assert sum(counts) == len(df)
+    pd.testing.assert_frame_equal(df, doe_fast("Sobol", X_DICT, Y_LIST, other_conf_file, 4))
+
+    # other outputs: all the cases are evaluated again
+    counts.clear()
+    y_list = Y_LIST + ["mission:operational:main_route:cruise:energy"]
+    df = doe_fast("Sobol", X_DICT, y_list, other_conf_file, 4, resume=True)
+    assert sum(counts) == len(df)
+
+    # same study
+    counts.clear()
+    doe_fast("Sobol", X_DICT, y_list, other_conf_file, 4, resume=True)
+    assert sum(counts) == 0
+
+
+def test_doe_case_collector(tmp_path):
+    columns = ["x", "y"]
+    rows = np.arange(46.0).reshape(23, 2)
+
+    # if the study stops after 11 cases, the complete batches have already been written
+    collector = DoECaseCollector(columns, n_cases=4, csv_path=tmp_path / "doe.csv", batch_size=5)
+    for row in rows[:11]:
+        collector.add_rows(row)
+    np.testing.assert_array_equal(pd.read_csv(tmp_path / "doe.csv", index_col=0), rows[:10])
+
+    # remaining cases, added by chunks beyond the preallocated size
+    collector.add_rows(rows[11:17])
+    collector.add_rows(rows[17:])
+    df_ref = pd.DataFrame(rows, columns=columns)
+    pd.testing.assert_frame_equal(collector.to_dataframe(), df_ref)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "doe.csv", index_col=0), df_ref)
+
+
+def test_doe_results_cache(conf_file, monkeypatch):
+    cache = DoEResultsCache()
+    counts = _count_evaluations(monkeypatch)
+    df_ref = doe_fast("Sobol", X_DICT, Y_LIST, conf_file, 4, cache=cache)
+    assert sum(counts) == len(df_ref)
+
+    # same study: results are retrieved from the cache
+    counts.clear()
+    df = doe_fast("Sobol", X_DICT, Y_LIST, conf_file, 4, cache=cache)
+    assert sum(counts) == 0
+    pd.testing.assert_frame_equal(df, df_ref)
+
+    # more samples: only the new cases are evaluated
+    counts.clear()
+    df = doe_fast("Sobol", X_DICT, Y_LIST, conf_file, 8, cache=cache)
+    assert 0 < sum(counts) < len(df)
+    pd.testing.assert_frame_equal(df, doe_fast("Sobol", X_DICT, Y_LIST, conf_file, 8))
+
+    # another output: all cases are evaluated again
+    counts.clear()
+    y_list = Y_LIST + ["mission:operational:main_route:cruise:energy"]
+    df = doe_fast("Sobol", X_DICT, y_list, conf_file, 4, cache=cache)
+    assert sum(counts) == len(df)
+    assert list(df.columns) == list(X_DICT) + y_list
+
+
+def test_referenced_files(conf_file):
+    assert sensitivity_analysis._referenced_files(conf_file) == [
+        pth.normpath(pth.join(DATA_FOLDER_PATH, "missions", "missions_multirotor_doe.yaml"))
+    ]
@@ -0,0 +1,77 @@
+"""
+Setup-time benchmark of the FAST-UAV configurations.
+
+The setup of the multirotor, fixed-wing and hybrid problems is timed (best of several runs),
+together with the time spent in the configure-time renaming of the variables
+(see utils.configurations_versatility.promote_and_rename).
+
+usage:
+    python -m fastuav.utils.setup_time [--repeat 3] [multirotor_mdo fixedwing_mdo hybrid_mdo]
+"""
+
+import argparse
+import cProfile
+import os.path as pth
+import pstats
+import time
+from typing import Dict, List
+
+CONFIGURATIONS_FOLDER = pth.join(pth.dirname(pth.abspath(__file__)), "..", "configurations")
+CONFIGURATIONS = ["multirotor_mdo", "fixedwing_mdo", "hybrid_mdo"]
+
+
+def setup_time(configuration: str, repeat: int = 3) -> Dict[str, float]:
+    """
+    :param configuration: name of the configuration file (without extension), or path to it
+    :param repeat: number of setups
+    :return: dict of the best setup time [s] and of the time spent in promote_and_rename [s]
+    """
+    import fastoad.api as oad
+
+    from fastuav.utils.configurations_versatility import _rename_map
+
+    conf_file = (
+        configuration
+        if pth.isfile(configuration)
+        else pth.join(CONFIGURATIONS_FOLDER, configuration + ".yaml")
+    )
+    configurator = oad.FASTOADProblemConfigurator(conf_file)
+
+    setup_times = []
+    for _ in range(repeat):
+        problem = configurator.get_problem()
+        start = time.perf_counter()
+        problem.setup()
+        setup_times.append(time.perf_counter() - start)
+
+    # time spent in promote_and_rename, from a profiled setup with new names not cached yet
+    problem = configurator.get_problem()
+    _rename_map.cache_clear()
+    profile = cProfile.Profile()
+    profile.runcall(problem.setup)
+    stats = pstats.Stats(profile).stats
+    rename_time = sum(
+        cumulative_time
+        for (_, _, function_name), (*_, cumulative_time, _) in stats.items()
+        if function_name == "promote_and_rename"
+    )
+    return {"setup": min(setup_times), "promote_and_rename": rename_time}
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Setup time of the FAST-UAV configurations.")
+    parser.add_argument("configurations", nargs="*", default=CONFIGURATIONS)
+    parser.add_argument("--repeat", type=int, default=3, help="number of setups")
+    args = parser.parse_args(argv)
+
+    print("%-20s %10s %22s" % ("configuration", "setup [s]", "promote_and_rename [s]"))
+    for configuration in args.configurations:
+        times = setup_time(configuration, args.repeat)
+        print(
+            "%-20s %10.3f %22.3f"
+            % (pth.basename(configuration), times["setup"], times["promote_and_rename"])
+        )
+
+
+if __name__ == "__main__":
+    main()
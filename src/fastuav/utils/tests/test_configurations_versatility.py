@@ -0,0 +1,64 @@
+"""
+Tests of the configure-time renaming of the variables.
+"""
+
+import numpy as np
+import openmdao.api as om
+
+from fastuav.utils.configurations_versatility import promote_and_rename
+from fastuav.utils.setup_time import setup_time
+
+
+class _Component(om.ExplicitComponent):
+    def setup(self):
+        self.add_input("data:propulsion:propeller:diameter", val=np.nan, units="m")
+        self.add_input("mission:sizing:main_route:cruise:speed", val=np.nan, units="m/s")
+        self.add_input("mission:sizing:main_route:cruise:altitude", val=np.nan, units="m")
+        self.add_output("data:weight:propulsion:propeller:mass", units="kg")
+
+
+class _Group(om.Group):
+    def setup(self):
+        for propulsion_id in ["multirotor", "fixedwing"]:
+            subsys = self.add_subsystem(propulsion_id, om.Group())
+            subsys.add_subsystem("component", _Component(), promotes=["*"])
+
+    def configure(self):
+        for propulsion_id in ["multirotor", "fixedwing"]:
+            promote_and_rename(
+                group=self,
+                subsys=getattr(self, propulsion_id),
+                old_patterns_list=[":propulsion", "mission:sizing:main_route:cruise:speed"],
+                new_patterns_list=[
+                    ":propulsion:%s" % propulsion_id,
+                    "mission:sizing:main_route:cruise:speed:%s" % propulsion_id,
+                ],
+            )
+
+
+def test_promote_and_rename():
+    problem = om.Problem(_Group(), reports=False)
+    problem.setup()
+    names = {
+        name: meta["prom_name"]
+        for name, meta in problem.model.get_io_metadata(metadata_keys=()).items()
+    }
+    for propulsion_id in ["multirotor", "fixedwing"]:
+        prefix = "%s.component." % propulsion_id
+        assert names[prefix + "data:propulsion:propeller:diameter"] == (
+            "data:propulsion:%s:propeller:diameter" % propulsion_id
+        )
+        assert names[prefix + "mission:sizing:main_route:cruise:speed"] == (
+            "mission:sizing:main_route:cruise:speed:%s" % propulsion_id
+        )
+        assert names[prefix + "data:weight:propulsion:propeller:mass"] == (
+            "data:weight:propulsion:%s:propeller:mass" % propulsion_id
+        )
+        assert names[prefix + "mission:sizing:main_route:cruise:altitude"] == (
+            "mission:sizing:main_route:cruise:altitude"
+        )
+
+
+def test_setup_time():
+    times = setup_time("hybrid_mdo", repeat=1)
+    assert 0.0 < times["promote_and_rename"] < times["setup"]
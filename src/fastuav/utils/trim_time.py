@@ -0,0 +1,93 @@
+"""
+Benchmark of the multirotor trim (angle of attack) solver.
+
+The bracketed root solver of MultirotorFlightModel.get_angle_of_attack is timed (best of several
+runs) against its former implementation, that minimized the squared equilibrium residual with
+SLSQP, on a sweep of level flight speeds of a DJI M600-like multirotor.
+
+usage:
+    python -m fastuav.utils.trim_time [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Callable, Dict, List
+
+import numpy as np
+from scipy.constants import g
+from scipy.optimize import minimize
+
+from fastuav.models.scenarios.thrust.flight_models import MultirotorFlightModel
+
+# DJI M600-like multirotor
+MTOW = 12.0  # [kg]
+S_FRONT = 0.2  # [m2]
+S_TOP = 0.4  # [m2]
+CD0 = 1.2  # [-]
+RHO_AIR = 1.2  # [kg/m3]
+
+SPEEDS = np.linspace(1.0, 20.0, 40)  # [m/s] level flight
+
+
+def angle_of_attack_slsqp(m_uav, V, RoC, S_front, S_top, C_D, C_L0, rho_air):
+    """Former implementation of MultirotorFlightModel.get_angle_of_attack."""
+    if V != 0.0 and V > RoC:
+        theta = np.arcsin(RoC / V)
+    else:
+        return np.pi / 2
+
+    def func(x):
+        drag = MultirotorFlightModel.get_drag(V, x, S_front, S_top, C_D, rho_air)
+        lift = MultirotorFlightModel.get_lift(V, x, S_top, C_L0, rho_air)
+        weight = m_uav * g
+        res = np.tan(abs(x - theta)) - (drag * np.cos(theta) + lift * np.sin(theta)) / (
+            weight + drag * np.sin(theta) - lift * np.cos(theta)
+        )
+        return res**2
+
+    res = minimize(func, (np.pi / 4), bounds=((0.0, np.pi / 2),), method="SLSQP")
+    return res.x[0] if res.success else np.pi / 2
+
+
+def angles_of_attack(speeds, get_angle_of_attack: Callable) -> np.ndarray:
+    """
+    :param speeds: level flight speeds [m/s]
+    :param get_angle_of_attack: trim solver, with the signature of
+                                MultirotorFlightModel.get_angle_of_attack
+    :return: angles of attack of the DJI M600-like multirotor [rad]
+    """
+    return np.array(
+        [get_angle_of_attack(MTOW, V, 0.0, S_FRONT, S_TOP, CD0, 0.0, RHO_AIR) for V in speeds]
+    )
+
+
+def trim_time(repeat: int = 5) -> Dict[str, float]:
+    """
+    :param repeat: number of runs of each solver on the sweep of speeds
+    :return: dict of the best time [s] of each solver on the sweep of speeds
+    """
+    solvers = {
+        "SLSQP": angle_of_attack_slsqp,
+        "bracketed solver": MultirotorFlightModel.get_angle_of_attack,
+    }
+    return {
+        name: min(
+            timeit.repeat(
+                lambda: angles_of_attack(SPEEDS, get_angle_of_attack), number=1, repeat=repeat
+            )
+        )
+        for name, get_angle_of_attack in solvers.items()
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Time of the multirotor trim solvers.")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs of each solver")
+    args = parser.parse_args(argv)
+
+    for name, duration in trim_time(args.repeat).items():
+        print("%s: %.2f ms" % (name, 1e3 * duration))
+
+
+if __name__ == "__main__":
+    main()